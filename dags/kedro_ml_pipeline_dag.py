@@ -7,6 +7,10 @@ import os
 # Asegúrate de que esta ruta sea la correcta en tu entorno
 KEDRO_PROJECT_PATH = "/opt/airflow/kedro_project"
 
+# Regresión y clasificación corren a la vez: cada una recibe la mitad del presupuesto de
+# CPU (ver utils/recursos.py) para no sobresuscribir la máquina.
+ENV_ENTRENAMIENTO = {"ML_ENTRENAMIENTOS_CONCURRENTES": "2"}
+
 with DAG(
     dag_id="kedro_ml_pipeline",
     start_date=datetime(2023, 1, 1),
@@ -26,6 +30,8 @@ with DAG(
     run_regression = BashOperator(
         task_id="run_regression_pipeline",
         bash_command=f"cd {KEDRO_PROJECT_PATH} && kedro run --pipeline=regresion",
+        env=ENV_ENTRENAMIENTO,
+        append_env=True,
         dag=dag,
     )
 
@@ -33,6 +39,8 @@ with DAG(
     run_classification = BashOperator(
         task_id="run_classification_pipeline",
         bash_command=f"cd {KEDRO_PROJECT_PATH} && kedro run --pipeline=clasificacion",
+        env=ENV_ENTRENAMIENTO,
+        append_env=True,
         dag=dag,
     )
 
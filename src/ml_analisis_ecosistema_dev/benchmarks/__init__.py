@@ -0,0 +1 @@
+"""Benchmarks reproducibles de los pipelines del proyecto."""
@@ -0,0 +1,147 @@
+"""
+Mide el arranque en frío del servicio de predicción (o de un job de scoring): un proceso
+nuevo que importa ``servicio.app``, carga el preprocesador y los dos modelos y puntúa su
+primer lote con ``ServicioPrediccion.predecir_lote``. Se compara con los pickles completos
+(``ImbPipeline`` con SMOTE, ``ParadaTemprana``...) frente a los artefactos nativos de
+``utils/modelos_nativos.py`` que carga ``cargar_artefactos``.
+
+Los artefactos nativos se generan a partir de los pickles en un directorio temporal, de
+modo que ambos formatos contienen los mismos modelos. Cada repetición es un intérprete
+nuevo: el tiempo incluye las importaciones que arrastra cada formato, también las del
+preprocesador (que deserializa escaladores de sklearn en ambos casos).
+
+Uso (desde la raíz del proyecto, con los ``.pkl`` de ``data/06_models``)::
+
+    python -m ml_analisis_ecosistema_dev.benchmarks.arranque_en_frio --repeticiones 5
+"""
+
+import argparse
+import json
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+MODULO = "ml_analisis_ecosistema_dev.benchmarks.arranque_en_frio"
+PREPROCESADOR = "preprocesador_allowlist"
+MODELOS = ("regresion_model", "clasificacion_model")
+FORMATOS = ("pickle", "nativo")
+
+
+def _medir_en_este_proceso(formato: str, directorio: Path, filas: int) -> Dict[str, Any]:
+    """Carga los artefactos del servicio en el formato indicado y puntúa ``filas`` encuestados."""
+    inicio = time.perf_counter()
+    from ml_analisis_ecosistema_dev.servicio.app import ServicioPrediccion, cargar_artefactos
+
+    if formato == "pickle":
+        import pickle
+
+        artefactos = {}
+        for nombre in (PREPROCESADOR, *MODELOS):
+            with open(directorio / f"{nombre}.pkl", "rb") as fichero:
+                artefactos[nombre] = pickle.load(fichero)
+    else:
+        artefactos = cargar_artefactos(str(directorio))
+    carga = time.perf_counter() - inicio
+
+    servicio = ServicioPrediccion(artefactos)
+    lote = encuestados(artefactos[PREPROCESADOR], filas)
+    inicio_prediccion = time.perf_counter()
+    servicio.predecir_lote(lote)
+    prediccion = time.perf_counter() - inicio_prediccion
+    return {
+        "carga_s": carga,
+        "primera_prediccion_s": prediccion,
+        "modulos_cargados": len(sys.modules),
+        "sklearn_importado": "sklearn" in sys.modules,
+    }
+
+
+def encuestados(preprocesador: Any, filas: int) -> List[Dict[str, Any]]:
+    """``filas`` encuestados sintéticos con las columnas que espera ``preprocesador``."""
+    fila: Dict[str, Any] = {columna: 0.0 for columna in preprocesador.numeric_cols_}
+    for vocabularios in (preprocesador.vocabulario_multi_, preprocesador.vocabulario_categorico_):
+        fila.update({columna: valores[0] for columna, valores in vocabularios.items() if len(valores)})
+    return [dict(fila) for _ in range(filas)]
+
+
+def preparar_nativos(directorio_pickles: Path, destino: Path) -> None:
+    """Convierte los pickles de ``directorio_pickles`` en artefactos nativos en ``destino``,
+    junto a una copia del preprocesador."""
+    import pickle
+
+    from ml_analisis_ecosistema_dev.utils.modelos_nativos import guardar_modelo_nativo
+
+    for nombre in MODELOS:
+        with open(directorio_pickles / f"{nombre}.pkl", "rb") as fichero:
+            guardar_modelo_nativo(pickle.load(fichero), destino / nombre)
+    shutil.copy(directorio_pickles / f"{PREPROCESADOR}.pkl", destino / f"{PREPROCESADOR}.pkl")
+
+
+def arranque(formato: str, directorio: Path, filas: int) -> Dict[str, Any]:
+    """Lanza un intérprete nuevo que mide ``formato`` y devuelve sus tiempos y el total de pared."""
+    inicio = time.perf_counter()
+    resultado = subprocess.run(
+        [sys.executable, "-m", MODULO, "--medir", formato, "--directorio", str(directorio), "--filas", str(filas)],
+        capture_output=True,
+        text=True,
+    )
+    if resultado.returncode != 0:
+        raise RuntimeError(f"La medición de '{formato}' falló:\n{resultado.stderr[-2000:]}")
+    medicion = json.loads(resultado.stdout.strip().splitlines()[-1])
+    medicion["total_s"] = time.perf_counter() - inicio
+    return medicion
+
+
+def medir(directorio_pickles: Path, repeticiones: int, filas: int) -> Dict[str, Any]:
+    resultados: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as temporal:
+        preparar_nativos(directorio_pickles, Path(temporal))
+        directorios = {"pickle": directorio_pickles, "nativo": Path(temporal)}
+        for formato in FORMATOS:
+            mediciones = [arranque(formato, directorios[formato], filas) for _ in range(repeticiones)]
+            resultados[formato] = {
+                clave: statistics.median(medicion[clave] for medicion in mediciones)
+                for clave in ("carga_s", "primera_prediccion_s", "total_s", "modulos_cargados")
+            }
+            resultados[formato]["sklearn_importado"] = any(medicion["sklearn_importado"] for medicion in mediciones)
+            resultados[formato]["bytes_en_disco"] = sum(
+                fichero.stat().st_size
+                for nombre in MODELOS
+                for fichero in (
+                    [directorios[formato] / f"{nombre}.pkl"]
+                    if formato == "pickle"
+                    else (directorios[formato] / nombre).iterdir()
+                )
+            )
+    resultados["aceleracion_total"] = resultados["pickle"]["total_s"] / resultados["nativo"]["total_s"]
+    return resultados
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--directorio", default="data/06_models", help="Directorio con los .pkl de los modelos y del preprocesador."
+    )
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--filas", type=int, default=64)
+    parser.add_argument("--salida", default="data/08_reporting/benchmark_arranque_en_frio.json")
+    parser.add_argument("--medir", choices=FORMATOS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.medir:
+        print(json.dumps(_medir_en_este_proceso(args.medir, Path(args.directorio), args.filas)))
+        return
+
+    resultados = medir(Path(args.directorio), args.repeticiones, args.filas)
+    Path(args.salida).parent.mkdir(parents=True, exist_ok=True)
+    Path(args.salida).write_text(json.dumps(resultados, indent=2))
+    print(json.dumps(resultados, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Compara tres formas de limpiar los nulos de varias fuentes:
+
+- ``referencia``: el nodo anterior, ``df.isnull().sum()`` sobre el DataFrame completo de
+  cada fuente, una tras otra.
+- ``serie``: ``limpiar_nulos_por_columna`` con ``hilos=1`` (conteo por bloques de filas),
+  una fuente tras otra.
+- ``paralelo``: las fuentes en un pool de hilos (como ``kedro run --runner ThreadRunner``)
+  y, dentro de cada una, los nulos contados por bloques de columnas (``hilos_limpieza``).
+
+Usa encuestas sintéticas anchas con la mezcla de tipos de las reales (numéricas,
+categóricas y strings ``object``, en las que ``isnull`` no libera el GIL), de modo que no
+hace falta tener los CSV en ``data/01_raw``.
+
+Uso (desde la raíz del proyecto)::
+
+    python -m ml_analisis_ecosistema_dev.benchmarks.limpieza_nulos --filas 200000 --repeticiones 3
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from ml_analisis_ecosistema_dev.pipelines.procesamiento_de_datos.nodes import limpiar_nulos_por_columna
+
+FUENTES = ("so_2023", "jb_2023", "jb_2024")
+
+
+def generar_encuesta(filas: int, columnas: int, semilla: int) -> pd.DataFrame:
+    """Encuesta sintética con columnas numéricas, categóricas y de texto (``object``, como las
+    respuestas múltiples separadas por ``;``) y entre un 0% y un 90% de nulos."""
+    rng = np.random.default_rng(semilla)
+    respuestas = np.array([f"respuesta {j};otra {j}" for j in range(8)], dtype=object)
+    datos = {}
+    for i in range(columnas):
+        nulos = rng.random(filas) < rng.uniform(0.0, 0.9)
+        if i % 3 == 0:
+            datos[f"num_{i}"] = np.where(nulos, np.nan, rng.random(filas))
+        elif i % 3 == 1:
+            codigos = np.where(nulos, -1, rng.integers(0, 8, filas))
+            datos[f"cat_{i}"] = pd.Categorical.from_codes(codigos, [f"v{j}" for j in range(8)])
+        else:
+            texto = respuestas[rng.integers(0, 8, filas)]
+            texto[nulos] = None
+            datos[f"txt_{i}"] = texto
+    return pd.DataFrame(datos)
+
+
+def limpiar_referencia(encuestas: Dict[str, pd.DataFrame], umbral: float = 0.5) -> Dict[str, pd.DataFrame]:
+    """La limpieza anterior a ``limpiar_nulos_por_columna``: una máscara del DataFrame completo."""
+    limpias = {}
+    for nombre, df in encuestas.items():
+        nan_percentages = df.isnull().sum() / len(df)
+        limpias[nombre] = df.drop(columns=nan_percentages[nan_percentages > umbral].index)
+    return limpias
+
+
+def limpiar_en_serie(encuestas: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+    return {nombre: limpiar_nulos_por_columna(df, nombre, hilos=1) for nombre, df in encuestas.items()}
+
+
+def limpiar_en_paralelo(encuestas: Dict[str, pd.DataFrame], hilos: Optional[int]) -> Dict[str, pd.DataFrame]:
+    with ThreadPoolExecutor(max_workers=len(encuestas)) as pool:
+        limpias = pool.map(lambda item: limpiar_nulos_por_columna(item[1], item[0], hilos=hilos), encuestas.items())
+        return dict(zip(encuestas, limpias))
+
+
+def _cronometrar(funcion, repeticiones: int) -> List[float]:
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    return tiempos
+
+
+def medir(filas: int, columnas: int, repeticiones: int, hilos: Optional[int]) -> Dict[str, object]:
+    encuestas = {nombre: generar_encuesta(filas, columnas, semilla) for semilla, nombre in enumerate(FUENTES)}
+    modos = {
+        "referencia": lambda: limpiar_referencia(encuestas),
+        "serie": lambda: limpiar_en_serie(encuestas),
+        "paralelo": lambda: limpiar_en_paralelo(encuestas, hilos),
+    }
+    limpias = {modo: funcion() for modo, funcion in modos.items()}
+    for modo in ("serie", "paralelo"):
+        if any(list(limpias[modo][nombre].columns) != list(limpias["referencia"][nombre].columns) for nombre in FUENTES):
+            raise RuntimeError(f"La limpieza '{modo}' no elimina las mismas columnas que la de referencia.")
+
+    resultados: Dict[str, object] = {"filas": filas, "columnas": columnas, "fuentes": len(FUENTES)}
+    for modo, funcion in modos.items():
+        tiempos = _cronometrar(funcion, repeticiones)
+        resultados[modo] = {"tiempos_s": tiempos, "mediana_s": statistics.median(tiempos)}
+    resultados["nucleos"] = os.cpu_count()
+    resultados["hilos_por_fuente"] = hilos or os.cpu_count()
+    # Aceleraciones respecto al nodo anterior (> 1: más rápido que la referencia)
+    for modo in ("serie", "paralelo"):
+        resultados[f"aceleracion_{modo}"] = resultados["referencia"]["mediana_s"] / resultados[modo]["mediana_s"]
+    return resultados
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filas", type=int, default=200_000)
+    parser.add_argument("--columnas", type=int, default=80)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--hilos", type=int, default=None, help="Hilos por fuente (por defecto, uno por núcleo).")
+    parser.add_argument("--salida", default="data/08_reporting/benchmark_limpieza_nulos.json")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    resultados = medir(args.filas, args.columnas, args.repeticiones, args.hilos)
+    Path(args.salida).parent.mkdir(parents=True, exist_ok=True)
+    Path(args.salida).write_text(json.dumps(resultados, indent=2))
+    print(json.dumps(resultados, indent=2))
+
+
+if __name__ == "__main__":
+    main()
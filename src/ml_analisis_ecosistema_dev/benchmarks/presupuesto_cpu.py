@@ -0,0 +1,70 @@
+"""
+Mide el tiempo total de la etapa de entrenamiento ejecutando ``regresion`` y
+``clasificacion`` a la vez (como en el DAG de Airflow), con y sin el presupuesto de CPU
+coordinado de ``utils/recursos.py``.
+
+Uso (desde la raíz del proyecto, con ``datos_para_modelado`` ya generado)::
+
+    python -m ml_analisis_ecosistema_dev.benchmarks.presupuesto_cpu --repeticiones 3
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import time
+from pathlib import Path
+from typing import Dict, List
+
+PIPELINES = ("regresion", "clasificacion")
+
+MODOS = {
+    "sin_presupuesto": {"ML_PRESUPUESTO_CPU": "0"},
+    "con_presupuesto": {"ML_PRESUPUESTO_CPU": "1", "ML_ENTRENAMIENTOS_CONCURRENTES": str(len(PIPELINES))},
+}
+
+
+def ejecutar_etapa(entorno: Dict[str, str]) -> float:
+    """Lanza los pipelines de entrenamiento en paralelo y devuelve el tiempo de pared."""
+    inicio = time.perf_counter()
+    procesos = [
+        subprocess.Popen(
+            ["kedro", "run", f"--pipeline={nombre}"],
+            env={**os.environ, **entorno},
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        for nombre in PIPELINES
+    ]
+    for nombre, proceso in zip(PIPELINES, procesos):
+        _, errores = proceso.communicate()
+        if proceso.returncode != 0:
+            raise RuntimeError(f"El pipeline {nombre} falló:\n{errores.decode()[-2000:]}")
+    return time.perf_counter() - inicio
+
+
+def medir(repeticiones: int) -> Dict[str, Dict[str, object]]:
+    resultados: Dict[str, Dict[str, object]] = {}
+    for modo, entorno in MODOS.items():
+        tiempos: List[float] = [ejecutar_etapa(entorno) for _ in range(repeticiones)]
+        resultados[modo] = {"tiempos_s": tiempos, "mediana_s": statistics.median(tiempos)}
+    resultados["nucleos"] = os.cpu_count()
+    resultados["aceleracion"] = resultados["sin_presupuesto"]["mediana_s"] / resultados["con_presupuesto"]["mediana_s"]
+    return resultados
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--salida", default="data/08_reporting/benchmark_presupuesto_cpu.json")
+    args = parser.parse_args()
+
+    resultados = medir(args.repeticiones)
+    Path(args.salida).parent.mkdir(parents=True, exist_ok=True)
+    Path(args.salida).write_text(json.dumps(resultados, indent=2))
+    print(json.dumps(resultados, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""
+Suite de rendimiento de ``procesamiento_de_datos``, ``regresion`` y ``clasificacion`` sobre
+encuestas sintéticas de 10 mil a 10 millones de filas.
+
+Las encuestas imitan a la de Stack Overflow: columnas multirrespuesta separadas por ``;``,
+``Country`` y ``DevType`` con muchas categorías y frecuencias muy desiguales, nulos en
+las columnas categóricas y un salario log-normal con valores atípicos. Cada escala se ejecuta en
+un proceso nuevo, con los parámetros de ``conf/`` y todos los datasets en memoria; los
+hooks de ``hooks.py`` miden cada nodo (tiempo de pared, CPU e incremento del pico de RSS)
+y el pico de RSS del proceso da la memoria de la escala.
+
+Los resultados se comparan con la línea base versionada junto a este módulo
+(``linea_base_suite_pipelines.json``): si un nodo o el pico de memoria superan la línea
+base más la tolerancia, la suite lo lista y termina con código 1. Sin línea base también
+termina con código 1, salvo con ``--guardar-linea-base``. Las escalas que la línea base no
+cubre se avisan y no se comparan. La línea base depende de la máquina: se regenera con
+``--guardar-linea-base --linea-base <ruta del módulo>`` en la máquina de referencia.
+
+Uso (desde la raíz del proyecto)::
+
+    python -m ml_analisis_ecosistema_dev.benchmarks.suite_pipelines --guardar-linea-base
+    python -m ml_analisis_ecosistema_dev.benchmarks.suite_pipelines
+    python -m ml_analisis_ecosistema_dev.benchmarks.suite_pipelines \\
+        --escalas 10000 100000 --pipelines procesamiento_de_datos clasificacion
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+ESCALAS = (10_000, 100_000, 1_000_000, 10_000_000)
+# Por encima de estas filas sólo se mide el procesamiento: la búsqueda de hiperparámetros
+# de `regresion` y `clasificacion` tarda horas.
+MAX_FILAS_ENTRENAMIENTO = 100_000
+PIPELINES = ("procesamiento_de_datos", "regresion", "clasificacion")
+
+# Número de valores distintos de cada columna categórica sintética
+CARDINALIDADES = {"Country": 185, "DevType": 34, "TechList": 3, "OrgSize": 10, "Age": 8}
+OPCIONES_MULTIRRESPUESTA = 24
+COMBINACIONES_MULTIRRESPUESTA = 4096
+PROPORCION_SIN_SALARIO = 0.2
+
+LINEA_BASE = Path(__file__).with_name("linea_base_suite_pipelines.json")
+
+
+def _zipf(rng: np.random.Generator, n: int) -> np.ndarray:
+    """Probabilidades con frecuencias muy desiguales, como los países de la encuesta."""
+    pesos = 1.0 / np.arange(1, n + 1) ** 1.1
+    return rng.permutation(pesos / pesos.sum())
+
+
+def _con_nulos(rng: np.random.Generator, codigos: np.ndarray, proporcion: float) -> np.ndarray:
+    return np.where(rng.random(len(codigos)) < proporcion, -1, codigos)
+
+
+def generar_encuesta(filas: int, columnas: Dict[str, Any], semilla: int = 0) -> pd.DataFrame:
+    """Encuesta sintética con las columnas de ``columnas_encuesta`` y los tipos de
+    ``SurveyCSVDataset`` (categorías y ``float32``).
+
+    Las columnas categóricas se generan como códigos sobre un vocabulario fijo, de modo
+    que 10 millones de filas caben en memoria sin crear un string por celda.
+    """
+    rng = np.random.default_rng(semilla)
+    datos: Dict[str, Any] = {}
+    for col in columnas.get("multi_answer_cols", []):
+        opciones = [f"{col}_{i}" for i in range(OPCIONES_MULTIRRESPUESTA)]
+        combinaciones = sorted(
+            {
+                ";".join(sorted(rng.choice(opciones, size=rng.integers(1, 7), replace=False)))
+                for _ in range(COMBINACIONES_MULTIRRESPUESTA)
+            }
+        )
+        codigos = rng.choice(len(combinaciones), size=filas, p=_zipf(rng, len(combinaciones)))
+        datos[col] = pd.Categorical.from_codes(_con_nulos(rng, codigos, rng.uniform(0.02, 0.3)), combinaciones)
+
+    efectos = {}
+    for col in columnas.get("standard_categorical_cols", []):
+        n = CARDINALIDADES.get(col, 6)
+        codigos = rng.choice(n, size=filas, p=_zipf(rng, n))
+        efectos[col] = rng.normal(0, 0.4 if col == "Country" else 0.15, n)[codigos]
+        datos[col] = pd.Categorical.from_codes(
+            _con_nulos(rng, codigos, rng.uniform(0.0, 0.2)), [f"{col}_{i}" for i in range(n)]
+        )
+
+    experiencia = rng.gamma(2.0, 5.0, filas)
+    log_salario = 11.0 + 0.03 * experiencia + sum(efectos.values(), np.zeros(filas)) + rng.normal(0, 0.5, filas)
+    salario = np.exp(log_salario)
+    # Salarios atípicos (errores de unidades en la encuesta) y encuestados sin salario
+    atipicos = rng.random(filas) < 0.01
+    salario[atipicos] *= rng.choice([1e-3, 1e2], size=atipicos.sum())
+    salario[rng.random(filas) < PROPORCION_SIN_SALARIO] = np.nan
+
+    numericas = {"WorkExp": experiencia, "CompTotal": salario * rng.lognormal(0, 0.3, filas)}
+    for col in columnas.get("numeric_cols", []):
+        valores = numericas.get(col, rng.normal(0, 1, filas))
+        # Como en la encuesta real, las numéricas están completas en las filas con salario
+        datos[col] = np.nan_to_num(valores, nan=0.0).astype(np.float32)
+    datos[columnas["target_col"]] = salario.astype(np.float32)
+    return pd.DataFrame(datos)
+
+
+def _valor_parametro(parametros: Dict[str, Any], nombre: str) -> Any:
+    valor = parametros
+    for clave in nombre.split("."):
+        valor = valor[clave]
+    return valor
+
+
+def ejecutar_escala(
+    filas: int, pipelines: Sequence[str], conf_source: str = "conf", semilla: int = 0
+) -> Dict[str, Any]:
+    """Ejecuta los pipelines sobre una encuesta sintética de ``filas`` filas y mide cada nodo.
+
+    ``procesamiento_de_datos`` se ejecuta siempre, porque produce `datos_para_modelado`
+    y `plan_cv` para el entrenamiento.
+    """
+    from kedro.config import OmegaConfigLoader
+    from kedro.framework.hooks.manager import _create_hook_manager
+    from kedro.io import DataCatalog, MemoryDataset
+    from kedro.runner import SequentialRunner
+
+    from ml_analisis_ecosistema_dev.hooks import PerfilRendimientoHooks
+    from ml_analisis_ecosistema_dev.pipeline_registry import register_pipelines
+    from ml_analisis_ecosistema_dev.utils.memoria import pico_memoria_mb
+
+    # Sólo interesan las mediciones, no el log de cada carga y guardado
+    logging.getLogger("kedro").setLevel(logging.WARNING)
+    config = OmegaConfigLoader(conf_source=conf_source, base_env="base", default_run_env="local")
+    parametros = config["parameters"]
+    registro = register_pipelines()
+    pipeline = registro["procesamiento_de_datos"]
+    for nombre in pipelines:
+        if nombre != "procesamiento_de_datos":
+            pipeline += registro[nombre]
+
+    hooks = PerfilRendimientoHooks()
+    hook_manager = _create_hook_manager()
+    hook_manager.register(hooks)
+    crudo = generar_encuesta(filas, config["globals"]["columnas_encuesta"], semilla)
+    with tempfile.TemporaryDirectory() as caches:
+        # Las cachés en disco de una escala (SMOTE, conjuntos cuantizados) no deben
+        # acelerar la siguiente
+        parametros["classification_pipeline"]["cache_smote"] = f"{caches}/smote"
+        for pipeline_modelado in ("regression_pipeline", "classification_pipeline"):
+            parametros[pipeline_modelado]["cache_cuantizacion"] = f"{caches}/cuantizacion"
+        datasets = {"datos_crudos_so_2023": MemoryDataset(crudo, copy_mode="assign")}
+        for nombre in pipeline.inputs():
+            if nombre.startswith("params:"):
+                valor = _valor_parametro(parametros, nombre[len("params:") :])
+                datasets[nombre] = MemoryDataset(valor, copy_mode="assign")
+        inicio = time.perf_counter()
+        SequentialRunner().run(pipeline, DataCatalog(datasets), hook_manager)
+        total = time.perf_counter() - inicio
+
+    return {
+        "filas": filas,
+        "pipelines": ["procesamiento_de_datos", *(n for n in pipelines if n != "procesamiento_de_datos")],
+        "tiempo_total_s": total,
+        "pico_rss_mb": pico_memoria_mb(),
+        "nodos": {
+            nodo["nodo"]: {clave: nodo[clave] for clave in ("tiempo_pared_s", "tiempo_cpu_s", "delta_pico_rss_mb")}
+            for nodo in hooks.informe()["nodos"]
+        },
+    }
+
+
+def medir(
+    escalas: Sequence[int],
+    pipelines: Sequence[str],
+    semilla: int = 0,
+    max_filas_entrenamiento: int = MAX_FILAS_ENTRENAMIENTO,
+) -> Dict[str, Any]:
+    resultados: Dict[str, Any] = {"nucleos": os.cpu_count(), "escalas": {}}
+    for filas in escalas:
+        a_medir = pipelines if filas <= max_filas_entrenamiento else ["procesamiento_de_datos"]
+        # Un proceso por escala: el pico de RSS no arrastra el de las escalas anteriores
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+            resultados["escalas"][str(filas)] = pool.submit(
+                ejecutar_escala, filas, a_medir, "conf", semilla
+            ).result()
+        print(f"{filas} filas: {resultados['escalas'][str(filas)]['tiempo_total_s']:.1f} s", file=sys.stderr)
+    return resultados
+
+
+def comparar(
+    resultados: Dict[str, Any],
+    linea_base: Dict[str, Any],
+    tolerancia: float = 0.25,
+    tolerancia_memoria: float = 0.10,
+    margen_s: float = 0.05,
+) -> List[str]:
+    """Regresiones respecto a la línea base.
+
+    Un nodo retrocede si su tiempo de pared supera ``base * (1 + tolerancia) + margen_s``
+    (el margen evita falsos positivos en nodos de milisegundos); una escala, si su pico de
+    RSS supera ``base * (1 + tolerancia_memoria)``. Las escalas y nodos que no están en la
+    línea base no se comparan.
+    """
+    regresiones = []
+    for escala, medida in resultados["escalas"].items():
+        base = linea_base.get("escalas", {}).get(escala)
+        if base is None:
+            continue
+        for nodo, tiempos in medida["nodos"].items():
+            referencia = base["nodos"].get(nodo)
+            if referencia is None:
+                continue
+            limite = referencia["tiempo_pared_s"] * (1 + tolerancia) + margen_s
+            if tiempos["tiempo_pared_s"] > limite:
+                regresiones.append(
+                    f"{escala} filas, {nodo}: {tiempos['tiempo_pared_s']:.2f} s "
+                    f"(línea base {referencia['tiempo_pared_s']:.2f} s)"
+                )
+        if medida["pico_rss_mb"] and base.get("pico_rss_mb"):
+            if medida["pico_rss_mb"] > base["pico_rss_mb"] * (1 + tolerancia_memoria):
+                regresiones.append(
+                    f"{escala} filas, pico de RSS: {medida['pico_rss_mb']:.0f} MB "
+                    f"(línea base {base['pico_rss_mb']:.0f} MB)"
+                )
+    return regresiones
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--escalas", type=int, nargs="+", default=list(ESCALAS))
+    parser.add_argument("--pipelines", nargs="+", choices=PIPELINES, default=list(PIPELINES))
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument(
+        "--max-filas-entrenamiento",
+        type=int,
+        default=MAX_FILAS_ENTRENAMIENTO,
+        help="Escala máxima a la que se miden `regresion` y `clasificacion`.",
+    )
+    parser.add_argument("--tolerancia", type=float, default=0.25, help="Margen relativo de tiempo por nodo.")
+    parser.add_argument("--tolerancia-memoria", type=float, default=0.10, help="Margen relativo del pico de RSS.")
+    parser.add_argument("--salida", default="data/08_reporting/benchmark_suite_pipelines.json")
+    parser.add_argument("--linea-base", default=str(LINEA_BASE))
+    parser.add_argument("--guardar-linea-base", action="store_true", help="Guarda esta ejecución como línea base.")
+    args = parser.parse_args()
+
+    linea_base = Path(args.linea_base)
+    if not args.guardar_linea_base and not linea_base.exists():
+        # Antes de medir: sin línea base la suite no puede detectar regresiones
+        print(f"No hay línea base en '{linea_base}'; use --guardar-linea-base.", file=sys.stderr)
+        sys.exit(1)
+
+    logging.basicConfig(level=logging.WARNING)
+    resultados = medir(args.escalas, args.pipelines, args.semilla, args.max_filas_entrenamiento)
+    Path(args.salida).parent.mkdir(parents=True, exist_ok=True)
+    Path(args.salida).write_text(json.dumps(resultados, indent=2))
+    print(json.dumps(resultados, indent=2))
+
+    if args.guardar_linea_base:
+        linea_base.write_text(json.dumps(resultados, indent=2))
+        print(f"Línea base guardada en '{linea_base}'.", file=sys.stderr)
+        return
+    referencia = json.loads(linea_base.read_text())
+    sin_base = [escala for escala in resultados["escalas"] if escala not in referencia.get("escalas", {})]
+    if sin_base:
+        print(f"AVISO: la línea base no cubre las escalas {', '.join(sin_base)}; no se comparan.", file=sys.stderr)
+    regresiones = comparar(resultados, referencia, args.tolerancia, args.tolerancia_memoria)
+    if regresiones:
+        print("REGRESIONES DE RENDIMIENTO:\n" + "\n".join(f"  - {r}" for r in regresiones), file=sys.stderr)
+        sys.exit(1)
+    print("Sin regresiones respecto a la línea base.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
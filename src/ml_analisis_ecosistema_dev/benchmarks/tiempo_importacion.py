@@ -0,0 +1,128 @@
+"""
+Mide el coste de arranque de la CLI: importar ``pipeline_registry`` y construir todos los
+pipelines con ``register_pipelines()``, que es lo que paga cualquier ``kedro run``
+(también ``--pipeline=procesamiento_de_datos``) y ``kedro registry list`` antes de
+ejecutar el primer nodo.
+
+Los nodos importan scikit-learn, XGBoost, LightGBM e imbalanced-learn al ejecutarse, no al
+registrarse. Cada medición es un intérprete nuevo que informa del tiempo, de los módulos
+cargados y de cuáles de ``LIBRERIAS_PESADAS`` se han importado. El benchmark termina con
+código 1 si la mediana supera ``--limite`` segundos o si se ha cargado alguna librería
+pesada.
+
+Uso (desde la raíz del proyecto)::
+
+    python -m ml_analisis_ecosistema_dev.benchmarks.tiempo_importacion --repeticiones 5
+    python -m ml_analisis_ecosistema_dev.benchmarks.tiempo_importacion --con-cli
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+MODULO = "ml_analisis_ecosistema_dev.benchmarks.tiempo_importacion"
+# Librerías que sólo deben cargarse cuando se ejecuta un nodo que las usa
+LIBRERIAS_PESADAS = ("sklearn", "xgboost", "lightgbm", "imblearn", "scipy.stats")
+# Segundos para importar y construir los pipelines (unos 2 s cuando se importaban los modelos)
+LIMITE_SEGUNDOS = 1.5
+# Directorio que contiene el paquete (`src/`): el intérprete nuevo lo necesita en su ruta
+DIRECTORIO_PAQUETE = Path(__file__).resolve().parents[2]
+
+
+def _medir_en_este_proceso() -> Dict[str, Any]:
+    """Importa el registro, construye los pipelines y devuelve el tiempo y los módulos cargados."""
+    inicio = time.perf_counter()
+    from ml_analisis_ecosistema_dev.pipeline_registry import register_pipelines
+
+    pipelines = register_pipelines()
+    segundos = time.perf_counter() - inicio
+    return {
+        "registro_s": segundos,
+        "pipelines": len(pipelines),
+        "modulos_cargados": len(sys.modules),
+        "librerias_pesadas": [libreria for libreria in LIBRERIAS_PESADAS if libreria in sys.modules],
+    }
+
+
+def medir_registro() -> Dict[str, Any]:
+    """Lanza un intérprete nuevo que mide ``register_pipelines`` y devuelve su medición."""
+    ruta = os.pathsep.join(filter(None, [str(DIRECTORIO_PAQUETE), os.environ.get("PYTHONPATH")]))
+    resultado = subprocess.run(
+        [sys.executable, "-m", MODULO, "--medir"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": ruta},
+    )
+    if resultado.returncode != 0:
+        raise RuntimeError(f"La medición del registro de pipelines falló:\n{resultado.stderr[-2000:]}")
+    return json.loads(resultado.stdout.strip().splitlines()[-1])
+
+
+def medir_cli(directorio_proyecto: Path) -> float:
+    """Segundos de pared de ``kedro registry list`` en ``directorio_proyecto``."""
+    inicio = time.perf_counter()
+    resultado = subprocess.run(
+        [sys.executable, "-m", "kedro", "registry", "list"], cwd=directorio_proyecto, capture_output=True, text=True
+    )
+    if resultado.returncode != 0:
+        raise RuntimeError(f"`kedro registry list` falló:\n{resultado.stderr[-2000:]}")
+    return time.perf_counter() - inicio
+
+
+def medir(repeticiones: int, directorio_proyecto: Optional[Path] = None) -> Dict[str, Any]:
+    mediciones = [medir_registro() for _ in range(repeticiones)]
+    resultados: Dict[str, Any] = {
+        clave: statistics.median(medicion[clave] for medicion in mediciones)
+        for clave in ("registro_s", "modulos_cargados")
+    }
+    resultados["pipelines"] = mediciones[0]["pipelines"]
+    resultados["librerias_pesadas"] = sorted({lib for medicion in mediciones for lib in medicion["librerias_pesadas"]})
+    if directorio_proyecto is not None:
+        resultados["kedro_registry_list_s"] = statistics.median(
+            medir_cli(directorio_proyecto) for _ in range(repeticiones)
+        )
+    return resultados
+
+
+def problemas(resultados: Dict[str, Any], limite: float = LIMITE_SEGUNDOS) -> List[str]:
+    """Incumplimientos del presupuesto de arranque (lista vacía si no hay ninguno)."""
+    encontrados = []
+    if resultados["registro_s"] > limite:
+        encontrados.append(f"register_pipelines: {resultados['registro_s']:.2f} s (límite {limite:.2f} s)")
+    if resultados["librerias_pesadas"]:
+        encontrados.append(f"librerías importadas al registrar: {', '.join(resultados['librerias_pesadas'])}")
+    return encontrados
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--limite", type=float, default=LIMITE_SEGUNDOS, help="Segundos máximos del registro.")
+    parser.add_argument("--con-cli", action="store_true", help="Mide también `kedro registry list`.")
+    parser.add_argument("--salida", default="data/08_reporting/benchmark_tiempo_importacion.json")
+    parser.add_argument("--medir", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.medir:
+        print(json.dumps(_medir_en_este_proceso()))
+        return
+
+    resultados = medir(args.repeticiones, Path.cwd() if args.con_cli else None)
+    Path(args.salida).parent.mkdir(parents=True, exist_ok=True)
+    Path(args.salida).write_text(json.dumps(resultados, indent=2))
+    print(json.dumps(resultados, indent=2))
+
+    encontrados = problemas(resultados, args.limite)
+    if encontrados:
+        print("Arranque por encima del presupuesto:\n  " + "\n  ".join(encontrados), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""Datasets propios del proyecto para el catálogo de Kedro."""
+
+from .arrow_cache_dataset import ArrowCacheDataset
+from .chunked_table_dataset import ChunkedTableDataset
+from .matriz_memmap_dataset import MatrizMemmapDataset
+from .modelo_nativo_dataset import ModeloNativoDataset
+from .particiones_encuesta_dataset import ParticionEncuesta, ParticionesEncuestaDataset
+from .sparse_parquet_dataset import SparseParquetDataset
+from .survey_csv_dataset import SurveyCSVDataset, columnas_requeridas
+
+__all__ = [
+    "ArrowCacheDataset",
+    "ChunkedTableDataset",
+    "MatrizMemmapDataset",
+    "ModeloNativoDataset",
+    "ParticionEncuesta",
+    "ParticionesEncuestaDataset",
+    "SparseParquetDataset",
+    "SurveyCSVDataset",
+    "columnas_requeridas",
+]
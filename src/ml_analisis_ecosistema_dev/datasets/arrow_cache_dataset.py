@@ -0,0 +1,119 @@
+"""
+``ArrowCacheDataset`` envuelve un dataset de datos crudos (CSV o CSV comprimido) y guarda
+una copia columnar en formato Feather/Arrow. Las cargas siguientes leen esa copia en lugar
+de volver a parsear el CSV: lo que se ahorra es el parseo, no memoria. Arrow mapea el
+fichero, pero ``to_pandas`` materializa el DataFrame completo.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Union
+
+import pandas as pd
+import pyarrow.feather as feather
+from kedro.io import AbstractDataset
+
+logger = logging.getLogger(__name__)
+
+TAMANO_BLOQUE_HASH = 8 * 1024 * 1024
+
+
+def huella_origen(dataset: AbstractDataset) -> str:
+    """Hash del contenido del fichero de un dataset y de su configuración de carga.
+
+    ``dataset`` debe exponer ``_get_load_path`` y ``_fs``, como los datasets de
+    ``kedro_datasets.pandas``.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    load_path = str(dataset._get_load_path())
+    with dataset._fs.open(load_path, "rb") as fichero:
+        for bloque in iter(lambda: fichero.read(TAMANO_BLOQUE_HASH), b""):
+            digest.update(bloque)
+    configuracion = {k: v for k, v in dataset._describe().items() if k != "filepath"}
+    digest.update(json.dumps(configuracion, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+class ArrowCacheDataset(AbstractDataset[pd.DataFrame, pd.DataFrame]):
+    """Caché Feather de un dataset crudo, invalidada por el hash del contenido del fichero
+    de origen y por la configuración de carga del dataset envuelto.
+
+    Ejemplo:
+        ```yaml
+        datos_crudos_jb_2025_narrow:
+          type: ml_analisis_ecosistema_dev.datasets.ArrowCacheDataset
+          cache_dir: data/02_intermediate/cache_crudos
+          dataset:
+            type: pandas.CSVDataset
+            filepath: data/01_raw/jetbrains_2025/developer_ecosystem_2025_external_narrow.csv.zip
+            load_args:
+              compression: zip
+        ```
+    """
+
+    def __init__(
+        self,
+        *,
+        dataset: Union[Dict[str, Any], AbstractDataset],
+        cache_dir: str,
+        metadata: Dict[str, Any] = None,
+    ) -> None:
+        """Crea el dataset.
+
+        Args:
+            dataset: Configuración (o instancia) del dataset de origen. Debe exponer
+                ``_get_load_path`` y ``_fs``, como los datasets de ``kedro_datasets.pandas``.
+            cache_dir: Directorio local donde se guardan los ficheros Feather.
+            metadata: Metadatos arbitrarios, ignorados por Kedro.
+        """
+        self._dataset = (
+            dataset if isinstance(dataset, AbstractDataset) else AbstractDataset.from_config("_origen", dataset)
+        )
+        self._cache_dir = Path(cache_dir)
+        self.metadata = metadata
+
+    def _describe(self) -> Dict[str, Any]:
+        return {"dataset": self._dataset._describe(), "cache_dir": str(self._cache_dir)}
+
+    def _hash_origen(self) -> str:
+        return huella_origen(self._dataset)
+
+    def _ruta_cache(self, clave: str) -> Path:
+        origen = str(self._dataset._get_load_path())
+        # El hash de la ruta completa separa orígenes con el mismo nombre de fichero (p. ej.
+        # `survey_results_public.csv` de años distintos)
+        ruta = hashlib.blake2b(origen.encode(), digest_size=4).hexdigest()
+        return self._cache_dir / f"{Path(origen).name.split('.')[0]}-{ruta}-{clave}.feather"
+
+    def load(self) -> pd.DataFrame:
+        origen = self._dataset._get_load_path()
+        ruta = self._ruta_cache(self._hash_origen())
+        if ruta.exists():
+            logger.info(f"Caché HIT para '{origen}': leyendo '{ruta}'.")
+            return feather.read_table(ruta, memory_map=True).to_pandas()
+
+        logger.info(f"Caché MISS para '{origen}': parseando el origen y generando '{ruta}'.")
+        data = self._dataset.load()
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        # Las versiones anteriores del mismo origen quedan obsoletas
+        for obsoleto in self._cache_dir.glob(f"{ruta.name.rsplit('-', 1)[0]}-*.feather"):
+            obsoleto.unlink()
+        # Se escribe en un temporal y se renombra: una escritura interrumpida no deja un
+        # fichero truncado con el nombre de la clave, que se leería como HIT.
+        temporal = ruta.with_name(f".{ruta.name}.{os.getpid()}.tmp")
+        try:
+            # Sin compresión para que la lectura pueda mapear el fichero en memoria
+            feather.write_feather(data.reset_index(drop=True), temporal, compression="uncompressed")
+            os.replace(temporal, ruta)
+        finally:
+            temporal.unlink(missing_ok=True)
+        return data
+
+    def save(self, data: pd.DataFrame) -> None:
+        self._dataset.save(data)
+
+    def _exists(self) -> bool:
+        return self._dataset.exists()
@@ -0,0 +1,108 @@
+"""
+``ChunkedTableDataset`` lee un CSV o Parquet como un iterador de DataFrames de tamaño
+fijo, para procesar ficheros más grandes que la memoria disponible.
+"""
+
+from pathlib import PurePosixPath
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+import fsspec
+import pandas as pd
+import pyarrow.parquet as pq
+from kedro.io import AbstractDataset, DatasetError
+from kedro.io.core import get_filepath_str, get_protocol_and_path
+
+from .survey_csv_dataset import columnas_requeridas
+
+
+class Lotes:
+    """Iterable de lotes que vuelve a leer el fichero en cada recorrido, para los nodos
+    que necesitan varias pasadas (p. ej. entrenamiento incremental por épocas)."""
+
+    def __init__(self, leer: Callable[[], Iterator[pd.DataFrame]]) -> None:
+        self._leer = leer
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        return self._leer()
+
+
+class ChunkedTableDataset(AbstractDataset[None, Iterable[pd.DataFrame]]):
+    """Dataset de sólo lectura que entrega lotes de ``filas_por_lote`` filas.
+
+    El formato se deduce de la extensión (``.parquet`` o CSV). Con ``columnas`` (la misma
+    especificación que ``SurveyCSVDataset``) sólo se leen las columnas requeridas, más las
+    de ``columnas_extra`` (p. ej. identificadores) sin cambiar su tipo. ``load`` devuelve
+    un iterable que se puede recorrer varias veces: cada recorrido vuelve a leer el fichero.
+
+    Ejemplo:
+        ```yaml
+        datos_a_puntuar:
+          type: ml_analisis_ecosistema_dev.datasets.ChunkedTableDataset
+          filepath: data/01_raw/encuestados_nuevos.csv
+          filas_por_lote: 100000
+          columnas: ${globals:columnas_encuesta}
+          columnas_extra: [ResponseId]
+        ```
+    """
+
+    def __init__(
+        self,
+        *,
+        filepath: str,
+        filas_por_lote: int = 100_000,
+        columnas: Optional[Dict[str, Any]] = None,
+        columnas_extra: Optional[List[str]] = None,
+        load_args: Optional[Dict[str, Any]] = None,
+        credentials: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        protocol, path = get_protocol_and_path(filepath)
+        self._protocol = protocol
+        self._filepath = PurePosixPath(path)
+        self._fs = fsspec.filesystem(protocol, **(credentials or {}))
+        self._filas_por_lote = filas_por_lote
+        self._columnas = columnas
+        self._columnas_extra = list(columnas_extra or [])
+        self._load_args = load_args or {}
+        self.metadata = metadata
+
+    def _describe(self) -> Dict[str, Any]:
+        return {
+            "filepath": self._filepath,
+            "filas_por_lote": self._filas_por_lote,
+            "columnas": self._columnas,
+            "columnas_extra": self._columnas_extra,
+            "load_args": self._load_args,
+        }
+
+    def load(self) -> Lotes:
+        ruta = get_filepath_str(self._filepath, self._protocol)
+        if self._filepath.suffix == ".parquet":
+            return Lotes(lambda: self._lotes_parquet(ruta))
+        return Lotes(lambda: self._lotes_csv(ruta))
+
+    def _lotes_parquet(self, ruta: str) -> Iterator[pd.DataFrame]:
+        columnas = [*columnas_requeridas(self._columnas), *self._columnas_extra] if self._columnas else None
+        with self._fs.open(ruta, mode="rb") as fichero:
+            parquet = pq.ParquetFile(fichero)
+            if columnas:
+                columnas = [col for col in columnas if col in parquet.schema_arrow.names]
+            for lote in parquet.iter_batches(batch_size=self._filas_por_lote, columns=columnas):
+                yield lote.to_pandas()
+
+    def _lotes_csv(self, ruta: str) -> Iterator[pd.DataFrame]:
+        load_args = dict(self._load_args)
+        if self._columnas:
+            with self._fs.open(ruta, mode="rb", compression="infer") as fichero:
+                cabecera = pd.read_csv(fichero, nrows=0, encoding=load_args.get("encoding")).columns
+            dtype = {col: tipo for col, tipo in columnas_requeridas(self._columnas).items() if col in cabecera}
+            extra = [col for col in self._columnas_extra if col in cabecera]
+            load_args.update(usecols=[*dtype, *extra], dtype=dtype)
+        with self._fs.open(ruta, mode="rb", compression="infer") as fichero:
+            yield from pd.read_csv(fichero, chunksize=self._filas_por_lote, **load_args)
+
+    def save(self, data: None) -> None:
+        raise DatasetError(f"{self.__class__.__name__} es de sólo lectura.")
+
+    def _exists(self) -> bool:
+        return self._fs.exists(get_filepath_str(self._filepath, self._protocol))
@@ -0,0 +1,99 @@
+"""
+``MatrizMemmapDataset`` guarda una matriz de características como ``.npy`` ``float32``
+contiguo y la carga mapeada en memoria, para que los workers de joblib (validación
+cruzada de ``GridSearchCV``) reciban vistas sin copia en lugar de una copia serializada
+por candidato y fold.
+"""
+
+import json
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+from kedro.io import AbstractDataset, DatasetError
+from kedro.io.core import get_protocol_and_path
+from scipy import sparse
+
+Matriz = Union[pd.DataFrame, sparse.csr_matrix]
+
+FICHERO_METADATOS = "metadatos.json"
+
+
+class MatrizMemmapDataset(AbstractDataset[Matriz, Matriz]):
+    """Matriz densa (DataFrame) o CSR guardada en un directorio de ficheros ``.npy``.
+
+    - DataFrame denso: ``matriz.npy`` (C-contiguo, ``float32``) e ``indice.npy`` (los
+      índices de strings van en ``metadatos.json``); al cargar se devuelve un DataFrame que envuelve el ``np.memmap`` sin copiarlo, con los mismos
+      nombres de columna e índice.
+    - CSR: ``data.npy``, ``indices.npy`` e ``indptr.npy``; al cargar se devuelve una
+      ``csr_matrix`` sobre los tres ``np.memmap``.
+
+    joblib serializa un ``np.memmap`` como una referencia al fichero, de modo que cada
+    worker mapea las mismas páginas y la memoria no crece con ``n_jobs``. Sólo admite el
+    sistema de ficheros local.
+
+    Ejemplo:
+        ```yaml
+        X_train:
+          type: ml_analisis_ecosistema_dev.datasets.MatrizMemmapDataset
+          filepath: data/05_model_input/matrices/X_train
+        ```
+    """
+
+    def __init__(self, *, filepath: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+        protocol, path = get_protocol_and_path(filepath)
+        if protocol != "file":
+            raise DatasetError(f"{self.__class__.__name__} sólo admite rutas locales, no '{protocol}://'.")
+        self._filepath = Path(path)
+        self.metadata = metadata
+
+    def _describe(self) -> Dict[str, Any]:
+        return {"filepath": self._filepath}
+
+    def save(self, data: Matriz) -> None:
+        # Se escribe aparte y se sustituye al final: un lector nunca ve una matriz a medias
+        temporal = self._filepath.with_name(f".{self._filepath.name}.tmp")
+        if temporal.exists():
+            shutil.rmtree(temporal)
+        temporal.mkdir(parents=True)
+
+        if sparse.issparse(data):
+            csr = sparse.csr_matrix(data, dtype=np.float32)
+            for nombre in ("data", "indices", "indptr"):
+                np.save(temporal / f"{nombre}.npy", getattr(csr, nombre))
+            metadatos = {"tipo": "csr", "forma": list(csr.shape)}
+        else:
+            np.save(temporal / "matriz.npy", np.ascontiguousarray(data.to_numpy(dtype=np.float32)))
+            metadatos = {"tipo": "densa", "columnas": [str(col) for col in data.columns]}
+            indice = data.index.to_numpy()
+            if indice.dtype.kind in "biufM":
+                np.save(temporal / "indice.npy", indice)
+            elif all(isinstance(valor, str) for valor in indice):
+                # `np.save` serializaría un índice de strings con pickle
+                metadatos["indice"] = indice.tolist()
+            else:
+                shutil.rmtree(temporal)
+                raise DatasetError(
+                    f"{self.__class__.__name__} sólo admite índices numéricos, de fechas o de strings, "
+                    f"no '{data.index.dtype}'."
+                )
+        (temporal / FICHERO_METADATOS).write_text(json.dumps(metadatos))
+
+        if self._filepath.exists():
+            shutil.rmtree(self._filepath)
+        temporal.rename(self._filepath)
+
+    def load(self) -> Matriz:
+        metadatos = json.loads((self._filepath / FICHERO_METADATOS).read_text())
+        if metadatos["tipo"] == "csr":
+            partes = [np.load(self._filepath / f"{nombre}.npy", mmap_mode="r") for nombre in ("data", "indices", "indptr")]
+            return sparse.csr_matrix(tuple(partes), shape=tuple(metadatos["forma"]), copy=False)
+
+        matriz = np.load(self._filepath / "matriz.npy", mmap_mode="r")
+        indice = metadatos["indice"] if "indice" in metadatos else np.load(self._filepath / "indice.npy")
+        return pd.DataFrame(matriz, index=indice, columns=metadatos["columnas"], copy=False)
+
+    def _exists(self) -> bool:
+        return (self._filepath / FICHERO_METADATOS).exists()
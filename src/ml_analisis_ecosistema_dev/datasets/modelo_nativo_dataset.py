@@ -0,0 +1,55 @@
+"""
+``ModeloNativoDataset`` guarda el mejor modelo de un pipeline en el formato nativo de su
+librería (``utils/modelos_nativos.py``) y lo carga como un predictor ligero, en lugar del
+pickle del estimador o ``ImbPipeline`` completo.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from kedro.io import AbstractDataset, DatasetError
+from kedro.io.core import get_protocol_and_path
+
+from ml_analisis_ecosistema_dev.utils.modelos_nativos import (
+    FICHERO_MANIFIESTO,
+    cargar_modelo_nativo,
+    guardar_modelo_nativo,
+)
+
+
+class ModeloNativoDataset(AbstractDataset[Any, Any]):
+    """Modelo guardado en el formato nativo de su librería dentro de un directorio.
+
+    ``save`` recibe el estimador o ``ImbPipeline`` que devuelven los nodos de entrenamiento;
+    ``load`` devuelve un predictor con ``predict``, ``predict_proba`` (clasificadores),
+    ``classes_`` y ``n_features_in_``. Con ``perezoso: true`` los boosters se leen en la
+    primera predicción. Sólo admite el sistema de ficheros local.
+
+    Ejemplo:
+        ```yaml
+        regresion_model:
+          type: ml_analisis_ecosistema_dev.datasets.ModeloNativoDataset
+          filepath: data/06_models/regresion_model
+          perezoso: true
+        ```
+    """
+
+    def __init__(self, *, filepath: str, perezoso: bool = True, metadata: Optional[Dict[str, Any]] = None) -> None:
+        protocol, path = get_protocol_and_path(filepath)
+        if protocol != "file":
+            raise DatasetError(f"{self.__class__.__name__} sólo admite rutas locales, no '{protocol}://'.")
+        self._filepath = Path(path)
+        self._perezoso = perezoso
+        self.metadata = metadata
+
+    def _describe(self) -> Dict[str, Any]:
+        return {"filepath": self._filepath, "perezoso": self._perezoso}
+
+    def save(self, data: Any) -> None:
+        guardar_modelo_nativo(data, self._filepath)
+
+    def load(self) -> Any:
+        return cargar_modelo_nativo(self._filepath, perezoso=self._perezoso)
+
+    def _exists(self) -> bool:
+        return (self._filepath / FICHERO_MANIFIESTO).exists()
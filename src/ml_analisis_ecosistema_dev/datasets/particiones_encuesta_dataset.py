@@ -0,0 +1,67 @@
+"""
+``ParticionesEncuestaDataset`` expone cada fichero crudo de una encuesta (una fuente y un
+año) como una partición con su huella de contenido, para reprocesar sólo las particiones
+nuevas o modificadas.
+"""
+
+from typing import Any, Callable, Dict, List
+
+from kedro.io import DatasetError
+from kedro_datasets.partitions import PartitionedDataset
+
+from .arrow_cache_dataset import huella_origen
+
+
+class ParticionEncuesta:
+    """Carga diferida de una partición, como los valores de ``PartitionedDataset``, con la
+    huella (``huella_origen``) del fichero y de su configuración de carga."""
+
+    def __init__(self, cargar: Callable[[], Any], huella: str) -> None:
+        self._cargar = cargar
+        self.huella = huella
+
+    def __call__(self) -> Any:
+        return self._cargar()
+
+
+class ParticionesEncuestaDataset(PartitionedDataset):
+    """``PartitionedDataset`` de sólo lectura sobre los ficheros que casan con ``patron``.
+
+    El identificador de cada partición es el directorio del fichero relativo a ``path``
+    (p. ej. ``stackoverflow_2023``), de modo que un año nuevo se añade creando su
+    directorio junto a los anteriores.
+
+    Ejemplo:
+        ```yaml
+        encuestas_so_particionadas:
+          type: ml_analisis_ecosistema_dev.datasets.ParticionesEncuestaDataset
+          path: data/01_raw
+          patron: stackoverflow_*/*.csv
+          dataset:
+            type: ml_analisis_ecosistema_dev.datasets.SurveyCSVDataset
+            columnas: ${globals:columnas_encuesta}
+        ```
+    """
+
+    def __init__(self, *, patron: str, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._patron = patron
+
+    def _describe(self) -> Dict[str, Any]:
+        return {**super()._describe(), "patron": self._patron}
+
+    def _list_partitions(self) -> List[str]:
+        return sorted(self._filesystem.glob(f"{self._normalized_path.rstrip(self._sep)}{self._sep}{self._patron}"))
+
+    def _path_to_partition(self, path: str) -> str:
+        relativa = super()._path_to_partition(path)
+        return relativa.rsplit(self._sep, 1)[0] if self._sep in relativa else relativa
+
+    def load(self) -> Dict[str, ParticionEncuesta]:
+        return {
+            particion: ParticionEncuesta(cargar, huella_origen(cargar.__self__))
+            for particion, cargar in super().load().items()
+        }
+
+    def save(self, data: Dict[str, Any]) -> None:
+        raise DatasetError(f"{self.__class__.__name__} es de sólo lectura.")
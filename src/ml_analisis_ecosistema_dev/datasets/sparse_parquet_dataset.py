@@ -0,0 +1,79 @@
+"""
+``SparseParquetDataset`` guarda y carga DataFrames con columnas ``pandas.SparseDtype``
+(Parquet no las admite de forma nativa) sin materializar la matriz densa completa.
+"""
+
+import json
+from typing import Any, Dict, List
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from kedro.io.core import get_filepath_str
+from kedro_datasets.pandas import ParquetDataset
+
+CLAVE_COLUMNAS_DISPERSAS = b"ml_analisis_ecosistema_dev.columnas_dispersas"
+
+
+class SparseParquetDataset(ParquetDataset):
+    """``ParquetDataset`` que conserva las columnas dispersas.
+
+    Al guardar, las columnas dispersas se escriben por grupos de filas (densificando
+    sólo un bloque cada vez) y sus nombres quedan en los metadatos del esquema. Al
+    cargar, se vuelven a convertir a ``SparseDtype`` grupo a grupo. Un DataFrame sin
+    columnas dispersas se guarda y carga igual que con ``pandas.ParquetDataset``.
+
+    Ejemplo:
+        ```yaml
+        datos_para_modelado:
+          type: ml_analisis_ecosistema_dev.datasets.SparseParquetDataset
+          filepath: data/05_model_input/datos_para_modelado.parquet
+          filas_por_grupo: 50000
+        ```
+    """
+
+    def __init__(self, *, filas_por_grupo: int = 50_000, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._filas_por_grupo = filas_por_grupo
+
+    def _describe(self) -> Dict[str, Any]:
+        return {**super()._describe(), "filas_por_grupo": self._filas_por_grupo}
+
+    def load(self) -> pd.DataFrame:
+        load_path = get_filepath_str(self._get_load_path(), self._protocol)
+        with self._fs.open(load_path, mode="rb") as fichero:
+            parquet = pq.ParquetFile(fichero)
+            metadatos = parquet.schema_arrow.metadata or {}
+            if CLAVE_COLUMNAS_DISPERSAS not in metadatos:
+                return super().load()
+
+            dispersas: List[str] = json.loads(metadatos[CLAVE_COLUMNAS_DISPERSAS])
+            bloques = []
+            for grupo in range(parquet.num_row_groups):
+                bloque = parquet.read_row_group(grupo, columns=self._load_args.get("columns")).to_pandas()
+                tipos = {col: pd.SparseDtype(bloque[col].dtype, 0) for col in dispersas if col in bloque}
+                bloques.append(bloque.astype(tipos))
+        return pd.concat(bloques)
+
+    def save(self, data: pd.DataFrame) -> None:
+        dispersas = [col for col in data.columns if isinstance(data[col].dtype, pd.SparseDtype)]
+        if not dispersas:
+            super().save(data)
+            return
+
+        save_path = get_filepath_str(self._get_save_path(), self._protocol)
+        densos = {col: data[col].dtype.subtype for col in dispersas}
+        with self._fs.open(save_path, **self._fs_open_args_save) as fichero:
+            writer = None
+            for inicio in range(0, max(len(data), 1), self._filas_por_grupo):
+                bloque = data.iloc[inicio : inicio + self._filas_por_grupo].astype(densos)
+                tabla = pa.Table.from_pandas(bloque, preserve_index=True)
+                if writer is None:
+                    esquema = tabla.schema.with_metadata(
+                        {**tabla.schema.metadata, CLAVE_COLUMNAS_DISPERSAS: json.dumps(dispersas).encode()}
+                    )
+                    writer = pq.ParquetWriter(fichero, esquema)
+                writer.write_table(tabla.replace_schema_metadata(esquema.metadata))
+            writer.close()
+
+        self._invalidate_cache()
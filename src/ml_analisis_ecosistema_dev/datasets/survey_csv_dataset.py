@@ -0,0 +1,97 @@
+"""
+``SurveyCSVDataset`` lee los CSV crudos de las encuestas cargando sólo las columnas
+que el preprocesamiento va a usar, con tipos explícitos y el motor CSV de pyarrow.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+from kedro_datasets.pandas import CSVDataset
+
+logger = logging.getLogger(__name__)
+
+TIPOS_POR_DEFECTO = {"categoricas": "category", "numericas": "float32"}
+
+
+def columnas_requeridas(
+    columnas: Dict[str, Any], tipos: Optional[Dict[str, str]] = None
+) -> Dict[str, str]:
+    """Deduce las columnas necesarias y su tipo a partir de la configuración de preprocesamiento.
+
+    Args:
+        columnas: Diccionario con ``target_col``, ``multi_answer_cols``,
+            ``standard_categorical_cols`` y ``numeric_cols``.
+        tipos: Tipos a usar para columnas categóricas y numéricas.
+
+    Returns:
+        Un diccionario ordenado columna -> dtype.
+    """
+    tipos = {**TIPOS_POR_DEFECTO, **(tipos or {})}
+    requeridas: Dict[str, str] = {}
+    for col in [columnas["target_col"], *columnas.get("numeric_cols", [])]:
+        requeridas[col] = tipos["numericas"]
+    for col in [*columnas.get("multi_answer_cols", []), *columnas.get("standard_categorical_cols", [])]:
+        requeridas[col] = tipos["categoricas"]
+    return requeridas
+
+
+class SurveyCSVDataset(CSVDataset):
+    """``CSVDataset`` que poda columnas y fija tipos al leer.
+
+    Sin ``columnas`` se comporta igual que ``pandas.CSVDataset``.
+
+    Ejemplo:
+        ```yaml
+        datos_crudos_so_2023:
+          type: ml_analisis_ecosistema_dev.datasets.SurveyCSVDataset
+          filepath: data/01_raw/stackoverflow_2023/stack_overflow_survey_results_public.csv
+          columnas: ${globals:columnas_encuesta}
+          load_args:
+            encoding: 'utf-8-sig'
+            engine: pyarrow
+        ```
+    """
+
+    def __init__(
+        self,
+        *,
+        columnas: Optional[Dict[str, Any]] = None,
+        tipos: Optional[Dict[str, str]] = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self._columnas = columnas
+        self._tipos = tipos
+
+    def _describe(self) -> Dict[str, Any]:
+        return {**super()._describe(), "columnas": self._columnas, "tipos": self._tipos}
+
+    def _leer_cabecera(self) -> List[str]:
+        """Lee sólo la fila de cabecera del CSV."""
+        cabecera_args = {
+            k: v for k, v in self._load_args.items() if k in ("encoding", "compression", "sep")
+        }
+        return self._leer_csv(nrows=0, **cabecera_args).columns.tolist()
+
+    def _leer_csv(self, **load_args) -> pd.DataFrame:
+        load_path = str(self._get_load_path())
+        if self._protocol == "file":
+            return pd.read_csv(load_path, **load_args)
+        return pd.read_csv(
+            f"{self._protocol}://{load_path}", storage_options=self._storage_options, **load_args
+        )
+
+    def load(self) -> pd.DataFrame:
+        if not self._columnas:
+            return super().load()
+
+        requeridas = columnas_requeridas(self._columnas, self._tipos)
+        disponibles = set(self._leer_cabecera())
+        faltantes = [col for col in requeridas if col not in disponibles]
+        if faltantes:
+            logger.warning(f"Columnas solicitadas no presentes en '{self._filepath}': {faltantes}")
+        dtype = {col: tipo for col, tipo in requeridas.items() if col in disponibles}
+
+        logger.info(f"Leyendo {len(dtype)} de {len(disponibles)} columnas de '{self._filepath}'.")
+        return self._leer_csv(usecols=list(dtype), dtype=dtype, **self._load_args)
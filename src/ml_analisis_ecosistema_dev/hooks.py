@@ -0,0 +1,306 @@
+"""
+Hooks del proyecto: perfil de rendimiento de cada ejecución.
+
+``PerfilRendimientoHooks`` registra, para cada nodo, el tiempo de pared, el tiempo de CPU,
+el incremento del pico de memoria residente (RSS) y el tamaño (filas, columnas y bytes)
+de sus entradas y salidas, además del tiempo de cada carga y guardado de datasets. Al
+terminar el pipeline escribe el informe junto a ``metrics.json``:
+
+- ``data/08_reporting/rendimiento_nodos.json``: nodos y operaciones de datasets.
+- ``data/08_reporting/rendimiento_nodos.parquet``: una fila por nodo, para comparar ejecuciones.
+
+Los nodos listados en ``perfilado.perfilar_nodos`` (``parameters_reporting.yml``) se
+ejecutan además bajo ``cProfile`` o ``pyinstrument`` y su perfil se guarda en
+``data/08_reporting/perfiles/``. Las variables de entorno tienen prioridad:
+
+- ``ML_PERFILADO=0``: desactiva los hooks.
+- ``ML_PERFILAR_NODOS``: nodos a perfilar, separados por comas.
+
+El tiempo de CPU y el pico de RSS son del proceso: con ``ThreadRunner`` incluyen los
+nodos que corren a la vez, y no cuentan los workers de joblib en procesos aparte. Con
+``ParallelRunner`` cada nodo corre en otro proceso y el informe queda vacío. En los nodos
+generadores (``generador: true`` en el informe) las medidas incluyen el guardado de los
+fragmentos, que Kedro intercala con su producción.
+"""
+
+import cProfile
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+from kedro.framework.hooks import hook_impl
+from scipy import sparse
+
+from ml_analisis_ecosistema_dev.utils.memoria import pico_memoria_mb
+
+logger = logging.getLogger(__name__)
+
+FICHERO_INFORME = "rendimiento_nodos"
+
+
+def tamano_datos(data: Any) -> Optional[Dict[str, Optional[int]]]:
+    """Filas, columnas y bytes en memoria de un DataFrame, Series, array o matriz dispersa.
+
+    Devuelve ``None`` para el resto de objetos (parámetros, modelos, cargas diferidas).
+    Los bytes de las columnas ``object`` no incluyen el contenido de los strings.
+    """
+    if isinstance(data, pd.DataFrame):
+        return {"filas": len(data), "columnas": data.shape[1], "bytes": int(data.memory_usage(index=True).sum())}
+    if isinstance(data, pd.Series):
+        return {"filas": len(data), "columnas": 1, "bytes": int(data.memory_usage(index=True))}
+    if isinstance(data, np.ndarray):
+        return {
+            "filas": data.shape[0] if data.ndim else 1,
+            "columnas": data.shape[1] if data.ndim > 1 else 1,
+            "bytes": int(data.nbytes),
+        }
+    if sparse.issparse(data):
+        componentes = ("data", "indices", "indptr", "row", "col")
+        return {
+            "filas": data.shape[0],
+            "columnas": data.shape[1],
+            "bytes": int(sum(getattr(data, nombre).nbytes for nombre in componentes if hasattr(data, nombre))),
+        }
+    return None
+
+
+def _tamanos(datos: Dict[str, Any]) -> Dict[str, Dict[str, Optional[int]]]:
+    return {nombre: tamano for nombre, valor in datos.items() if (tamano := tamano_datos(valor)) is not None}
+
+
+def _total(tamanos: Dict[str, Dict[str, Optional[int]]], clave: str) -> int:
+    return int(sum(tamano[clave] or 0 for tamano in tamanos.values()))
+
+
+class PerfilRendimientoHooks:
+    """Mide cada nodo y cada carga/guardado de datasets y escribe el informe de la ejecución."""
+
+    def __init__(self, directorio: str = "data/08_reporting") -> None:
+        self._lock = threading.Lock()
+        self._en_curso: Dict[str, Dict[str, Any]] = {}
+        self._cargas: Dict[Any, float] = {}
+        self._nodos: List[Dict[str, Any]] = []
+        self._datasets: List[Dict[str, Any]] = []
+        self._activo = True
+        self._perfilar: set = set()
+        self._perfilador = "cprofile"
+        self._directorio = Path(directorio)
+
+    @hook_impl
+    def after_context_created(self, context) -> None:
+        config = context.params.get("perfilado") or {}
+        activo = os.environ.get("ML_PERFILADO", str(config.get("activo", True))).lower()
+        self._activo = activo not in ("0", "false", "no")
+        nodos = os.environ.get("ML_PERFILAR_NODOS")
+        self._perfilar = set(nodos.split(",")) if nodos else set(config.get("perfilar_nodos") or [])
+        self._perfilador = config.get("perfilador", "cprofile")
+        self._directorio = Path(context.project_path) / config.get("directorio", "data/08_reporting")
+
+    @hook_impl
+    def before_pipeline_run(self, run_params: Dict[str, Any]) -> None:
+        with self._lock:
+            self._en_curso.clear()
+            self._cargas.clear()
+            self._nodos = []
+            self._datasets = []
+
+    # --- Datasets ------------------------------------------------------------
+
+    def _clave_dataset(self, dataset_name: str, node) -> Any:
+        return (dataset_name, getattr(node, "name", None), threading.get_ident())
+
+    def _inicio_dataset(self, dataset_name: str, node) -> None:
+        if self._activo:
+            self._cargas[self._clave_dataset(dataset_name, node)] = time.perf_counter()
+
+    def _fin_dataset(self, dataset_name: str, data: Any, node, operacion: str) -> None:
+        inicio = self._cargas.pop(self._clave_dataset(dataset_name, node), None)
+        if not self._activo or inicio is None:
+            return
+        registro = {
+            "dataset": dataset_name,
+            "nodo": getattr(node, "name", None),
+            "operacion": operacion,
+            "tiempo_s": time.perf_counter() - inicio,
+            **(tamano_datos(data) or {"filas": None, "columnas": None, "bytes": None}),
+        }
+        with self._lock:
+            self._datasets.append(registro)
+
+    @hook_impl
+    def before_dataset_loaded(self, dataset_name: str, node) -> None:
+        self._inicio_dataset(dataset_name, node)
+
+    @hook_impl
+    def after_dataset_loaded(self, dataset_name: str, data: Any, node) -> None:
+        self._fin_dataset(dataset_name, data, node, "carga")
+
+    @hook_impl
+    def before_dataset_saved(self, dataset_name: str, data: Any, node) -> None:
+        self._inicio_dataset(dataset_name, node)
+
+    @hook_impl
+    def after_dataset_saved(self, dataset_name: str, data: Any, node) -> None:
+        self._fin_dataset(dataset_name, data, node, "guardado")
+
+    # --- Nodos ---------------------------------------------------------------
+
+    def _iniciar_perfil(self, nombre: str) -> Any:
+        """Arranca el perfilador configurado, o devuelve ``None`` si ya hay otro activo."""
+        if self._perfilador == "pyinstrument":
+            try:
+                from pyinstrument import Profiler
+            except ImportError:
+                logger.warning("pyinstrument no está instalado; se perfila con cProfile.")
+            else:
+                perfil = Profiler()
+                perfil.start()
+                return perfil
+        perfil = cProfile.Profile()
+        try:
+            perfil.enable()
+        except ValueError:
+            # Otro nodo perfilado en paralelo (ThreadRunner) ya tiene el perfilador del intérprete
+            logger.warning(f"No se puede perfilar '{nombre}': ya hay otro perfilador activo.")
+            return None
+        return perfil
+
+    def _guardar_perfil(self, nombre: str, perfil: Any) -> Path:
+        directorio = self._directorio / "perfiles"
+        directorio.mkdir(parents=True, exist_ok=True)
+        if isinstance(perfil, cProfile.Profile):
+            perfil.disable()
+            ruta = directorio / f"{nombre}.prof"
+            perfil.dump_stats(ruta)
+        else:
+            perfil.stop()
+            ruta = directorio / f"{nombre}.html"
+            ruta.write_text(perfil.output_html())
+        return ruta
+
+    @hook_impl
+    def before_node_run(self, node, inputs: Dict[str, Any]) -> None:
+        if not self._activo:
+            return
+        estado = {
+            "entradas": _tamanos(inputs),
+            "pico_rss_mb": pico_memoria_mb(),
+            "cpu": time.process_time(),
+            "perfil": self._iniciar_perfil(node.name) if node.name in self._perfilar else None,
+            "pared": time.perf_counter(),
+        }
+        with self._lock:
+            self._en_curso[node.name] = estado
+
+    @hook_impl
+    def after_node_run(self, node, outputs: Dict[str, Any]) -> None:
+        with self._lock:
+            estado = self._en_curso.pop(node.name, None)
+        if estado is None:
+            return
+        if outputs and all(isinstance(valor, Iterator) for valor in outputs.values()):
+            # Nodo generador: Kedro consume los fragmentos después de este hook, así que la
+            # medición termina cuando se agotan todas sus salidas
+            estado.update(pendientes=len(outputs), salidas={})
+            for nombre, valor in outputs.items():
+                outputs[nombre] = self._medir_fragmentos(node.name, nombre, valor, estado)
+            return
+        self._registrar_nodo(node.name, estado, _tamanos(outputs), generador=False)
+
+    def _medir_fragmentos(self, nodo: str, salida: str, fragmentos: Iterator, estado: Dict[str, Any]) -> Iterator:
+        """Reemite los fragmentos de ``salida`` acumulando su tamaño y cierra la medición al agotarse."""
+        acumulado: Dict[str, Optional[int]] = {"filas": 0, "columnas": None, "bytes": 0}
+        try:
+            for fragmento in fragmentos:
+                tamano = tamano_datos(fragmento)
+                if tamano is not None:
+                    acumulado["filas"] += tamano["filas"] or 0
+                    acumulado["bytes"] += tamano["bytes"] or 0
+                    acumulado["columnas"] = tamano["columnas"]
+                yield fragmento
+        except BaseException:
+            with self._lock:
+                perfil, estado["perfil"] = estado["perfil"], None
+            if perfil is not None:
+                self._guardar_perfil(nodo, perfil)
+            raise
+        with self._lock:
+            estado["salidas"][salida] = acumulado
+            estado["pendientes"] -= 1
+            terminado = estado["pendientes"] == 0
+        if terminado:
+            self._registrar_nodo(nodo, estado, estado["salidas"], generador=True)
+
+    def _registrar_nodo(
+        self, nodo: str, estado: Dict[str, Any], salidas: Dict[str, Dict[str, Optional[int]]], generador: bool
+    ) -> None:
+        pared = time.perf_counter() - estado["pared"]
+        cpu = time.process_time() - estado["cpu"]
+        perfil = self._guardar_perfil(nodo, estado["perfil"]) if estado["perfil"] is not None else None
+        pico = pico_memoria_mb()
+        registro = {
+            "nodo": nodo,
+            "tiempo_pared_s": pared,
+            "tiempo_cpu_s": cpu,
+            "delta_pico_rss_mb": pico - estado["pico_rss_mb"] if pico is not None else None,
+            "filas_entrada": _total(estado["entradas"], "filas"),
+            "bytes_entrada": _total(estado["entradas"], "bytes"),
+            "filas_salida": _total(salidas, "filas"),
+            "bytes_salida": _total(salidas, "bytes"),
+            "generador": generador,
+            "entradas": estado["entradas"],
+            "salidas": salidas,
+            "perfil": str(perfil) if perfil is not None else None,
+        }
+        with self._lock:
+            self._nodos.append(registro)
+
+    @hook_impl
+    def on_node_error(self, node) -> None:
+        with self._lock:
+            estado = self._en_curso.pop(node.name, None)
+        if estado is not None and estado["perfil"] is not None:
+            self._guardar_perfil(node.name, estado["perfil"])
+
+    # --- Informe -------------------------------------------------------------
+
+    def informe(self, run_params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Informe de la ejecución en curso o de la última terminada."""
+        run_params = run_params or {}
+        with self._lock:
+            nodos, datasets = list(self._nodos), list(self._datasets)
+        return {
+            "session_id": run_params.get("session_id"),
+            "pipeline": run_params.get("pipeline_name") or "__default__",
+            "runner": run_params.get("runner"),
+            "nucleos": os.cpu_count(),
+            "tiempo_pared_total_s": sum(nodo["tiempo_pared_s"] for nodo in nodos),
+            "nodos": nodos,
+            "datasets": datasets,
+        }
+
+    @hook_impl
+    def after_pipeline_run(self, run_params: Dict[str, Any]) -> None:
+        if not self._activo or not self._nodos:
+            return
+        informe = self.informe(run_params)
+        self._directorio.mkdir(parents=True, exist_ok=True)
+        ruta = self._directorio / f"{FICHERO_INFORME}.json"
+        ruta.write_text(json.dumps(informe, indent=2, default=str))
+        columnas = [clave for clave in informe["nodos"][0] if clave not in ("entradas", "salidas")]
+        pd.DataFrame(informe["nodos"], columns=columnas).assign(
+            session_id=informe["session_id"], pipeline=informe["pipeline"]
+        ).to_parquet(self._directorio / f"{FICHERO_INFORME}.parquet", index=False)
+
+        mas_lentos = sorted(informe["nodos"], key=lambda nodo: nodo["tiempo_pared_s"], reverse=True)[:5]
+        resumen = "\n".join(
+            f"  - {nodo['nodo']}: {nodo['tiempo_pared_s']:.2f} s pared, {nodo['tiempo_cpu_s']:.2f} s CPU"
+            for nodo in mas_lentos
+        )
+        logger.info(f"Informe de rendimiento guardado en '{ruta}'. Nodos más lentos:\n{resumen}")
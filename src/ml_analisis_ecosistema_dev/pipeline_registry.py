@@ -5,12 +5,24 @@ from kedro.pipeline import Pipeline
 from ml_analisis_ecosistema_dev.pipelines.procesamiento_de_datos import (
     create_pipeline as dp_pipeline,
 )
+from ml_analisis_ecosistema_dev.pipelines.procesamiento_incremental import (
+    create_pipeline as procesamiento_incremental_pipeline,
+)
+from ml_analisis_ecosistema_dev.pipelines.plan_cv import (
+    create_pipeline as plan_cv_pipeline,
+)
 from ml_analisis_ecosistema_dev.pipelines.regresion.pipeline import (
     create_pipeline as regresion_pipeline,
 )
 from ml_analisis_ecosistema_dev.pipelines.clasificacion.pipeline import (
     create_pipeline as clasificacion_pipeline,
 )
+from ml_analisis_ecosistema_dev.pipelines.scoring.pipeline import (
+    create_pipeline as scoring_pipeline,
+)
+from ml_analisis_ecosistema_dev.pipelines.entrenamiento_incremental import (
+    create_pipeline as entrenamiento_incremental_pipeline,
+)
 
 
 def register_pipelines() -> dict[str, Pipeline]:
@@ -19,13 +31,27 @@ def register_pipelines() -> dict[str, Pipeline]:
     Returns:
         A mapping from pipeline names to ``Pipeline`` objects.
     """
-    processing_pipeline = dp_pipeline()
+    full_processing_pipeline = dp_pipeline()
+    # Sólo los nodos necesarios para `datos_para_modelado`: las ramas de JetBrains no
+    # tienen consumidores, así que sus CSV no se leen en las ejecuciones habituales.
+    # El plan de CV se genera una sola vez junto a `datos_para_modelado` y lo consumen
+    # todos los nodos de entrenamiento de regresión y clasificación.
+    processing_pipeline = full_processing_pipeline.to_outputs("datos_para_modelado") + plan_cv_pipeline()
+    jetbrains_pipeline = full_processing_pipeline.only_nodes_with_tags("jetbrains")
     reg_pipeline = regresion_pipeline()
     clasif_pipeline = clasificacion_pipeline()
+    scor_pipeline = scoring_pipeline()
 
     return {
         "__default__": processing_pipeline,
         "procesamiento_de_datos": processing_pipeline,
+        "procesamiento_jetbrains": jetbrains_pipeline,
+        # Alternativa a `procesamiento_de_datos` que sólo reprocesa las particiones
+        # (fuente/año) nuevas o modificadas; produce los mismos datasets.
+        "procesamiento_incremental": procesamiento_incremental_pipeline() + plan_cv_pipeline(),
+        "plan_cv": plan_cv_pipeline(),
         "regresion": reg_pipeline,
         "clasificacion": clasif_pipeline,
+        "scoring": scor_pipeline,
+        "entrenamiento_incremental": entrenamiento_incremental_pipeline(),
     }
@@ -1,23 +1,31 @@
 
 """
 Nodos para el pipeline de clasificación.
+
+scikit-learn, XGBoost, LightGBM, imbalanced-learn y los módulos que dependen de ellos
+(búsqueda, cuantización, parada temprana, SMOTE con caché) se importan dentro de los
+nodos: registrar los pipelines no los carga.
 """
 import logging
+import time
+from functools import partial
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import numpy as np
 
-from sklearn.model_selection import train_test_split, GridSearchCV, StratifiedKFold
-from sklearn.linear_model import LogisticRegression
-from sklearn.svm import SVC
-from sklearn.ensemble import RandomForestClassifier
-from xgboost import XGBClassifier
-from lightgbm import LGBMClassifier
-from sklearn.metrics import (
-    accuracy_score, f1_score, precision_score, recall_score, roc_auc_score, confusion_matrix
+from ml_analisis_ecosistema_dev.pipelines.plan_cv.nodes import HOLDOUT, particion_de, validador_del_plan
+from ml_analisis_ecosistema_dev.utils.evaluacion import (
+    FILAS_POR_BLOQUE,
+    configuracion_bootstrap,
+    intervalos_bootstrap,
+    metricas_clasificacion,
+    metricas_clasificacion_ponderadas,
+    predecir_modelos,
+    solapan_con_el_mejor,
+    umbral_en_probabilidad,
 )
-from imblearn.pipeline import Pipeline as ImbPipeline
-from imblearn.over_sampling import SMOTE
+from ml_analisis_ecosistema_dev.utils.matrices import preparar_caracteristicas
+from ml_analisis_ecosistema_dev.utils.recursos import asignar_nucleos, fijar_hilos_estimador, limitar_hilos
 
 logger = logging.getLogger(__name__)
 
@@ -29,94 +37,226 @@ def create_target_variable(data: pd.DataFrame, params: Dict[str, Any]) -> pd.Dat
     logger.info(f"Variable objetivo '{params['target_col']}' creada. Distribución:\n{data_copy[params['target_col']].value_counts(normalize=True)}")
     return data_copy
 
-def split_data(data: pd.DataFrame, params: Dict[str, Any]) -> Dict[str, Any]:
-    """Divide los datos en conjuntos de entrenamiento y prueba."""
-    X = data.drop(columns=[params["target_col"]])
+def split_data(data: pd.DataFrame, params: Dict[str, Any], plan_cv: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
+    """Divide los datos en conjuntos de entrenamiento y prueba (el holdout del plan de CV, si se indica)."""
+    X = preparar_caracteristicas(data.drop(columns=[params["target_col"]]))
     y = data[params["target_col"]]
     
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=params["test_size"], random_state=params["random_state"], stratify=y
-    )
+    if plan_cv is not None:
+        es_holdout = particion_de(plan_cv, data.index) == HOLDOUT
+        X_train, X_test = X[~es_holdout], X[es_holdout]
+        y_train, y_test = y[~es_holdout], y[es_holdout]
+    else:
+        from sklearn.model_selection import train_test_split
+
+        X_train, X_test, y_train, y_test = train_test_split(
+            X, y, test_size=params["test_size"], random_state=params["random_state"], stratify=y
+        )
     return dict(X_train=X_train, X_test=X_test, y_train=y_train, y_test=y_test)
 
+def _logistic_regression(params: Dict[str, Any]):
+    from sklearn.linear_model import LogisticRegression
+    return LogisticRegression(random_state=params.get("random_state"), max_iter=1000)
+
+def _svc(params: Dict[str, Any]):
+    from sklearn.svm import SVC
+    return SVC(random_state=params.get("random_state"), probability=True)
+
+def _random_forest_classifier(params: Dict[str, Any]):
+    from sklearn.ensemble import RandomForestClassifier
+    return RandomForestClassifier(random_state=params.get("random_state"))
+
+def _xgb_classifier(params: Dict[str, Any]):
+    if params.get("cache_cuantizacion") is not None:
+        from ml_analisis_ecosistema_dev.utils.cuantizacion import XGBClassifierCuantizado as XGBClassifier
+    else:
+        from xgboost import XGBClassifier
+    return XGBClassifier(random_state=params.get("random_state"), use_label_encoder=False, eval_metric='logloss')
+
+def _lgbm_classifier(params: Dict[str, Any]):
+    cache_cuantizacion = params.get("cache_cuantizacion")
+    if cache_cuantizacion is not None:
+        from ml_analisis_ecosistema_dev.utils.cuantizacion import LGBMClassifierCuantizado
+        return LGBMClassifierCuantizado(random_state=params.get("random_state"), directorio_cache=cache_cuantizacion)
+    from lightgbm import LGBMClassifier
+    return LGBMClassifier(random_state=params.get("random_state"))
+
+# Cada fábrica importa la librería de su modelo al llamarse, no al importar este módulo
+_FABRICAS_MODELOS = {
+    "LogisticRegression": _logistic_regression,
+    "SVC": _svc,
+    "RandomForestClassifier": _random_forest_classifier,
+    "XGBClassifier": _xgb_classifier,
+    "LGBMClassifier": _lgbm_classifier,
+}
+
 def _get_model_instance(model_name: str, params: Dict[str, Any]):
-    """Retorna una instancia del modelo de clasificación."""
-    model_map = {
-        "LogisticRegression": LogisticRegression(random_state=params.get("random_state"), max_iter=1000),
-        "SVC": SVC(random_state=params.get("random_state"), probability=True),
-        "RandomForestClassifier": RandomForestClassifier(random_state=params.get("random_state")),
-        "XGBClassifier": XGBClassifier(random_state=params.get("random_state"), use_label_encoder=False, eval_metric='logloss'),
-        "LGBMClassifier": LGBMClassifier(random_state=params.get("random_state")),
-    }
-    if model_name not in model_map:
+    """Retorna una instancia del modelo de clasificación.
+
+    Con ``params["cache_cuantizacion"]`` XGBoost reutiliza el ``QuantileDMatrix`` de cada
+    fold entre candidatos y LightGBM guarda su ``Dataset`` discretizado en ese directorio.
+    Sólo se importa la librería del modelo pedido.
+    """
+    if model_name not in _FABRICAS_MODELOS:
         raise ValueError(f"Modelo '{model_name}' no soportado.")
-    return model_map[model_name]
+    return _FABRICAS_MODELOS[model_name](params)
+
+def train_classifier_with_grid_search(
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    model_name: str,
+    params: Dict[str, Any],
+    plan_cv: Optional[pd.DataFrame] = None,
+) -> Any:
+    """Entrena un clasificador usando un pipeline con SMOTE y la búsqueda configurada en ``params["search"]``.
+
+    Con ``params["cache_smote"]`` cada fold se sobremuestrea una sola vez y se comparte
+    entre candidatos y clasificadores (ver ``remuestreo.SMOTECacheado``). Con ``plan_cv``
+    se usan los folds del plan compartido en lugar de un ``StratifiedKFold`` propio. Con
+    ``params["parada_temprana"]`` los modelos de árboles eligen su número de árboles con
+    parada temprana; SMOTE se aplica entonces dentro de ``ParadaTemprana``, sólo a la parte
+    de ajuste de su validación interna.
+    """
+    from imblearn.pipeline import Pipeline as ImbPipeline
+    from sklearn.model_selection import StratifiedKFold
+
+    from ml_analisis_ecosistema_dev.pipelines.clasificacion.remuestreo import SMOTECacheado
+    from ml_analisis_ecosistema_dev.utils.busqueda import configuracion_busqueda, crear_busqueda, numero_candidatos
+    from ml_analisis_ecosistema_dev.utils.parada_temprana import (
+        admite_parada_temprana,
+        envolver_con_parada_temprana,
+        rondas_usadas,
+    )
 
-def train_classifier_with_grid_search(X_train: pd.DataFrame, y_train: pd.Series, model_name: str, params: Dict[str, Any]) -> Any:
-    """Entrena un clasificador usando un pipeline con SMOTE y GridSearchCV."""
     model = _get_model_instance(model_name, params)
     param_grid = params["models"][model_name]["param_grid"]
+    # `base` es el modelo sin envolver: recibe los hilos aunque se use parada temprana
+    base = model
+    configuracion = configuracion_busqueda(params, model_name)
+    smote = SMOTECacheado(random_state=params.get("random_state"), directorio_cache=params.get("cache_smote"))
+    pasos = [('smote', smote)]
+    parada_temprana = params.get("parada_temprana", {})
+    if parada_temprana.get("activo") and admite_parada_temprana(model_name, configuracion):
+        # SMOTE pasa dentro de `ParadaTemprana`: la validación interna se separa antes de
+        # remuestrear y no contiene filas sintéticas
+        model, param_grid = envolver_con_parada_temprana(
+            model, param_grid, parada_temprana, prefijo="model__", scoring=params.get("scoring", "f1"), remuestreo=smote
+        )
+        pasos = []
 
-    pipeline = ImbPipeline([
-        ('smote', SMOTE(random_state=params.get("random_state"))),
-        ('model', model)
-    ])
+    pipeline = ImbPipeline([*pasos, ('model', model)])
 
-    cv = StratifiedKFold(n_splits=params.get("cv_folds", 5), shuffle=True, random_state=params.get("random_state"))
+    cv = validador_del_plan(
+        plan_cv,
+        y_train.index,
+        StratifiedKFold(n_splits=params.get("cv_folds", 5), shuffle=True, random_state=params.get("random_state")),
+    )
+
+    asignacion = asignar_nucleos(
+        params.get("recursos"), numero_candidatos(param_grid, configuracion) * cv.get_n_splits()
+    )
+    if asignacion is not None:
+        fijar_hilos_estimador(base, asignacion.hilos_estimador)
+        logger.info(
+            f"Presupuesto de CPU para {model_name}: {asignacion.nucleos_nodo} núcleos "
+            f"({asignacion.n_jobs_cv} workers de CV x {asignacion.hilos_estimador} hilos por estimador)."
+        )
 
-    grid_search = GridSearchCV(
+    grid_search = crear_busqueda(
         estimator=pipeline,
         param_grid=param_grid,
         cv=cv,
         scoring=params.get("scoring", "f1"),
-        n_jobs=-1, # Revertido a -1 para usar todos los núcleos
-        verbose=1,
-        error_score='raise' # Añadido para depuración
+        configuracion=configuracion,
+        random_state=params.get("random_state"),
+        prefijo="model__",
+        n_jobs=asignacion.n_jobs_cv if asignacion is not None else -1,
     )
     
-    logger.info(f"Iniciando GridSearchCV para el clasificador {model_name}...")
-    grid_search.fit(X_train, y_train)
+    logger.info(f"Iniciando {type(grid_search).__name__} para el clasificador {model_name}...")
+    inicio = time.perf_counter()
+    with limitar_hilos(asignacion):
+        grid_search.fit(X_train, y_train)
     
     logger.info(f"Mejores parámetros para {model_name}: {grid_search.best_params_}")
+    logger.info(f"Búsqueda de {model_name} completada en {time.perf_counter() - inicio:.1f} s.")
+    if rondas_usadas(grid_search.best_estimator_) is not None:
+        logger.info(f"Árboles usados por {model_name} tras la parada temprana: {rondas_usadas(grid_search.best_estimator_)}")
     return grid_search.best_estimator_
 
-def report_and_select_best_classifier(X_test: pd.DataFrame, y_test: pd.Series, **models) -> Dict[str, Any]:
+def report_and_select_best_classifier(
+    X_test: pd.DataFrame, y_test: pd.Series, evaluacion: Optional[Dict[str, Any]] = None, **models
+) -> Dict[str, Any]:
     """
     Evalúa, reporta y selecciona el mejor modelo de clasificación.
     Guarda las matrices de confusión numéricas.
+
+    Cada modelo hace una sola pasada de `predict_proba`, a la vez y por bloques de filas
+    (`evaluacion`: `n_jobs` y `filas_por_bloque`); las etiquetas y todas las métricas
+    salen de esa probabilidad y de la matriz de confusión (utils/evaluacion.py). Los
+    modelos cuyo `predict` no es `probabilidad > 0.5` (SVC) toman las etiquetas de una
+    pasada de `predict`, para que F1 y la selección no cambien. El
+    intervalo de confianza bootstrap de F1, precisión, recall y ROC-AUC se guarda en
+    `intervalo_confianza` (`evaluacion.bootstrap`).
     """
+    from ml_analisis_ecosistema_dev.utils.parada_temprana import rondas_usadas
+
+    evaluacion = evaluacion or {}
     metrics_report = {}
     best_model = None
     best_f1 = -1
+    best_name = None
+    bootstrap = configuracion_bootstrap(evaluacion)
     confusion_matrices = {}
 
     logger.info("--- Informe de Evaluación de Modelos de Clasificación ---")
 
+    probabilidades = predecir_modelos(
+        models,
+        X_test,
+        metodo="predict_proba",
+        filas_por_bloque=evaluacion.get("filas_por_bloque") or FILAS_POR_BLOQUE,
+        n_jobs=evaluacion.get("n_jobs", -1),
+    )
+    # SVC con probability=True: sus etiquetas salen de `predict`, no de la probabilidad
+    etiquetas = predecir_modelos(
+        {nombre: modelo for nombre, modelo in models.items() if not umbral_en_probabilidad(modelo)},
+        X_test,
+        filas_por_bloque=evaluacion.get("filas_por_bloque") or FILAS_POR_BLOQUE,
+        n_jobs=evaluacion.get("n_jobs", -1),
+    )
     for model_name, model in models.items():
-        y_pred = model.predict(X_test)
-        y_proba = model.predict_proba(X_test)[:, 1]
-        
-        metrics = {
-            "accuracy": accuracy_score(y_test, y_pred),
-            "f1_score": f1_score(y_test, y_pred),
-            "precision": precision_score(y_test, y_pred),
-            "recall": recall_score(y_test, y_pred),
-            "roc_auc": roc_auc_score(y_test, y_proba),
-        }
+        metrics = metricas_clasificacion(y_test, probabilidades[model_name], etiquetas.get(model_name))
+        # Guardar como lista para serialización
+        confusion_matrices[model_name] = metrics.pop("confusion_matrix")
+        if rondas_usadas(model) is not None:
+            metrics["n_estimators_usados"] = rondas_usadas(model)
         metrics_report[model_name] = metrics
-        cm = confusion_matrix(y_test, y_pred)
-        confusion_matrices[model_name] = cm.tolist() # Guardar como lista para serialización
 
         logger.info(f"Modelo: {model_name}")
         for metric, value in metrics.items():
             logger.info(f"  - {metric.replace('_', ' ').title()}: {value:.4f}")
+
+        if bootstrap["remuestreos"]:
+            intervalo = intervalos_bootstrap(
+                partial(metricas_clasificacion_ponderadas, y_pred=etiquetas.get(model_name)),
+                y_test,
+                probabilidades[model_name],
+                **bootstrap,
+            )
+            metrics["intervalo_confianza"] = intervalo
+            logger.info(f"  - IC {intervalo['nivel']:.0%} F1: [{intervalo['f1_score'][0]:.4f}, {intervalo['f1_score'][1]:.4f}]")
         
         if metrics["f1_score"] > best_f1:
             best_f1 = metrics["f1_score"]
             best_model = model
+            best_name = model_name
 
     logger.info("--- Fin del Informe ---")
-    logger.info(f"Mejor modelo seleccionado: {type(best_model.named_steps['model']).__name__} (F1-Score: {best_f1:.4f})")
+    logger.info(f"Mejor modelo seleccionado: {type(getattr(best_model.named_steps['model'], 'estimator_', best_model.named_steps['model'])).__name__} (F1-Score: {best_f1:.4f})")
+    empatados = solapan_con_el_mejor(metrics_report, best_name, "f1_score")
+    if empatados:
+        logger.info(f"El intervalo de F1 del mejor modelo se solapa con el de: {', '.join(empatados)}")
 
     return {
         "best_classification_model": best_model,
@@ -32,7 +32,7 @@ def create_pipeline(**kwargs) -> Pipeline:
 
     split_data_node = node(
         func=split_data,
-        inputs=["data_with_target", classification_params],
+        inputs=["data_with_target", classification_params, "plan_cv"],
         outputs=dict(
             X_train="X_train_clf",
             X_test="X_test_clf",
@@ -52,6 +52,7 @@ def create_pipeline(**kwargs) -> Pipeline:
                     "y_train_clf",
                     f"params:classification_pipeline.models.{model_name}.model_name",
                     classification_params,
+                    "plan_cv",
                 ],
                 outputs=f"{model_name}_classifier",
                 name=f"train_{model_name}_classifier_node",
@@ -62,6 +63,7 @@ def create_pipeline(**kwargs) -> Pipeline:
     report_inputs = {f"{name}_classifier": f"{name}_classifier" for name in model_names}
     report_inputs["X_test"] = "X_test_clf"
     report_inputs["y_test"] = "y_test_clf"
+    report_inputs["evaluacion"] = "params:classification_pipeline.evaluacion"
 
     report_and_select_node = node(
         func=report_and_select_best_classifier,
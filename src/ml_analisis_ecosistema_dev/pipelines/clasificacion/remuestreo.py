@@ -0,0 +1,100 @@
+"""
+SMOTE con caché en disco: cada fold de entrenamiento se sobremuestrea una sola vez y el
+resultado se reutiliza entre candidatos de la búsqueda y entre los nodos de clasificación.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from imblearn.over_sampling import SMOTE
+from scipy import sparse
+
+from ml_analisis_ecosistema_dev.datasets import MatrizMemmapDataset
+from ml_analisis_ecosistema_dev.utils.cache import bloqueo, huella_datos, marcar_uso, podar_cache
+
+logger = logging.getLogger(__name__)
+
+# Parámetros que no cambian el resultado del remuestreo
+PARAMETROS_NO_CLAVE = ("directorio_cache", "n_jobs")
+
+
+class SMOTECacheado(SMOTE):
+    """``SMOTE`` que guarda cada remuestreo en ``directorio_cache``.
+
+    La clave combina la huella del fold recibido (datos y etiquetas, que fijan los índices
+    del fold) con los parámetros de SMOTE. Como la clave no depende del clasificador, los
+    candidatos de ``GridSearchCV`` y los cuatro nodos de entrenamiento comparten las
+    entradas. El resultado se carga mapeado en memoria con ``MatrizMemmapDataset``. Tras
+    cada entrada nueva se podan las menos usadas (``utils.cache.podar_cache``).
+
+    Sin ``directorio_cache`` o con un ``random_state`` no entero (no reproducible) se
+    comporta exactamente como ``SMOTE``.
+    """
+
+    _parameter_constraints: dict = {**SMOTE._parameter_constraints, "directorio_cache": [str, None]}
+
+    def __init__(
+        self,
+        *,
+        sampling_strategy="auto",
+        random_state=None,
+        k_neighbors=5,
+        n_jobs=None,
+        directorio_cache: Optional[str] = None,
+    ) -> None:
+        super().__init__(
+            sampling_strategy=sampling_strategy, random_state=random_state, k_neighbors=k_neighbors, n_jobs=n_jobs
+        )
+        self.directorio_cache = directorio_cache
+
+    def _clave(self, X: Any, y: Any) -> str:
+        parametros: Dict[str, Any] = {
+            nombre: repr(valor)
+            for nombre, valor in sorted(self.get_params().items())
+            if nombre not in PARAMETROS_NO_CLAVE
+        }
+        return hashlib.blake2b((huella_datos(X, y) + json.dumps(parametros)).encode(), digest_size=16).hexdigest()
+
+    def fit_resample(self, X, y, **params) -> Tuple[Any, Any]:
+        if self.directorio_cache is None or not isinstance(self.random_state, (int, np.integer)):
+            return super().fit_resample(X, y, **params)
+
+        clave = self._clave(X, y)
+        entrada = Path(self.directorio_cache) / clave
+        with bloqueo(Path(self.directorio_cache) / f"{clave}.lock"):
+            if (entrada / "y.npy").exists():
+                logger.debug(f"SMOTE caché HIT {clave}")
+                marcar_uso(entrada)
+                return self._cargar(entrada, X, y)
+
+            logger.debug(f"SMOTE caché MISS {clave}")
+            X_res, y_res = super().fit_resample(X, y, **params)
+            self._guardar(entrada, X_res, y_res)
+        podar_cache(Path(self.directorio_cache))
+        # También en un MISS se devuelve la copia guardada (float32), idéntica a la de los HIT
+        return self._cargar(entrada, X, y)
+
+    @staticmethod
+    def _guardar(entrada: Path, X_res: Any, y_res: Any) -> None:
+        MatrizMemmapDataset(filepath=str(entrada / "X")).save(X_res if sparse.issparse(X_res) else pd.DataFrame(X_res))
+        # `y.npy` se escribe al final y de forma atómica: su presencia marca la entrada completa
+        temporal = entrada / f"y.{os.getpid()}.npy"
+        np.save(temporal, np.asarray(y_res))
+        os.replace(temporal, entrada / "y.npy")
+
+    @staticmethod
+    def _cargar(entrada: Path, X: Any, y: Any) -> Tuple[Any, Any]:
+        # Se devuelve el mismo tipo que devolvería SMOTE para la entrada recibida
+        X_res = MatrizMemmapDataset(filepath=str(entrada / "X")).load()
+        if isinstance(X, np.ndarray):
+            X_res = X_res.to_numpy()
+        y_res = np.load(entrada / "y.npy")
+        if isinstance(y, pd.Series):
+            y_res = pd.Series(y_res, name=y.name)
+        return X_res, y_res
@@ -0,0 +1,10 @@
+"""
+Pipeline 'entrenamiento_incremental': regresor y clasificador lineales entrenados con
+``partial_fit`` leyendo `datos_para_modelado` por lotes, con memoria acotada.
+"""
+
+from .pipeline import create_pipeline
+
+__all__ = ["create_pipeline"]
+
+__version__ = "0.1"
@@ -0,0 +1,254 @@
+"""
+Nodos para el pipeline `entrenamiento_incremental`.
+
+`datos_para_modelado` se recorre por lotes (grupos de filas del Parquet) en lugar de
+cargarse entero: una primera pasada acumula las estadísticas del escalado, del objetivo y
+de las clases sobre las filas de entrenamiento del plan de CV, y después cada época
+ajusta un ``SGDRegressor`` / ``SGDClassifier`` con ``partial_fit`` lote a lote. La
+memoria queda acotada por el tamaño del lote, no por el de la encuesta.
+
+La codificación one-hot ya viene aplicada por el preprocesador persistido, así que las
+estadísticas incrementales son las de ``StandardScaler`` sobre las columnas finales.
+"""
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ml_analisis_ecosistema_dev.pipelines.plan_cv.nodes import HOLDOUT, particion_de
+from ml_analisis_ecosistema_dev.utils.memoria import pico_memoria_mb
+
+if TYPE_CHECKING:
+    # scikit-learn se importa en los nodos: registrar los pipelines no lo carga
+    from sklearn.linear_model import SGDClassifier, SGDRegressor
+    from sklearn.preprocessing import StandardScaler
+
+logger = logging.getLogger(__name__)
+
+# Intervalos del histograma de probabilidades con el que se aproxima el ROC-AUC del holdout
+INTERVALOS_ROC = 10_000
+
+
+def _pico_memoria() -> str:
+    pico = pico_memoria_mb()
+    return "n/d" if pico is None else f"{pico:,.0f} MB"
+
+
+def _lotes_de_modelado(
+    lotes: Iterable[pd.DataFrame], plan_cv: pd.DataFrame, target_col: str
+) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray, pd.Index]]:
+    """Recorre los lotes devolviendo (X, y, partición del plan, columnas de X)."""
+    for lote in lotes:
+        particion = particion_de(plan_cv, lote.index)
+        X = lote.drop(columns=[target_col])
+        yield X.to_numpy(dtype=np.float64), lote[target_col].to_numpy(dtype=np.float64), particion, X.columns
+
+
+def calcular_estadisticas_incrementales(
+    lotes: Iterable[pd.DataFrame], plan_cv: pd.DataFrame, params: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Primera pasada: estadísticas de las filas de entrenamiento, lote a lote.
+
+    Args:
+        lotes: Lotes de `datos_para_modelado` (``ChunkedTableDataset``).
+        plan_cv: Plan de CV; las filas del holdout no entran en las estadísticas.
+        params: Diccionario con target_col y salary_threshold.
+
+    Returns:
+        Un diccionario con el ``StandardScaler`` ajustado con ``partial_fit``, la media y
+        la desviación típica del objetivo, el número de filas por clase y las columnas.
+    """
+    from sklearn.preprocessing import StandardScaler
+
+    escalador = StandardScaler()
+    n, suma, suma_cuadrados = 0, 0.0, 0.0
+    conteo_clases = np.zeros(2, dtype=np.int64)
+    columnas = None
+
+    for X, y, particion, columnas in _lotes_de_modelado(lotes, plan_cv, params["target_col"]):
+        entrenamiento = particion != HOLDOUT
+        if not entrenamiento.any():
+            continue
+        X, y = X[entrenamiento], y[entrenamiento]
+        escalador.partial_fit(X)
+        n += len(y)
+        suma += y.sum()
+        suma_cuadrados += np.square(y).sum()
+        conteo_clases += np.bincount((y > params["salary_threshold"]).astype(int), minlength=2)
+
+    if n == 0:
+        raise ValueError("No hay filas de entrenamiento en `datos_para_modelado` según el plan de CV.")
+    media = suma / n
+    desviacion = float(np.sqrt(max(suma_cuadrados / n - media**2, 0.0))) or 1.0
+    logger.info(f"Estadísticas incrementales: {n} filas de entrenamiento, clases {conteo_clases.tolist()}.")
+    return {
+        "escalador": escalador,
+        "media_objetivo": float(media),
+        "desviacion_objetivo": desviacion,
+        "conteo_clases": conteo_clases.tolist(),
+        "columnas": list(columnas),
+    }
+
+
+def _pesos_de_clase(conteo_clases: list, class_weight: Any) -> Any:
+    """Equivalente de ``class_weight="balanced"`` a partir de los conteos de la primera pasada
+    (``partial_fit`` no admite "balanced" porque no ve todas las clases a la vez)."""
+    if class_weight != "balanced":
+        return class_weight
+    conteo = np.asarray(conteo_clases, dtype=np.float64)
+    return {clase: float(conteo.sum() / (len(conteo) * c)) for clase, c in enumerate(conteo) if c > 0}
+
+
+def _ajustar_por_epocas(
+    modelo: Any,
+    lotes: Iterable[pd.DataFrame],
+    plan_cv: pd.DataFrame,
+    estadisticas: Dict[str, Any],
+    params: Dict[str, Any],
+    objetivo,
+    **fit_params,
+) -> None:
+    """Ajusta ``modelo`` con ``partial_fit`` durante ``params["epocas"]`` pasadas por los lotes.
+
+    Las filas de cada lote se barajan antes de ajustar; ``objetivo`` transforma el objetivo
+    en bruto en el que recibe el modelo.
+    """
+    rng = np.random.default_rng(params.get("random_state"))
+    escalador = estadisticas["escalador"]
+    for epoca in range(params["epocas"]):
+        inicio = time.perf_counter()
+        filas = 0
+        for X, y, particion, _ in _lotes_de_modelado(lotes, plan_cv, params["target_col"]):
+            posiciones = np.flatnonzero(particion != HOLDOUT)
+            if len(posiciones) == 0:
+                continue
+            rng.shuffle(posiciones)
+            modelo.partial_fit(escalador.transform(X[posiciones]), objetivo(y[posiciones]), **fit_params)
+            filas += len(posiciones)
+        logger.info(f"  Época {epoca + 1}/{params['epocas']}: {filas} filas en {time.perf_counter() - inicio:.2f} s.")
+
+
+def _deshacer_escalado(modelo: Any, escalador: "StandardScaler", columnas: list, escala=1.0, desplazamiento=0.0) -> None:
+    """Integra el escalado de X (y opcionalmente del objetivo) en ``coef_`` e ``intercept_``,
+    de modo que el modelo reciba directamente las columnas de `datos_para_modelado`."""
+    coef = modelo.coef_ / escalador.scale_
+    modelo.intercept_ = escala * (modelo.intercept_ - coef @ escalador.mean_) + desplazamiento
+    modelo.coef_ = escala * coef
+    modelo.feature_names_in_ = np.asarray(columnas, dtype=object)
+
+
+def entrenar_regresor_incremental(
+    lotes: Iterable[pd.DataFrame], plan_cv: pd.DataFrame, estadisticas: Dict[str, Any], params: Dict[str, Any]
+) -> "SGDRegressor":
+    """Entrena un ``SGDRegressor`` por épocas sobre el objetivo estandarizado.
+
+    Returns:
+        El regresor con el escalado integrado en los coeficientes: predice salarios a
+        partir de las columnas sin escalar, igual que los modelos del pipeline `regresion`.
+    """
+    from sklearn.linear_model import SGDRegressor
+
+    logger.info("--- Entrenando SGDRegressor incremental ---")
+    modelo = SGDRegressor(random_state=params.get("random_state"), **params.get("regresor", {}))
+    media, desviacion = estadisticas["media_objetivo"], estadisticas["desviacion_objetivo"]
+    _ajustar_por_epocas(modelo, lotes, plan_cv, estadisticas, params, lambda y: (y - media) / desviacion)
+    _deshacer_escalado(modelo, estadisticas["escalador"], estadisticas["columnas"], desviacion, media)
+    logger.info(f"SGDRegressor entrenado. Pico de memoria: {_pico_memoria()}.")
+    return modelo
+
+
+def entrenar_clasificador_incremental(
+    lotes: Iterable[pd.DataFrame], plan_cv: pd.DataFrame, estadisticas: Dict[str, Any], params: Dict[str, Any]
+) -> "SGDClassifier":
+    """Entrena un ``SGDClassifier`` por épocas para el grupo salarial (objetivo > ``salary_threshold``).
+
+    El desbalanceo se compensa con pesos de clase calculados en la primera pasada, en lugar
+    de SMOTE, que necesitaría todas las filas en memoria.
+    """
+    from sklearn.linear_model import SGDClassifier
+
+    logger.info("--- Entrenando SGDClassifier incremental ---")
+    configuracion = dict(params.get("clasificador", {}))
+    pesos = _pesos_de_clase(estadisticas["conteo_clases"], configuracion.pop("class_weight", None))
+    modelo = SGDClassifier(random_state=params.get("random_state"), class_weight=pesos, **configuracion)
+    umbral = params["salary_threshold"]
+    _ajustar_por_epocas(
+        modelo, lotes, plan_cv, estadisticas, params, lambda y: (y > umbral).astype(int), classes=np.array([0, 1])
+    )
+    _deshacer_escalado(modelo, estadisticas["escalador"], estadisticas["columnas"])
+    logger.info(f"SGDClassifier entrenado. Pico de memoria: {_pico_memoria()}.")
+    return modelo
+
+
+def _lotes_de_holdout(lotes: Iterable[pd.DataFrame], plan_cv: pd.DataFrame, target_col: str):
+    for X, y, particion, columnas in _lotes_de_modelado(lotes, plan_cv, target_col):
+        holdout = particion == HOLDOUT
+        if holdout.any():
+            yield pd.DataFrame(X[holdout], columns=columnas), y[holdout]
+
+
+def evaluar_regresor_incremental(
+    lotes: Iterable[pd.DataFrame], plan_cv: pd.DataFrame, model: "SGDRegressor", params: Dict[str, Any]
+) -> Dict[str, Any]:
+    """RMSE, MAE y R² sobre el holdout del plan, acumulando sumas lote a lote."""
+    n, suma_cuadrados_error, suma_abs_error, suma, suma_cuadrados = 0, 0.0, 0.0, 0.0, 0.0
+    for X, y in _lotes_de_holdout(lotes, plan_cv, params["target_col"]):
+        error = y - model.predict(X)
+        n += len(y)
+        suma_cuadrados_error += np.square(error).sum()
+        suma_abs_error += np.abs(error).sum()
+        suma += y.sum()
+        suma_cuadrados += np.square(y).sum()
+
+    if n == 0:
+        raise ValueError("No hay filas de holdout en `datos_para_modelado` según el plan de CV.")
+    varianza_total = suma_cuadrados - suma**2 / n
+    metrics = {
+        "rmse": float(np.sqrt(suma_cuadrados_error / n)),
+        "mae": float(suma_abs_error / n),
+        "r2": float(1 - suma_cuadrados_error / varianza_total) if varianza_total > 0 else 0.0,
+    }
+    logger.info(f"SGDRegressor incremental en el holdout ({n} filas): {metrics}")
+    return {"SGDRegressor": metrics}
+
+
+def _roc_auc_histograma(positivos: np.ndarray, negativos: np.ndarray) -> float:
+    """ROC-AUC a partir de histogramas de probabilidad por clase (los empates dentro de un
+    intervalo cuentan como la mitad, como en ``roc_auc_score``)."""
+    negativos_por_debajo = np.concatenate([[0], np.cumsum(negativos)[:-1]])
+    return float((positivos * (negativos_por_debajo + 0.5 * negativos)).sum() / (positivos.sum() * negativos.sum()))
+
+
+def evaluar_clasificador_incremental(
+    lotes: Iterable[pd.DataFrame], plan_cv: pd.DataFrame, model: "SGDClassifier", params: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Accuracy, F1, precisión y recall (matriz de confusión acumulada) y ROC-AUC
+    (histogramas de ``INTERVALOS_ROC`` intervalos) sobre el holdout, lote a lote."""
+    confusion = np.zeros((2, 2), dtype=np.int64)
+    histogramas = np.zeros((2, INTERVALOS_ROC), dtype=np.int64)
+    for X, y in _lotes_de_holdout(lotes, plan_cv, params["target_col"]):
+        real = (y > params["salary_threshold"]).astype(int)
+        probabilidad = model.predict_proba(X)[:, 1]
+        predicha = (probabilidad > 0.5).astype(int)
+        confusion += np.bincount(2 * real + predicha, minlength=4).reshape(2, 2)
+        intervalo = np.minimum((probabilidad * INTERVALOS_ROC).astype(int), INTERVALOS_ROC - 1)
+        for clase in (0, 1):
+            histogramas[clase] += np.bincount(intervalo[real == clase], minlength=INTERVALOS_ROC)
+
+    if confusion.sum() == 0:
+        raise ValueError("No hay filas de holdout en `datos_para_modelado` según el plan de CV.")
+    (vn, fp), (fn, vp) = confusion
+    precision = vp / (vp + fp) if vp + fp else 0.0
+    recall = vp / (vp + fn) if vp + fn else 0.0
+    metrics = {
+        "accuracy": float((vp + vn) / confusion.sum()),
+        "f1_score": float(2 * precision * recall / (precision + recall)) if precision + recall else 0.0,
+        "precision": float(precision),
+        "recall": float(recall),
+        "roc_auc": _roc_auc_histograma(histogramas[1], histogramas[0]),
+        "confusion_matrix": confusion.tolist(),
+    }
+    logger.info(f"SGDClassifier incremental en el holdout ({int(confusion.sum())} filas): {metrics}")
+    return {"SGDClassifier": metrics}
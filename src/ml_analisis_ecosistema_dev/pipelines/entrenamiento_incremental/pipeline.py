@@ -0,0 +1,69 @@
+"""
+Pipeline de entrenamiento fuera de memoria para los modelos lineales (SGD).
+"""
+
+from kedro.pipeline import Pipeline, node, pipeline
+from .nodes import (
+    calcular_estadisticas_incrementales,
+    entrenar_clasificador_incremental,
+    entrenar_regresor_incremental,
+    evaluar_clasificador_incremental,
+    evaluar_regresor_incremental,
+)
+
+
+def create_pipeline(**kwargs) -> Pipeline:
+    return pipeline(
+        [
+            node(
+                func=calcular_estadisticas_incrementales,
+                inputs=["datos_para_modelado_por_lotes", "plan_cv", "params:entrenamiento_incremental"],
+                outputs="estadisticas_incrementales",
+                name="calcular_estadisticas_incrementales_node",
+            ),
+            node(
+                func=entrenar_regresor_incremental,
+                inputs=[
+                    "datos_para_modelado_por_lotes",
+                    "plan_cv",
+                    "estadisticas_incrementales",
+                    "params:entrenamiento_incremental",
+                ],
+                outputs="regresion_model_incremental",
+                name="entrenar_regresor_incremental_node",
+            ),
+            node(
+                func=entrenar_clasificador_incremental,
+                inputs=[
+                    "datos_para_modelado_por_lotes",
+                    "plan_cv",
+                    "estadisticas_incrementales",
+                    "params:entrenamiento_incremental",
+                ],
+                outputs="clasificacion_model_incremental",
+                name="entrenar_clasificador_incremental_node",
+            ),
+            node(
+                func=evaluar_regresor_incremental,
+                inputs=[
+                    "datos_para_modelado_por_lotes",
+                    "plan_cv",
+                    "regresion_model_incremental",
+                    "params:entrenamiento_incremental",
+                ],
+                outputs="metrics_incremental",
+                name="evaluar_regresor_incremental_node",
+            ),
+            node(
+                func=evaluar_clasificador_incremental,
+                inputs=[
+                    "datos_para_modelado_por_lotes",
+                    "plan_cv",
+                    "clasificacion_model_incremental",
+                    "params:entrenamiento_incremental",
+                ],
+                outputs="metrics_clf_incremental",
+                name="evaluar_clasificador_incremental_node",
+            ),
+        ]
+    )
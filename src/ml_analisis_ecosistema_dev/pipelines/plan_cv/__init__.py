@@ -0,0 +1,10 @@
+"""
+Pipeline 'plan_cv': partición holdout y folds de validación cruzada compartidos por los
+pipelines de regresión y clasificación.
+"""
+
+from .pipeline import create_pipeline
+
+__all__ = ["create_pipeline"]
+
+__version__ = "0.1"
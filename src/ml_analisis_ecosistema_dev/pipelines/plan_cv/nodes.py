@@ -0,0 +1,76 @@
+"""
+Nodos para el pipeline `plan_cv`.
+"""
+import logging
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Valor de `particion` de las filas reservadas para la evaluación final
+HOLDOUT = -1
+
+
+def crear_plan_cv(data: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
+    """Asigna cada fila de ``datos_para_modelado`` al holdout o a un fold de CV.
+
+    El holdout y los folds se estratifican por el grupo salarial (objetivo por encima de
+    ``umbral_estratificacion``), de modo que el mismo plan sirve a la regresión y a la
+    clasificación y ambas evalúan sobre las mismas filas.
+
+    Args:
+        data: DataFrame de entrada (sólo se usa la columna objetivo).
+        params: Diccionario con target_col, umbral_estratificacion, test_size, cv_folds
+            y random_state.
+
+    Returns:
+        Un DataFrame con el índice de ``data`` y una columna ``particion`` ``int8``:
+        ``-1`` para el holdout y ``0..cv_folds-1`` para el fold de validación.
+    """
+    from sklearn.model_selection import StratifiedKFold, train_test_split
+
+    grupo = (data[params["target_col"]] > params["umbral_estratificacion"]).to_numpy()
+    posiciones = np.arange(len(data))
+    entrenamiento, _ = train_test_split(
+        posiciones, test_size=params["test_size"], random_state=params["random_state"], stratify=grupo
+    )
+
+    particion = np.full(len(data), HOLDOUT, dtype=np.int8)
+    folds = StratifiedKFold(n_splits=params["cv_folds"], shuffle=True, random_state=params["random_state"])
+    for fold, (_, validacion) in enumerate(folds.split(entrenamiento, grupo[entrenamiento])):
+        particion[entrenamiento[validacion]] = fold
+
+    plan = pd.DataFrame({"particion": particion}, index=data.index)
+    logger.info(
+        f"Plan de CV creado: {len(entrenamiento)} filas de entrenamiento en {params['cv_folds']} folds "
+        f"y {len(data) - len(entrenamiento)} de holdout."
+    )
+    return plan
+
+
+def particion_de(plan_cv: pd.DataFrame, index: pd.Index) -> np.ndarray:
+    """Particiones del plan para las filas de ``index``, comprobando que el plan está al día."""
+    particion = plan_cv["particion"].reindex(index)
+    if particion.isna().any():
+        raise ValueError(
+            "El plan de CV no cubre todas las filas de los datos de modelado; "
+            "vuelva a ejecutar el pipeline 'procesamiento_de_datos'."
+        )
+    return particion.to_numpy(dtype=np.int8)
+
+
+def validador_del_plan(plan_cv: Optional[pd.DataFrame], index: pd.Index, respaldo: Any) -> Any:
+    """``PredefinedSplit`` con los folds del plan para las filas de entrenamiento ``index``.
+
+    Sin plan devuelve ``respaldo`` (el ``KFold``/``StratifiedKFold`` propio del nodo).
+    """
+    if plan_cv is None:
+        return respaldo
+    from sklearn.model_selection import PredefinedSplit
+
+    folds = particion_de(plan_cv, index)
+    if (folds == HOLDOUT).any():
+        raise ValueError("Las filas de entrenamiento incluyen filas del holdout del plan de CV.")
+    return PredefinedSplit(folds)
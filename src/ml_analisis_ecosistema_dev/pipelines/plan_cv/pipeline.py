@@ -0,0 +1,19 @@
+"""
+Pipeline que genera el plan de validación cruzada a partir de `datos_para_modelado`.
+"""
+
+from kedro.pipeline import Pipeline, node, pipeline
+from .nodes import crear_plan_cv
+
+
+def create_pipeline(**kwargs) -> Pipeline:
+    return pipeline(
+        [
+            node(
+                func=crear_plan_cv,
+                inputs=["datos_para_modelado", "params:plan_cv"],
+                outputs="plan_cv",
+                name="crear_plan_cv_node",
+            ),
+        ]
+    )
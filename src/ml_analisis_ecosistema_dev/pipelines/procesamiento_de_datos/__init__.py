@@ -3,8 +3,15 @@ This is a boilerplate pipeline 'procesamiento_de_datos'
 generated using Kedro 1.0.0
 """
 
-from .pipeline import create_pipeline
-
 __all__ = ["create_pipeline"]
 
+
+def __getattr__(nombre: str):
+    # `pipeline` importa Kedro: el servicio y los jobs de scoring sólo usan los nodos
+    if nombre == "create_pipeline":
+        from .pipeline import create_pipeline
+
+        return create_pipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+
 __version__ = "0.1"
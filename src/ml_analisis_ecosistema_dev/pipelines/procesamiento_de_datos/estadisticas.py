@@ -0,0 +1,271 @@
+"""
+Estadísticas parciales y combinables del procesamiento de datos.
+
+Cada partición de la encuesta (una fuente y un año), o cada bloque de filas de un DataFrame,
+produce sus propias estadísticas, y las piezas globales del procesamiento se obtienen
+combinándolas sin volver a leer los datos:
+
+- ``contar_nulos`` / ``ResumenParticion``: nulos exactos por columna y un
+  ``BocetoCuantiles`` del objetivo, que fijan las columnas a eliminar por nulos y los
+  límites IQR de outliers.
+- ``MomentosParticion``: momentos de las columnas numéricas, filas por token de respuesta
+  múltiple y categorías observadas, que fijan los vocabularios y el escalado del
+  ``PreprocesadorAllowlist``. Dependen de los filtros globales, así que se calculan sobre
+  las filas que los superan.
+"""
+
+import math
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import reduce
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Con capacidad k, el error de rango normalizado de KLL es ~1.65/k (99 % de confianza) en
+# la implementación de referencia; esta variante sin compactación perezosa usa 2.0/k
+CONSTANTE_ERROR_KLL = 2.0
+# Razón entre la capacidad de un nivel y la del siguiente
+RAZON_NIVELES_KLL = 2 / 3
+
+
+def _nulos_bloque(df: pd.DataFrame, filas_por_bloque: int) -> pd.Series:
+    conteo = pd.Series(0, index=df.columns, dtype=np.int64)
+    for inicio in range(0, len(df), filas_por_bloque):
+        conteo += df.iloc[inicio : inicio + filas_por_bloque].isnull().sum()
+    return conteo
+
+
+def contar_nulos(
+    df: pd.DataFrame, filas_por_bloque: int = 100_000, n_hilos: int = 1, columnas_por_bloque: Optional[int] = None
+) -> pd.Series:
+    """Nulos exactos por columna, recorriendo ``df`` por bloques de filas para no crear la
+    máscara booleana completa.
+
+    Con ``n_hilos > 1`` las columnas se reparten en bloques (``columnas_por_bloque``, por
+    defecto uno por hilo) que se cuentan en un pool de hilos: ``isnull`` sobre columnas
+    numéricas y categóricas libera el GIL. Los conteos se reúnen en el orden de las
+    columnas, así que el resultado no depende del orden en que terminan los hilos.
+    """
+    if n_hilos <= 1 or df.shape[1] < 2:
+        return _nulos_bloque(df, filas_por_bloque)
+    tamano = columnas_por_bloque or math.ceil(df.shape[1] / n_hilos)
+    bloques = [df.iloc[:, inicio : inicio + tamano] for inicio in range(0, df.shape[1], tamano)]
+    with ThreadPoolExecutor(max_workers=n_hilos) as pool:
+        return pd.concat(list(pool.map(lambda bloque: _nulos_bloque(bloque, filas_por_bloque), bloques)))
+
+
+class BocetoCuantiles:
+    """Boceto KLL de cuantiles: se actualiza bloque a bloque y se combina con el de otros
+    bloques o particiones, con memoria ``O(k)`` independiente del número de valores.
+
+    ``error`` es el error de rango normalizado admitido (``0.001``: el cuantil devuelto está
+    a menos de un 0,1 % de las filas del exacto, con un 99 % de confianza). Con
+    ``error=None`` se guardan todos los valores y los cuantiles son exactos; también lo son
+    mientras no se supere la capacidad del primer nivel. En modo exacto los cuantiles se
+    interpolan igual que ``Series.quantile``.
+
+    Las compactaciones eligen la mitad par o impar con un generador con ``semilla``, de modo
+    que el resultado es reproducible para un mismo orden de actualizaciones y combinaciones.
+    """
+
+    def __init__(self, error: Optional[float] = 0.001, semilla: int = 0) -> None:
+        self.error = error
+        self.k = None if error is None else max(8, math.ceil(CONSTANTE_ERROR_KLL / error))
+        self.n = 0
+        self.niveles: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(semilla)
+
+    def _capacidad(self, nivel: int) -> int:
+        return max(2, math.ceil(self.k * RAZON_NIVELES_KLL ** (len(self.niveles) - 1 - nivel)))
+
+    def _compactar(self) -> None:
+        if self.k is None:
+            return
+        nivel = 0
+        while nivel < len(self.niveles):
+            valores = self.niveles[nivel]
+            if len(valores) <= self._capacidad(nivel):
+                nivel += 1
+                continue
+            valores = np.sort(valores)
+            # Un valor sobrante (longitud impar) se queda en el nivel con su peso
+            pares = len(valores) - len(valores) % 2
+            self.niveles[nivel] = valores[pares:]
+            if nivel + 1 == len(self.niveles):
+                self.niveles.append(np.empty(0))
+            promovidos = valores[:pares][self._rng.integers(2) :: 2]
+            self.niveles[nivel + 1] = np.concatenate([self.niveles[nivel + 1], promovidos])
+            # Añadir un nivel reduce la capacidad de los inferiores: se revisa desde el principio
+            nivel = 0
+
+    def actualizar(self, valores: Iterable[float]) -> "BocetoCuantiles":
+        """Añade un bloque de valores (los nulos se ignoran)."""
+        valores = np.asarray(valores, dtype=np.float64)
+        valores = valores[~np.isnan(valores)]
+        self.n += len(valores)
+        self.niveles[0] = np.concatenate([self.niveles[0], valores])
+        self._compactar()
+        return self
+
+    def combinar(self, otro: "BocetoCuantiles") -> "BocetoCuantiles":
+        """Boceto de la unión de los valores de ``self`` y ``otro`` (no modifica ninguno)."""
+        # La semilla depende sólo de los tamaños: el resultado no depende del estado previo
+        combinado = BocetoCuantiles(error=self.error, semilla=self.n * 1_000_003 + otro.n)
+        combinado.n = self.n + otro.n
+        profundidad = max(len(self.niveles), len(otro.niveles))
+        combinado.niveles = [
+            np.concatenate([b.niveles[h] if h < len(b.niveles) else np.empty(0) for b in (self, otro)])
+            for h in range(profundidad)
+        ]
+        combinado._compactar()
+        return combinado
+
+    @property
+    def es_exacto(self) -> bool:
+        return all(len(nivel) == 0 for nivel in self.niveles[1:])
+
+    def cuantil(self, q: float) -> float:
+        if self.n == 0:
+            return float("nan")
+        if self.es_exacto:
+            return float(np.quantile(self.niveles[0], q))
+        valores = np.concatenate(self.niveles)
+        pesos = np.concatenate([np.full(len(nivel), 2.0**h) for h, nivel in enumerate(self.niveles)])
+        orden = np.argsort(valores, kind="stable")
+        acumulado = np.cumsum(pesos[orden])
+        posicion = min(np.searchsorted(acumulado, q * self.n, side="left"), len(valores) - 1)
+        return float(valores[orden][posicion])
+
+
+def boceto_de_columna(serie: pd.Series, error: Optional[float], filas_por_bloque: int = 100_000) -> BocetoCuantiles:
+    """``BocetoCuantiles`` de una columna, alimentado por bloques de filas."""
+    boceto = BocetoCuantiles(error=error)
+    for inicio in range(0, len(serie), filas_por_bloque):
+        bloque = serie.iloc[inicio : inicio + filas_por_bloque]
+        boceto.actualizar(bloque.to_numpy(dtype=np.float64, na_value=np.nan))
+    return boceto
+
+
+def limites_iqr(boceto: BocetoCuantiles, factor: float = 1.5) -> Tuple[float, float]:
+    """Límites ``[Q1 - factor·IQR, Q3 + factor·IQR]`` a partir del boceto del objetivo."""
+    q1, q3 = boceto.cuantil(0.25), boceto.cuantil(0.75)
+    iqr = q3 - q1
+    return q1 - factor * iqr, q3 + factor * iqr
+
+
+@dataclass
+class ResumenParticion:
+    """Estadísticas de una partición cruda que no dependen del resto de particiones."""
+
+    huella: str
+    n_filas: int
+    nulos: Dict[str, int]
+    boceto_objetivo: BocetoCuantiles
+
+
+def resumir_particion(
+    df: pd.DataFrame, target_col: str, huella: str, error: Optional[float] = None, filas_por_bloque: int = 100_000
+) -> ResumenParticion:
+    """Nulos por columna (sobre todas las filas) y boceto de cuantiles del objetivo."""
+    return ResumenParticion(
+        huella=huella,
+        n_filas=len(df),
+        nulos={col: int(n) for col, n in contar_nulos(df, filas_por_bloque).items()},
+        boceto_objetivo=boceto_de_columna(df[target_col], error, filas_por_bloque),
+    )
+
+
+def proporcion_nulos(resumenes: Sequence[ResumenParticion]) -> pd.Series:
+    """Proporción global de nulos por columna; una columna ausente en una partición cuenta
+    como nula en todas sus filas."""
+    columnas = list(dict.fromkeys(col for resumen in resumenes for col in resumen.nulos))
+    total = sum(resumen.n_filas for resumen in resumenes)
+    nulos = [sum(resumen.nulos.get(col, resumen.n_filas) for resumen in resumenes) for col in columnas]
+    return pd.Series(nulos, index=columnas, dtype=np.float64) / total
+
+
+def combinar_bocetos(bocetos: Sequence[BocetoCuantiles]) -> BocetoCuantiles:
+    """Combina los bocetos de varias particiones en el de su unión."""
+    return reduce(BocetoCuantiles.combinar, bocetos)
+
+
+def combinar_conteos(conteos: Iterable[pd.Series]) -> pd.Series:
+    """Suma conteos de valores (índice: valor, datos: frecuencia)."""
+    return pd.concat(list(conteos)).groupby(level=0).sum().sort_index()
+
+
+@dataclass
+class MomentosParticion:
+    """Estadísticas de escalado y vocabularios de las filas de una o varias particiones.
+
+    Atributos:
+        n_filas: Filas resumidas.
+        numericas: Por columna numérica, valores no nulos (``n``), ``media`` y suma de
+            cuadrados centrados (``m2``).
+        tokens_multi: Por columna de respuesta múltiple, filas que contienen cada token.
+        categorias: Por columna categórica estándar, categorías observadas.
+    """
+
+    n_filas: int
+    numericas: pd.DataFrame
+    tokens_multi: Dict[str, pd.Series] = field(default_factory=dict)
+    categorias: Dict[str, List[str]] = field(default_factory=dict)
+
+
+def _filas_por_token(serie: pd.Series) -> pd.Series:
+    tokens = serie.dropna().astype(str).str.split(";").explode()
+    # Un token repetido en la misma fila cuenta una sola vez, como en las dummies
+    tokens = tokens[tokens != ""]
+    return tokens.reset_index().drop_duplicates().iloc[:, 1].value_counts().sort_index()
+
+
+def momentos_particion(
+    features_df: pd.DataFrame, multi_answer_cols: Sequence[str], standard_categorical_cols: Sequence[str]
+) -> MomentosParticion:
+    """Momentos y vocabularios de las características de una partición (ya filtrada)."""
+    numericas = features_df.select_dtypes(include=np.number).astype(np.float64)
+    media = numericas.mean()
+    return MomentosParticion(
+        n_filas=len(features_df),
+        numericas=pd.DataFrame(
+            {"n": numericas.notna().sum(), "media": media, "m2": ((numericas - media) ** 2).sum()}
+        ),
+        tokens_multi={col: _filas_por_token(features_df[col]) for col in multi_answer_cols if col in features_df},
+        categorias={
+            col: pd.Categorical(features_df[col]).remove_unused_categories().categories.tolist()
+            for col in standard_categorical_cols
+            if col in features_df
+        },
+    )
+
+
+def _combinar_dos(a: MomentosParticion, b: MomentosParticion) -> MomentosParticion:
+    # Combinación de medias y varianzas de Chan et al.; una columna ausente aporta n = 0
+    columnas = list(dict.fromkeys([*a.numericas.index, *b.numericas.index]))
+    na, nb = (m.numericas["n"].reindex(columnas, fill_value=0).to_numpy(dtype=np.float64) for m in (a, b))
+    ma, mb = (m.numericas["media"].reindex(columnas).fillna(0).to_numpy() for m in (a, b))
+    m2a, m2b = (m.numericas["m2"].reindex(columnas, fill_value=0).to_numpy() for m in (a, b))
+    n = na + nb
+    with np.errstate(invalid="ignore", divide="ignore"):
+        delta = mb - ma
+        media = np.where(n > 0, ma + delta * nb / n, np.nan)
+        m2 = np.where(n > 0, m2a + m2b + delta**2 * na * nb / n, 0.0)
+    return MomentosParticion(
+        n_filas=a.n_filas + b.n_filas,
+        numericas=pd.DataFrame({"n": n.astype(np.int64), "media": media, "m2": m2}, index=columnas),
+        tokens_multi={
+            col: combinar_conteos(m.tokens_multi[col] for m in (a, b) if col in m.tokens_multi)
+            for col in dict.fromkeys([*a.tokens_multi, *b.tokens_multi])
+        },
+        categorias={
+            col: sorted(set(a.categorias.get(col, [])) | set(b.categorias.get(col, [])))
+            for col in dict.fromkeys([*a.categorias, *b.categorias])
+        },
+    )
+
+
+def combinar_momentos(momentos: Sequence[MomentosParticion]) -> MomentosParticion:
+    """Combina los momentos de varias particiones en los de su unión."""
+    return reduce(_combinar_dos, momentos)
@@ -2,41 +2,49 @@
 Nodos para el pipeline de procesamiento de datos, con un enfoque robusto y controlado por una "allowlist".
 """
 
+import os
 import pandas as pd
-import numpy as np
 import logging
-from sklearn.preprocessing import StandardScaler
-from typing import Dict, Any, List
+from typing import Dict, Any, Optional, Tuple
 
-logger = logging.getLogger(__name__)
-
-def cargar_datos(
-    so_2023: pd.DataFrame,
-    jb_external: pd.DataFrame,
-    jb_narrow: pd.DataFrame,
-) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-    """Carga los datos crudos desde el catálogo."""
-    return so_2023, jb_external, jb_narrow
+from .estadisticas import boceto_de_columna, contar_nulos, limites_iqr
+from .preprocesador import PreprocesadorAllowlist
 
-def analizar_y_limpiar_nulos(
-    so_2023: pd.DataFrame,
-    jb_external: pd.DataFrame,
-    jb_narrow: pd.DataFrame,
-) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-    """Analiza y elimina columnas con un alto porcentaje de valores nulos."""
-    logger.info("--- Análisis y Limpieza de Nulos por Columna ---")
-    def _limpiar_df(df: pd.DataFrame, nombre: str) -> pd.DataFrame:
-        nan_percentages = df.isnull().sum() / len(df)
-        cols_to_drop = nan_percentages[nan_percentages > 0.5].index
-        if len(cols_to_drop) > 0:
-            logger.info(f"En '{nombre}', eliminando {len(cols_to_drop)} columnas con >50% de nulos.")
-            df = df.drop(columns=cols_to_drop)
-        return df
+logger = logging.getLogger(__name__)
 
-    so_2023_clean = _limpiar_df(so_2023, "Stack Overflow 2023")
-    jb_external_clean = _limpiar_df(jb_external, "JetBrains External")
-    jb_narrow_clean = _limpiar_df(jb_narrow, "JetBrains Narrow")
-    return so_2023_clean, jb_external_clean, jb_narrow_clean
+def limpiar_nulos_por_columna(
+    df: pd.DataFrame,
+    nombre: str,
+    umbral: float = 0.5,
+    filas_por_bloque: int = 100_000,
+    hilos: Optional[int] = 1,
+) -> pd.DataFrame:
+    """Analiza y elimina columnas con un alto porcentaje de valores nulos.
+
+    Los nulos se cuentan por bloques de columnas en ``hilos`` hilos (``None``: uno por
+    núcleo). El informe de cada dataset se emite en un solo registro de log, de modo que
+    las fuentes limpiadas a la vez (``kedro run --runner ThreadRunner``) no entremezclan
+    sus líneas.
+
+    Args:
+        df: DataFrame de una de las encuestas.
+        nombre: Nombre legible del dataset, usado en el log.
+        umbral: Proporción de nulos a partir de la cual se elimina la columna.
+        filas_por_bloque: Filas por bloque del conteo exacto de nulos.
+        hilos: Hilos para contar los nulos por bloques de columnas.
+
+    Returns:
+        El DataFrame sin las columnas que superan el umbral.
+    """
+    nan_percentages = contar_nulos(df, filas_por_bloque, n_hilos=hilos or os.cpu_count() or 1) / max(len(df), 1)
+    cols_to_drop = nan_percentages[nan_percentages > umbral].index
+    informe = [f"--- Análisis y Limpieza de Nulos por Columna: {nombre} ---"]
+    if len(cols_to_drop) > 0:
+        informe.append(f"En '{nombre}', eliminando {len(cols_to_drop)} columnas con >{umbral:.0%} de nulos:")
+        informe.extend(f"  - {col}: {nan_percentages[col]:.1%}" for col in cols_to_drop)
+        df = df.drop(columns=cols_to_drop)
+    logger.info("\n".join(informe))
+    return df
 
 def eliminar_filas_sin_salario(df_so: pd.DataFrame, target_col: str) -> pd.DataFrame:
     """Elimina las filas del dataset de Stack Overflow donde el salario es nulo."""
@@ -45,21 +53,32 @@ def eliminar_filas_sin_salario(df_so: pd.DataFrame, target_col: str) -> pd.DataF
     logger.info(f"Se eliminaron {len(df_so) - len(df_cleaned)} filas donde '{target_col}' era nulo.")
     return df_cleaned
 
-def filtrar_outliers_salario(df_so: pd.DataFrame, target_col: str) -> pd.DataFrame:
-    """Filtra outliers de la columna de salarios usando el método IQR."""
+def filtrar_outliers_salario(
+    df_so: pd.DataFrame,
+    target_col: str,
+    error_cuantiles: Optional[float] = None,
+    filas_por_bloque: int = 100_000,
+) -> pd.DataFrame:
+    """Filtra outliers de la columna de salarios usando el método IQR.
+
+    Los cuartiles salen de un ``BocetoCuantiles`` alimentado por bloques: exactos con
+    ``error_cuantiles=None`` y, si no, con ese error de rango normalizado.
+    """
     logger.info(f"--- Filtrando outliers de '{target_col}' ---")
-    Q1 = df_so[target_col].quantile(0.25)
-    Q3 = df_so[target_col].quantile(0.75)
-    IQR = Q3 - Q1
-    limite_inferior = Q1 - 1.5 * IQR
-    limite_superior = Q3 + 1.5 * IQR
+    boceto = boceto_de_columna(df_so[target_col], error_cuantiles, filas_por_bloque)
+    limite_inferior, limite_superior = limites_iqr(boceto)
     df_filtered = df_so[(df_so[target_col] >= limite_inferior) & (df_so[target_col] <= limite_superior)]
     logger.info(f"Se eliminaron {len(df_so) - len(df_filtered)} filas consideradas outliers.")
     return df_filtered
 
-def preprocesamiento_final_con_allowlist(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
+def preprocesamiento_final_con_allowlist(
+    df: pd.DataFrame, params: Dict[str, Any]
+) -> Tuple[pd.DataFrame, PreprocesadorAllowlist]:
     """
     Realiza el preprocesamiento final basándose en una "allowlist" de columnas para evitar errores de memoria y tipo.
+
+    Devuelve también el ``PreprocesadorAllowlist`` ajustado (vocabularios, escalado y nombres
+    sanitizados) para transformar encuestados nuevos de la misma forma.
     """
     logger.info("--- Iniciando Preprocesamiento Final con Allowlist --- ")
     
@@ -67,45 +86,10 @@ def preprocesamiento_final_con_allowlist(df: pd.DataFrame, params: Dict[str, Any
     if target_col not in df.columns:
         raise ValueError(f"La columna objetivo '{target_col}' no se encuentra.")
 
-    y = df[target_col]
-    features_df = df.drop(columns=[target_col])
-
-    # 1. Definir la "Allowlist" de columnas categóricas que queremos procesar
-    multi_answer_cols = params.get("multi_answer_cols", [])
-    standard_categorical_cols = params.get("standard_categorical_cols", [])
-    allowlist = set(multi_answer_cols + standard_categorical_cols)
-
-    # 2. Identificar y eliminar todas las columnas de texto que NO están en la allowlist
-    all_object_cols = features_df.select_dtypes(include=['object', 'category']).columns.tolist()
-    cols_to_drop = [col for col in all_object_cols if col not in allowlist]
-    if cols_to_drop:
-        logger.warning(f"Eliminando {len(cols_to_drop)} columnas de texto no incluidas en la allowlist: {cols_to_drop}")
-        features_df = features_df.drop(columns=cols_to_drop)
-
-    # 3. Procesar columnas de respuesta múltiple de la allowlist
-    for col in multi_answer_cols:
-        if col in features_df.columns:
-            dummies = features_df[col].fillna('').str.get_dummies(sep=';')
-            dummies = dummies.add_prefix(f"{col}_")
-            features_df = pd.concat([features_df.drop(columns=[col]), dummies], axis=1)
-
-    # 4. Procesar columnas categóricas estándar de la allowlist
-    cols_to_encode = [col for col in standard_categorical_cols if col in features_df.columns]
-    if cols_to_encode:
-        features_df = pd.get_dummies(features_df, columns=cols_to_encode, dummy_na=False)
-
-    # 5. Escalar todas las características numéricas resultantes
-    numeric_features = features_df.select_dtypes(include=np.number).columns.tolist()
-    if numeric_features:
-        scaler = StandardScaler()
-        features_df[numeric_features] = scaler.fit_transform(features_df[numeric_features])
-    
-    final_df = pd.concat([features_df, y], axis=1)
-
-    # 7. Sanitizar nombres de columnas para compatibilidad con LightGBM/XGBoost
-    logger.info("Sanitizando nombres de columnas...")
-    final_df.columns = final_df.columns.str.replace(r'[^A-Za-z0-9_]+', '_', regex=True)
+    preprocesador = PreprocesadorAllowlist.from_params(params).fit(df)
+    features_df = preprocesador.transform(df)
+    final_df = pd.concat([features_df, df[target_col].rename(preprocesador.mapa_nombres_[target_col])], axis=1)
 
     logger.info(f"--- Preprocesamiento Final Completado. Dimensiones: {final_df.shape} ---")
     
-    return final_df
\ No newline at end of file
+    return final_df, preprocesador
@@ -2,50 +2,52 @@
 Pipeline de procesamiento de datos robusto y controlado por una "allowlist".
 """
 
+from functools import partial
+
 from kedro.pipeline import Pipeline, node
 from .nodes import (
-    cargar_datos, 
-    analizar_y_limpiar_nulos, 
+    limpiar_nulos_por_columna,
     eliminar_filas_sin_salario,
     filtrar_outliers_salario,
     preprocesamiento_final_con_allowlist # Importar la nueva función final
 )
 
+# Fuentes crudas: (dataset crudo, dataset primario, nombre legible, sufijo del nodo)
+FUENTES = [
+    ("datos_crudos_so_2023", "datos_primarios_so_2023", "Stack Overflow 2023", "so"),
+    ("datos_crudos_jb_2025_external", "datos_primarios_jb_external", "JetBrains External", "jb_external"),
+    ("datos_crudos_jb_2025_narrow", "datos_primarios_jb_narrow", "JetBrains Narrow", "jb_narrow"),
+]
+
+
 def create_pipeline(**kwargs) -> Pipeline:
     """Crea el pipeline de procesamiento de datos.
 
+    Cada fuente se limpia en su propio nodo, de modo que las ramas cuyas salidas no
+    se consumen (las de JetBrains) se pueden podar con ``Pipeline.to_outputs`` sin
+    llegar a leer sus CSV, y las que sí se ejecutan pueden limpiarse a la vez con
+    ``kedro run --runner ThreadRunner``.
+
     Returns:
         El pipeline de procesamiento de datos.
     """
-    return Pipeline([
-        node(
-            func=cargar_datos,
-            inputs=[
-                "datos_crudos_so_2023",
-                "datos_crudos_jb_2025_external",
-                "datos_crudos_jb_2025_narrow",
-            ],
-            outputs=[
-                "datos_intermedios_so_2023",
-                "datos_intermedios_jb_external",
-                "datos_intermedios_jb_narrow",
-            ],
-            name="cargar_datos_crudos",
-        ),
+    limpieza_nodes = [
         node(
-            func=analizar_y_limpiar_nulos,
-            inputs=[
-                "datos_intermedios_so_2023",
-                "datos_intermedios_jb_external",
-                "datos_intermedios_jb_narrow",
-            ],
-            outputs=[
-                "datos_primarios_so_2023",
-                "datos_primarios_jb_external",
-                "datos_primarios_jb_narrow",
-            ],
-            name="analizar_y_limpiar_nulos_por_columna",
-        ),
+            func=partial(limpiar_nulos_por_columna, nombre=nombre),
+            inputs={
+                "df": crudo,
+                "filas_por_bloque": "params:preprocessing_params.filas_por_bloque",
+                "hilos": "params:preprocessing_params.hilos_limpieza",
+            },
+            outputs=primario,
+            name=f"analizar_y_limpiar_nulos_por_columna_{sufijo}",
+            tags=["jetbrains"] if sufijo.startswith("jb") else None,
+        )
+        for crudo, primario, nombre, sufijo in FUENTES
+    ]
+
+    return Pipeline([
+        *limpieza_nodes,
         node(
             func=eliminar_filas_sin_salario,
             inputs={"df_so": "datos_primarios_so_2023", "target_col": "params:preprocessing_params.target_col"},
@@ -54,7 +56,12 @@ def create_pipeline(**kwargs) -> Pipeline:
         ),
         node(
             func=filtrar_outliers_salario,
-            inputs={"df_so": "datos_con_salario_so_2023", "target_col": "params:preprocessing_params.target_col"},
+            inputs={
+                "df_so": "datos_con_salario_so_2023",
+                "target_col": "params:preprocessing_params.target_col",
+                "error_cuantiles": "params:preprocessing_params.error_cuantiles",
+                "filas_por_bloque": "params:preprocessing_params.filas_por_bloque",
+            },
             outputs="datos_sin_outliers_so_2023",
             name="filtrar_outliers_salario_so",
         ),
@@ -64,7 +71,7 @@ def create_pipeline(**kwargs) -> Pipeline:
                 "df": "datos_sin_outliers_so_2023",
                 "params": "params:preprocessing_params"
             },
-            outputs="datos_para_modelado",
+            outputs=["datos_para_modelado", "preprocesador_allowlist"],
             name="preprocesamiento_final_node",
         ),
-    ])
\ No newline at end of file
+    ])
@@ -0,0 +1,244 @@
+"""
+Transformador ajustado que encapsula el preprocesamiento por "allowlist", para poder
+aplicar exactamente la misma transformación a encuestados nuevos sin reconstruir el
+dataset completo.
+"""
+
+import logging
+import re
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from .estadisticas import MomentosParticion
+
+logger = logging.getLogger(__name__)
+
+
+def sanitizar_nombre(columna: str) -> str:
+    """Nombre de columna compatible con LightGBM/XGBoost."""
+    return re.sub(r"[^A-Za-z0-9_]+", "_", columna)
+
+
+def _dummies_multirespuesta(serie: pd.Series, vocabulario: List[str]) -> sparse.csr_matrix:
+    """Equivalente disperso de ``str.get_dummies(sep=';')`` con un vocabulario fijo."""
+    listas = serie.astype("string").fillna("").str.split(";")
+    tokens = listas.explode().to_numpy(dtype=object)
+    filas = np.repeat(np.arange(len(serie)), listas.str.len().to_numpy())
+    codigos = pd.Categorical(tokens, categories=vocabulario).codes
+    conocidos = codigos >= 0
+    matriz = sparse.csr_matrix(
+        (np.ones(conocidos.sum(), dtype=np.float32), (filas[conocidos], codigos[conocidos])),
+        shape=(len(serie), len(vocabulario)),
+    )
+    # Una respuesta repetida en la misma fila cuenta una sola vez
+    matriz.data[:] = 1.0
+    return matriz
+
+
+def _dummies_categoricas(serie: pd.Series, vocabulario: List[Any]) -> sparse.csr_matrix:
+    """Equivalente disperso de ``pd.get_dummies`` para una columna con un vocabulario fijo."""
+    codigos = pd.Categorical(serie, categories=vocabulario).codes
+    filas = np.flatnonzero(codigos >= 0)
+    return sparse.csr_matrix(
+        (np.ones(len(filas), dtype=np.float32), (filas, codigos[filas])),
+        shape=(len(serie), len(vocabulario)),
+    )
+
+
+def _escalador_desde_momentos(n: np.ndarray, media: np.ndarray, varianza: np.ndarray, with_mean: bool = True):
+    """``StandardScaler`` ajustado a partir de momentos ya combinados, con los mismos atributos
+    (y el mismo tratamiento de columnas constantes) que ``StandardScaler.fit``."""
+    from sklearn.preprocessing import StandardScaler
+    from sklearn.preprocessing._data import _handle_zeros_in_scale, _is_constant_feature
+
+    escalador = StandardScaler(with_mean=with_mean)
+    escalador.n_features_in_ = len(media)
+    escalador.n_samples_seen_ = int(n[0]) if np.ptp(n) == 0 else n
+    escalador.mean_ = media
+    escalador.var_ = varianza
+    escalador.scale_ = _handle_zeros_in_scale(
+        np.sqrt(varianza), copy=False, constant_mask=_is_constant_feature(varianza, media, n)
+    )
+    return escalador
+
+
+def _apilar(bloques: List[sparse.csr_matrix], n_filas: int) -> sparse.csr_matrix:
+    if not bloques:
+        return sparse.csr_matrix((n_filas, 0), dtype=np.float32)
+    return sparse.hstack(bloques, format="csr", dtype=np.float32)
+
+
+class PreprocesadorAllowlist:
+    """Preprocesamiento por "allowlist" ajustable y reutilizable.
+
+    ``fit`` fija el vocabulario de cada columna categórica, las estadísticas de escalado
+    y el mapa de nombres sanitizados; ``transform`` aplica todo a un lote en una sola
+    pasada vectorizada. Las categorías no vistas en el ajuste se ignoran y las columnas
+    ausentes se tratan como nulas.
+
+    El orden de columnas de salida es: numéricas, dummies de respuesta múltiple y dummies
+    de categóricas estándar. En modo denso se estandarizan las numéricas y las dummies de
+    respuesta múltiple y las categóricas estándar quedan booleanas. En modo disperso
+    (``sparse_output``) las dummies de respuesta múltiple se escalan sin centrar y la
+    salida es un DataFrame ``SparseDtype(float32)``.
+    """
+
+    def __init__(
+        self,
+        target_col: str,
+        multi_answer_cols: Optional[List[str]] = None,
+        standard_categorical_cols: Optional[List[str]] = None,
+        sparse_output: bool = False,
+    ) -> None:
+        self.target_col = target_col
+        self.multi_answer_cols = list(multi_answer_cols or [])
+        self.standard_categorical_cols = list(standard_categorical_cols or [])
+        self.sparse_output = sparse_output
+
+    @classmethod
+    def from_params(cls, params: Dict[str, Any]) -> "PreprocesadorAllowlist":
+        """Crea el transformador a partir de ``preprocessing_params``."""
+        return cls(
+            target_col=params["target_col"],
+            multi_answer_cols=params.get("multi_answer_cols", []),
+            standard_categorical_cols=params.get("standard_categorical_cols", []),
+            sparse_output=params.get("sparse_output", False),
+        )
+
+    def fit(self, df: pd.DataFrame) -> "PreprocesadorAllowlist":
+        from sklearn.preprocessing import StandardScaler
+
+        features_df = df.drop(columns=[self.target_col], errors="ignore")
+        allowlist = set(self.multi_answer_cols + self.standard_categorical_cols)
+
+        texto = features_df.select_dtypes(include=["object", "category"]).columns
+        descartadas = [col for col in texto if col not in allowlist]
+        if descartadas:
+            logger.warning(
+                f"Eliminando {len(descartadas)} columnas de texto no incluidas en la allowlist: {descartadas}"
+            )
+
+        self.numeric_cols_ = features_df.select_dtypes(include=np.number).columns.tolist()
+        self.vocabulario_multi_ = {
+            col: sorted(set(features_df[col].dropna().astype(str).str.split(";").explode()) - {""})
+            for col in self.multi_answer_cols
+            if col in features_df.columns
+        }
+        self.vocabulario_categorico_ = {
+            col: pd.Categorical(features_df[col]).remove_unused_categories().categories.tolist()
+            for col in self.standard_categorical_cols
+            if col in features_df.columns
+        }
+
+        numericas = features_df[self.numeric_cols_].to_numpy(dtype=np.float64)
+        multi = self._bloque_multi(features_df)
+        if self.sparse_output:
+            self.escalador_ = StandardScaler().fit(numericas) if self.numeric_cols_ else None
+            self.escalador_multi_ = StandardScaler(with_mean=False).fit(multi) if multi.shape[1] else None
+        else:
+            # Igual que el modo denso original: numéricas y dummies de respuesta múltiple juntas
+            bloque = np.hstack([numericas, multi.toarray()])
+            self.escalador_ = StandardScaler().fit(bloque) if bloque.shape[1] else None
+
+        self._fijar_columnas()
+        return self
+
+    def ajustar_desde_momentos(self, momentos: MomentosParticion) -> "PreprocesadorAllowlist":
+        """Equivalente de ``fit`` a partir de los momentos combinados de varias particiones
+        (``estadisticas.combinar_momentos``), sin reunir sus filas en un solo DataFrame."""
+        self.numeric_cols_ = momentos.numericas.index.tolist()
+        self.vocabulario_multi_ = {
+            col: momentos.tokens_multi[col].index.tolist()
+            for col in self.multi_answer_cols
+            if col in momentos.tokens_multi
+        }
+        self.vocabulario_categorico_ = {
+            col: momentos.categorias[col] for col in self.standard_categorical_cols if col in momentos.categorias
+        }
+
+        n_numericas = momentos.numericas["n"].to_numpy(dtype=np.float64)
+        media_numericas = momentos.numericas["media"].to_numpy(dtype=np.float64)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            var_numericas = momentos.numericas["m2"].to_numpy(dtype=np.float64) / n_numericas
+        # Las dummies de respuesta múltiple son 0/1: media = proporción de filas con el token
+        proporcion = np.concatenate(
+            [momentos.tokens_multi[col].to_numpy(dtype=np.float64) for col in self.vocabulario_multi_] or [np.empty(0)]
+        ) / max(momentos.n_filas, 1)
+        n_multi = np.full(len(proporcion), momentos.n_filas, dtype=np.float64)
+        var_multi = proporcion * (1 - proporcion)
+
+        if self.sparse_output:
+            self.escalador_ = (
+                _escalador_desde_momentos(n_numericas, media_numericas, var_numericas) if self.numeric_cols_ else None
+            )
+            self.escalador_multi_ = (
+                _escalador_desde_momentos(n_multi, proporcion, var_multi, with_mean=False) if len(proporcion) else None
+            )
+        else:
+            n = np.concatenate([n_numericas, n_multi])
+            self.escalador_ = (
+                _escalador_desde_momentos(
+                    n, np.concatenate([media_numericas, proporcion]), np.concatenate([var_numericas, var_multi])
+                )
+                if len(n)
+                else None
+            )
+        self._fijar_columnas()
+        return self
+
+    def _fijar_columnas(self) -> None:
+        self.columnas_ = [
+            *self.numeric_cols_,
+            *(f"{col}_{token}" for col, vocab in self.vocabulario_multi_.items() for token in vocab),
+            *(f"{col}_{cat}" for col, vocab in self.vocabulario_categorico_.items() for cat in vocab),
+        ]
+        self.mapa_nombres_ = {col: sanitizar_nombre(col) for col in [*self.columnas_, self.target_col]}
+
+    def _bloque_multi(self, features_df: pd.DataFrame) -> sparse.csr_matrix:
+        bloques = [
+            _dummies_multirespuesta(features_df[col], vocab) for col, vocab in self.vocabulario_multi_.items()
+        ]
+        return _apilar(bloques, len(features_df))
+
+    def _bloque_categorico(self, features_df: pd.DataFrame) -> sparse.csr_matrix:
+        bloques = [_dummies_categoricas(features_df[col], vocab) for col, vocab in self.vocabulario_categorico_.items()]
+        return _apilar(bloques, len(features_df))
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Transforma un lote de encuestados en la matriz de características (sin el objetivo)."""
+        columnas = [*self.numeric_cols_, *self.vocabulario_multi_, *self.vocabulario_categorico_]
+        features_df = df.reindex(columns=columnas)
+        numericas = features_df[self.numeric_cols_].to_numpy(dtype=np.float64)
+        multi = self._bloque_multi(features_df)
+        categoricas = self._bloque_categorico(features_df)
+        nombres = [self.mapa_nombres_[col] for col in self.columnas_]
+
+        if self.sparse_output:
+            if self.escalador_ is not None:
+                numericas = self.escalador_.transform(numericas)
+            if self.escalador_multi_ is not None:
+                multi = self.escalador_multi_.transform(multi)
+            matriz = sparse.hstack(
+                [sparse.csr_matrix(numericas.astype(np.float32)), multi, categoricas],
+                format="csr",
+                dtype=np.float32,
+            )
+            return pd.DataFrame.sparse.from_spmatrix(matriz, index=df.index, columns=nombres)
+
+        escalado = np.hstack([numericas, multi.toarray()])
+        if self.escalador_ is not None:
+            escalado = self.escalador_.transform(escalado)
+        n_escaladas = escalado.shape[1]
+        return pd.concat(
+            [
+                pd.DataFrame(escalado, index=df.index, columns=nombres[:n_escaladas]),
+                pd.DataFrame(categoricas.toarray().astype(bool), index=df.index, columns=nombres[n_escaladas:]),
+            ],
+            axis=1,
+        )
+
+    def fit_transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        return self.fit(df).transform(df)
@@ -0,0 +1,10 @@
+"""
+Pipeline 'procesamiento_incremental': `datos_para_modelado` a partir de las encuestas
+particionadas por fuente y año, reprocesando sólo las particiones nuevas o modificadas.
+"""
+
+from .pipeline import create_pipeline
+
+__all__ = ["create_pipeline"]
+
+__version__ = "0.1"
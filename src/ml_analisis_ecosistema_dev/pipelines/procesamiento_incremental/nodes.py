@@ -0,0 +1,226 @@
+"""
+Nodos para el pipeline `procesamiento_incremental`.
+
+Cada partición cruda (p. ej. ``stackoverflow_2023``) se guarda en
+``directorio_particiones/<partición>/`` ya limpia de filas sin salario, junto con su
+``ResumenParticion`` y la huella del fichero de origen. En una ejecución posterior sólo se
+parsean las particiones cuya huella ha cambiado; las piezas globales (columnas con
+demasiados nulos, límites IQR, vocabularios y escalado) se recalculan combinando las
+estadísticas parciales de todas las particiones.
+"""
+import hashlib
+import json
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+
+from ml_analisis_ecosistema_dev.datasets import ParticionEncuesta
+from ml_analisis_ecosistema_dev.pipelines.procesamiento_de_datos.estadisticas import (
+    ResumenParticion,
+    combinar_bocetos,
+    combinar_momentos,
+    limites_iqr,
+    momentos_particion,
+    proporcion_nulos,
+    resumir_particion,
+)
+from ml_analisis_ecosistema_dev.pipelines.procesamiento_de_datos.preprocesador import PreprocesadorAllowlist
+
+logger = logging.getLogger(__name__)
+
+FICHERO_RESUMEN = "resumen.pkl"
+FICHERO_DATOS = "datos.parquet"
+
+
+def _guardar_atomico(ruta: Path, escribir) -> None:
+    temporal = ruta.with_name(f"{ruta.stem}.{os.getpid()}{ruta.suffix}")
+    escribir(temporal)
+    os.replace(temporal, ruta)
+
+
+def _cargar_pickle(ruta: Path) -> Any:
+    with open(ruta, "rb") as fichero:
+        return pickle.load(fichero)
+
+
+def _guardar_pickle(ruta: Path, objeto: Any) -> None:
+    def escribir(temporal: Path) -> None:
+        with open(temporal, "wb") as fichero:
+            pickle.dump(objeto, fichero)
+
+    _guardar_atomico(ruta, escribir)
+
+
+def _procesar_particion(
+    particion: ParticionEncuesta, destino: Path, target_col: str, error: Optional[float], filas_por_bloque: int
+) -> Tuple[ResumenParticion, int]:
+    """Parsea una partición, la resume y guarda sus filas con salario en ``destino``."""
+    df = particion()
+    resumen = resumir_particion(df, target_col, particion.huella, error, filas_por_bloque)
+    destino.mkdir(parents=True, exist_ok=True)
+    # Los momentos guardados dependían de los datos anteriores de la partición
+    for obsoleto in destino.glob("momentos-*.pkl"):
+        obsoleto.unlink()
+    con_salario = df.dropna(subset=[target_col])
+    _guardar_atomico(destino / FICHERO_DATOS, con_salario.to_parquet)
+    # El resumen se escribe al final: su presencia marca la partición como completa
+    _guardar_pickle(destino / FICHERO_RESUMEN, resumen)
+    return resumen, len(con_salario)
+
+
+def _resumen_vigente(ruta: Path, huella: str, error: Optional[float]) -> Optional[ResumenParticion]:
+    """Resumen guardado si corresponde al mismo origen y a la misma precisión de cuantiles."""
+    if not ruta.exists():
+        return None
+    resumen = _cargar_pickle(ruta)
+    boceto = getattr(resumen, "boceto_objetivo", None)
+    if resumen.huella != huella or boceto is None or boceto.error != error:
+        return None
+    return resumen
+
+
+def actualizar_particiones(
+    particiones: Dict[str, ParticionEncuesta], preprocessing_params: Dict[str, Any], params: Dict[str, Any]
+) -> Dict[str, ResumenParticion]:
+    """Procesa sólo las particiones nuevas o modificadas y devuelve el resumen de todas.
+
+    Las particiones pendientes se procesan en paralelo (``params["n_jobs"]`` procesos);
+    cada una se resume por bloques de ``filas_por_bloque`` filas.
+
+    Args:
+        particiones: Particiones de ``ParticionesEncuestaDataset`` (carga diferida y huella).
+        preprocessing_params: Parámetros del preprocesamiento (target_col, error_cuantiles,
+            filas_por_bloque).
+        params: Diccionario con directorio_particiones y n_jobs.
+
+    Returns:
+        Un diccionario ``{partición: ResumenParticion}`` ordenado por partición.
+    """
+    logger.info("--- Actualizando particiones de la encuesta ---")
+    directorio = Path(params["directorio_particiones"])
+    target_col = preprocessing_params["target_col"]
+    error = preprocessing_params.get("error_cuantiles")
+    filas_por_bloque = preprocessing_params.get("filas_por_bloque", 100_000)
+
+    resumenes: Dict[str, Optional[ResumenParticion]] = {}
+    for nombre, particion in sorted(particiones.items()):
+        resumenes[nombre] = _resumen_vigente(directorio / nombre / FICHERO_RESUMEN, particion.huella, error)
+        if resumenes[nombre] is not None:
+            logger.info(f"Partición '{nombre}': sin cambios, se reutiliza '{directorio / nombre}'.")
+        else:
+            logger.info(f"Partición '{nombre}': nueva o modificada, procesando el origen.")
+
+    pendientes = [nombre for nombre, resumen in resumenes.items() if resumen is None]
+    # Con una sola partición pendiente no compensa arrancar procesos
+    procesadas = Parallel(n_jobs=params.get("n_jobs", 1) if len(pendientes) > 1 else 1)(
+        delayed(_procesar_particion)(particiones[nombre], directorio / nombre, target_col, error, filas_por_bloque)
+        for nombre in pendientes
+    )
+    for nombre, (resumen, con_salario) in zip(pendientes, procesadas):
+        logger.info(f"Partición '{nombre}': {resumen.n_filas} filas, {con_salario} con '{target_col}'.")
+        resumenes[nombre] = resumen
+    return resumenes
+
+
+def calcular_filtros_globales(resumenes: Dict[str, ResumenParticion], params: Dict[str, Any]) -> Dict[str, Any]:
+    """Columnas a eliminar por nulos (conteos exactos) y límites IQR del objetivo (bocetos de
+    cuantiles), combinando los resúmenes de las particiones.
+
+    Returns:
+        Un diccionario con columnas_eliminadas, limite_inferior, limite_superior y el
+        desplazamiento del índice de cada partición (filas crudas de las anteriores), que
+        mantiene únicos los índices de `datos_para_modelado`.
+    """
+    lista = list(resumenes.values())
+    nulos = proporcion_nulos(lista)
+    umbral = params.get("umbral_nulos", 0.5)
+    eliminadas = nulos[nulos > umbral].index.tolist()
+    if eliminadas:
+        logger.info(f"Eliminando {len(eliminadas)} columnas con >{umbral:.0%} de nulos: {eliminadas}")
+
+    inferior, superior = limites_iqr(
+        combinar_bocetos([resumen.boceto_objetivo for resumen in lista]), params.get("factor_iqr", 1.5)
+    )
+    logger.info(f"Límites IQR del objetivo: [{inferior:,.2f}, {superior:,.2f}].")
+    filas = np.cumsum([0, *(resumen.n_filas for resumen in lista)])
+    return {
+        "columnas_eliminadas": eliminadas,
+        "limite_inferior": inferior,
+        "limite_superior": superior,
+        "desplazamientos": {nombre: int(desde) for nombre, desde in zip(resumenes, filas)},
+    }
+
+
+def _clave_momentos(resumen: ResumenParticion, filtros: Dict[str, Any], preprocessing_params: Dict[str, Any]) -> str:
+    """Clave de los momentos de una partición: sus datos y los filtros globales que los condicionan."""
+    contenido = {
+        "huella": resumen.huella,
+        "columnas_eliminadas": filtros["columnas_eliminadas"],
+        "limites": [filtros["limite_inferior"], filtros["limite_superior"]],
+        "multi_answer_cols": preprocessing_params.get("multi_answer_cols", []),
+        "standard_categorical_cols": preprocessing_params.get("standard_categorical_cols", []),
+    }
+    return hashlib.blake2b(json.dumps(contenido, sort_keys=True).encode(), digest_size=16).hexdigest()
+
+
+def preprocesamiento_final_incremental(
+    resumenes: Dict[str, ResumenParticion],
+    filtros: Dict[str, Any],
+    preprocessing_params: Dict[str, Any],
+    params: Dict[str, Any],
+) -> Tuple[pd.DataFrame, PreprocesadorAllowlist]:
+    """Ajusta el ``PreprocesadorAllowlist`` con los momentos combinados de las particiones y
+    transforma cada una, en lugar de ajustar sobre la unión de todas las filas.
+
+    Los momentos de cada partición se guardan junto a sus datos, indexados por los filtros
+    globales: mientras los límites IQR y las columnas eliminadas no cambien, no se recalculan.
+
+    Returns:
+        `datos_para_modelado` y el preprocesador ajustado, como ``preprocesamiento_final_con_allowlist``.
+    """
+    logger.info("--- Iniciando Preprocesamiento Final Incremental ---")
+    directorio = Path(params["directorio_particiones"])
+    target_col = preprocessing_params["target_col"]
+    multi = preprocessing_params.get("multi_answer_cols", [])
+    categoricas = preprocessing_params.get("standard_categorical_cols", [])
+
+    filtradas: List[pd.DataFrame] = []
+    momentos = []
+    for nombre, resumen in resumenes.items():
+        df = pd.read_parquet(directorio / nombre / FICHERO_DATOS)
+        df = df.drop(columns=[col for col in filtros["columnas_eliminadas"] if col in df.columns])
+        df = df[df[target_col].between(filtros["limite_inferior"], filtros["limite_superior"])]
+        df.index = df.index + filtros["desplazamientos"][nombre]
+        filtradas.append(df)
+
+        ruta_momentos = directorio / nombre / f"momentos-{_clave_momentos(resumen, filtros, preprocessing_params)}.pkl"
+        if ruta_momentos.exists():
+            momentos.append(_cargar_pickle(ruta_momentos))
+        else:
+            for obsoleto in ruta_momentos.parent.glob("momentos-*.pkl"):
+                obsoleto.unlink()
+            momentos.append(momentos_particion(df.drop(columns=[target_col]), multi, categoricas))
+            _guardar_pickle(ruta_momentos, momentos[-1])
+        logger.info(f"Partición '{nombre}': {len(df)} filas tras los filtros globales.")
+
+    preprocesador = PreprocesadorAllowlist.from_params(preprocessing_params).ajustar_desde_momentos(
+        combinar_momentos(momentos)
+    )
+    nombre_objetivo = preprocesador.mapa_nombres_[target_col]
+    final_df = pd.concat(
+        [
+            pd.concat([preprocesador.transform(df), df[target_col].rename(nombre_objetivo)], axis=1)
+            for df in filtradas
+        ]
+    )
+    logger.info(
+        f"--- Preprocesamiento Final Incremental Completado: {len(resumenes)} particiones, "
+        f"dimensiones {final_df.shape} ---"
+    )
+    return final_df, preprocesador
@@ -0,0 +1,40 @@
+"""
+Pipeline de procesamiento incremental por particiones de la encuesta.
+"""
+
+from kedro.pipeline import Pipeline, node, pipeline
+from .nodes import actualizar_particiones, calcular_filtros_globales, preprocesamiento_final_incremental
+
+
+def create_pipeline(**kwargs) -> Pipeline:
+    return pipeline(
+        [
+            node(
+                func=actualizar_particiones,
+                inputs=[
+                    "encuestas_so_particionadas",
+                    "params:preprocessing_params",
+                    "params:procesamiento_incremental",
+                ],
+                outputs="resumenes_particiones",
+                name="actualizar_particiones_node",
+            ),
+            node(
+                func=calcular_filtros_globales,
+                inputs=["resumenes_particiones", "params:procesamiento_incremental"],
+                outputs="filtros_globales",
+                name="calcular_filtros_globales_node",
+            ),
+            node(
+                func=preprocesamiento_final_incremental,
+                inputs=[
+                    "resumenes_particiones",
+                    "filtros_globales",
+                    "params:preprocessing_params",
+                    "params:procesamiento_incremental",
+                ],
+                outputs=["datos_para_modelado", "preprocesador_allowlist"],
+                name="preprocesamiento_final_incremental_node",
+            ),
+        ]
+    )
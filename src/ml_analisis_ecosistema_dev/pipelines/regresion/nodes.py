@@ -1,37 +1,58 @@
 
 """
 Nodos para el pipeline de regresión.
+
+scikit-learn, XGBoost y los módulos de búsqueda y parada temprana se importan dentro de
+los nodos que los usan: registrar los pipelines (``kedro run``, ``kedro registry list``)
+no los carga.
 """
 import logging
+import time
 import pandas as pd
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import numpy as np
 
-from sklearn.model_selection import train_test_split, GridSearchCV, KFold
-from sklearn.linear_model import LinearRegression, Ridge, Lasso
-from sklearn.ensemble import RandomForestRegressor
-from xgboost import XGBRegressor
-from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
+from ml_analisis_ecosistema_dev.pipelines.plan_cv.nodes import HOLDOUT, particion_de, validador_del_plan
+from ml_analisis_ecosistema_dev.utils.evaluacion import (
+    FILAS_POR_BLOQUE,
+    configuracion_bootstrap,
+    intervalos_bootstrap,
+    metricas_regresion,
+    metricas_regresion_ponderadas,
+    predecir_modelos,
+    solapan_con_el_mejor,
+)
+from ml_analisis_ecosistema_dev.utils.matrices import preparar_caracteristicas
+from ml_analisis_ecosistema_dev.utils.recursos import asignar_nucleos, fijar_hilos_estimador, limitar_hilos
 
 logger = logging.getLogger(__name__)
 
-def split_data(data: pd.DataFrame, params: Dict[str, Any]) -> Dict[str, Any]:
+def split_data(data: pd.DataFrame, params: Dict[str, Any], plan_cv: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
     """Divide los datos en conjuntos de entrenamiento y prueba, asegurando que solo
     se usen columnas numéricas para las características.
 
     Args:
         data: DataFrame de entrada.
         params: Diccionario de parámetros con test_size y random_state.
+        plan_cv: Plan de CV compartido; si se indica, el holdout es el del plan en lugar
+            de un ``train_test_split`` propio.
 
     Returns:
         Un diccionario con X_train, X_test, y_train, y_test.
     """
-    X = data.drop(columns=[params["target_col"]])
+    X = preparar_caracteristicas(data.drop(columns=[params["target_col"]]))
     y = data[params["target_col"]]
     
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=params["test_size"], random_state=params["random_state"]
-    )
+    if plan_cv is not None:
+        es_holdout = particion_de(plan_cv, data.index) == HOLDOUT
+        X_train, X_test = X[~es_holdout], X[es_holdout]
+        y_train, y_test = y[~es_holdout], y[es_holdout]
+    else:
+        from sklearn.model_selection import train_test_split
+
+        X_train, X_test, y_train, y_test = train_test_split(
+            X, y, test_size=params["test_size"], random_state=params["random_state"]
+        )
     
     logger.info(f"División de datos completada. Tamaño de X_train: {X_train.shape}")
     return dict(
@@ -41,102 +62,202 @@ def split_data(data: pd.DataFrame, params: Dict[str, Any]) -> Dict[str, Any]:
         y_test=y_test,
     )
 
+def _linear_regression(params: Dict[str, Any]):
+    from sklearn.linear_model import LinearRegression
+    return LinearRegression()
+
+def _ridge(params: Dict[str, Any]):
+    from sklearn.linear_model import Ridge
+    return Ridge()
+
+def _lasso(params: Dict[str, Any]):
+    from sklearn.linear_model import Lasso
+    return Lasso()
+
+def _random_forest_regressor(params: Dict[str, Any]):
+    from sklearn.ensemble import RandomForestRegressor
+    return RandomForestRegressor(random_state=params.get("random_state"))
+
+def _xgb_regressor(params: Dict[str, Any]):
+    if params.get("cache_cuantizacion") is not None:
+        from ml_analisis_ecosistema_dev.utils.cuantizacion import XGBRegressorCuantizado as XGBRegressor
+    else:
+        from xgboost import XGBRegressor
+    return XGBRegressor(random_state=params.get("random_state"))
+
+# Cada fábrica importa la librería de su modelo al llamarse, no al importar este módulo
+_FABRICAS_MODELOS = {
+    "LinearRegression": _linear_regression,
+    "Ridge": _ridge,
+    "Lasso": _lasso,
+    "RandomForestRegressor": _random_forest_regressor,
+    "XGBRegressor": _xgb_regressor,
+}
+
 def _get_model_instance(model_name: str, params: Dict[str, Any]):
-    """Retorna una instancia del modelo basado en el nombre."""
-    model_map = {
-        "LinearRegression": LinearRegression(),
-        "Ridge": Ridge(),
-        "Lasso": Lasso(),
-        "RandomForestRegressor": RandomForestRegressor(random_state=params.get("random_state")),
-        "XGBRegressor": XGBRegressor(random_state=params.get("random_state")),
-    }
-    if model_name not in model_map:
+    """Retorna una instancia del modelo basado en el nombre.
+
+    Con ``params["cache_cuantizacion"]`` XGBoost construye el ``QuantileDMatrix`` de cada
+    fold una sola vez para todos los candidatos (ver ``utils.cuantizacion``). Sólo se
+    importa la librería del modelo pedido.
+    """
+    if model_name not in _FABRICAS_MODELOS:
         raise ValueError(f"Modelo '{model_name}' no soportado.")
-    return model_map[model_name]
+    return _FABRICAS_MODELOS[model_name](params)
 
 def train_model_with_grid_search(
     X_train: pd.DataFrame, 
     y_train: pd.Series, 
     model_name: str, 
-    params: Dict[str, Any]
+    params: Dict[str, Any],
+    plan_cv: Optional[pd.DataFrame] = None,
 ) -> Any:
     """
-    Entrena un modelo de regresión usando GridSearchCV para encontrar los mejores hiperparámetros.
+    Entrena un modelo de regresión buscando los mejores hiperparámetros con la estrategia
+    configurada en ``params["search"]`` (grid, random, halving_grid o halving_random).
 
     Args:
         X_train: DataFrame de características de entrenamiento.
         y_train: Serie del target de entrenamiento.
         model_name: Nombre del modelo a entrenar.
-        params: Diccionario de parámetros que incluye la grilla para GridSearchCV.
+        params: Diccionario de parámetros que incluye la grilla y la estrategia de búsqueda.
+            Con ``parada_temprana.activo`` los modelos de boosting y los random forests
+            eligen el número de árboles con parada temprana (``n_estimators`` de la grilla
+            pasa a ser el máximo).
+        plan_cv: Plan de CV compartido; si se indica, se usan sus folds en lugar de un
+            ``KFold`` propio.
 
     Returns:
-        El mejor estimador encontrado por GridSearchCV.
+        El mejor estimador encontrado por la búsqueda.
     """
+    from sklearn.model_selection import KFold
+
+    from ml_analisis_ecosistema_dev.utils.busqueda import configuracion_busqueda, crear_busqueda, numero_candidatos
+    from ml_analisis_ecosistema_dev.utils.parada_temprana import (
+        admite_parada_temprana,
+        envolver_con_parada_temprana,
+        rondas_usadas,
+    )
+
     model = _get_model_instance(model_name, params)
     param_grid = params["models"][model_name]["param_grid"]
+    # `base` es el modelo sin envolver: recibe los hilos aunque se use parada temprana
+    base = model
+    configuracion = configuracion_busqueda(params, model_name)
+    parada_temprana = params.get("parada_temprana", {})
+    if parada_temprana.get("activo") and admite_parada_temprana(model_name, configuracion):
+        model, param_grid = envolver_con_parada_temprana(
+            model, param_grid, parada_temprana, scoring=params.get("scoring", "neg_root_mean_squared_error")
+        )
     
-    cv = KFold(n_splits=params.get("cv_folds", 5), shuffle=True, random_state=params.get("random_state"))
+    cv = validador_del_plan(
+        plan_cv,
+        y_train.index,
+        KFold(n_splits=params.get("cv_folds", 5), shuffle=True, random_state=params.get("random_state")),
+    )
     
-    grid_search = GridSearchCV(
+    asignacion = asignar_nucleos(
+        params.get("recursos"), numero_candidatos(param_grid, configuracion) * cv.get_n_splits()
+    )
+    if asignacion is not None:
+        fijar_hilos_estimador(base, asignacion.hilos_estimador)
+        logger.info(
+            f"Presupuesto de CPU para {model_name}: {asignacion.nucleos_nodo} núcleos "
+            f"({asignacion.n_jobs_cv} workers de CV x {asignacion.hilos_estimador} hilos por estimador)."
+        )
+
+    grid_search = crear_busqueda(
         estimator=model,
         param_grid=param_grid,
         cv=cv,
         scoring=params.get("scoring", "neg_root_mean_squared_error"),
-        n_jobs=-1,
-        verbose=1,
-        error_score='raise' # Añadido para depuración
+        configuracion=configuracion,
+        random_state=params.get("random_state"),
+        n_jobs=asignacion.n_jobs_cv if asignacion is not None else -1,
     )
     
-    logger.info(f"Iniciando GridSearchCV para el modelo {model_name}...")
-    grid_search.fit(X_train, y_train)
+    logger.info(f"Iniciando {type(grid_search).__name__} para el modelo {model_name}...")
+    inicio = time.perf_counter()
+    with limitar_hilos(asignacion):
+        grid_search.fit(X_train, y_train)
     
     logger.info(f"Mejores parámetros para {model_name}: {grid_search.best_params_}")
+    logger.info(f"Búsqueda de {model_name} completada en {time.perf_counter() - inicio:.1f} s.")
+    if rondas_usadas(grid_search.best_estimator_) is not None:
+        logger.info(f"Árboles usados por {model_name} tras la parada temprana: {rondas_usadas(grid_search.best_estimator_)}")
     
     return grid_search.best_estimator_
 
 def report_and_select_best_model(
     X_test: pd.DataFrame,
     y_test: pd.Series,
+    evaluacion: Optional[Dict[str, Any]] = None,
     **models
 ) -> Dict[str, Any]:
     """
     Evalúa múltiples modelos, genera un informe de métricas, selecciona el mejor
     y lo guarda.
 
+    Las predicciones de todos los modelos se calculan a la vez y por bloques de filas
+    (utils/evaluacion.py); las métricas salen de los residuos en una sola pasada. Cada
+    modelo incluye además el intervalo de confianza bootstrap de RMSE, MAE y R² en
+    `intervalo_confianza`, calculado sobre esas mismas predicciones.
+
     Args:
         models: Un diccionario con los modelos entrenados.
         X_test: DataFrame de características de prueba.
         y_test: Serie del target de prueba.
+        evaluacion: `n_jobs` (modelos evaluados a la vez), `filas_por_bloque` y
+            `bootstrap` (`remuestreos`, `nivel`, `semilla`).
 
     Returns:
         Un diccionario con el mejor modelo y las métricas de todos los modelos.
     """
+    from ml_analisis_ecosistema_dev.utils.parada_temprana import rondas_usadas
+
+    evaluacion = evaluacion or {}
     metrics_report = {}
     best_model = None
     best_r2 = -np.inf
+    best_name = None
+    bootstrap = configuracion_bootstrap(evaluacion)
 
     logger.info("--- Informe de Evaluación de Modelos de Regresión ---")
-    
+
+    predicciones = predecir_modelos(
+        models,
+        X_test,
+        filas_por_bloque=evaluacion.get("filas_por_bloque") or FILAS_POR_BLOQUE,
+        n_jobs=evaluacion.get("n_jobs", -1),
+    )
     for model_name, model in models.items():
-        y_pred = model.predict(X_test)
-        
-        rmse = np.sqrt(mean_squared_error(y_test, y_pred))
-        mae = mean_absolute_error(y_test, y_pred)
-        r2 = r2_score(y_test, y_pred)
-        
-        metrics_report[model_name] = {"rmse": rmse, "mae": mae, "r2": r2}
+        metrics_report[model_name] = metricas_regresion(y_test, predicciones[model_name])
+        rmse, mae, r2 = (metrics_report[model_name][clave] for clave in ("rmse", "mae", "r2"))
+        if rondas_usadas(model) is not None:
+            metrics_report[model_name]["n_estimators_usados"] = rondas_usadas(model)
         
         logger.info(f"Modelo: {model_name}")
         logger.info(f"  - R^2: {r2:.4f}")
         logger.info(f"  - RMSE: {rmse:.4f}")
         logger.info(f"  - MAE: {mae:.4f}")
+
+        if bootstrap["remuestreos"]:
+            intervalo = intervalos_bootstrap(
+                metricas_regresion_ponderadas, y_test, predicciones[model_name], **bootstrap
+            )
+            metrics_report[model_name]["intervalo_confianza"] = intervalo
+            logger.info(f"  - IC {intervalo['nivel']:.0%} R^2: [{intervalo['r2'][0]:.4f}, {intervalo['r2'][1]:.4f}]")
         
         if r2 > best_r2:
             best_r2 = r2
             best_model = model
+            best_name = model_name
             
     logger.info("--- Fin del Informe ---")
-    logger.info(f"Mejor modelo seleccionado: {type(best_model).__name__} (R^2: {best_r2:.4f})")
+    logger.info(f"Mejor modelo seleccionado: {type(getattr(best_model, 'estimator_', best_model)).__name__} (R^2: {best_r2:.4f})")
+    empatados = solapan_con_el_mejor(metrics_report, best_name, "r2")
+    if empatados:
+        logger.info(f"El intervalo de R^2 del mejor modelo se solapa con el de: {', '.join(empatados)}")
 
     return {
         "best_regression_model": best_model,
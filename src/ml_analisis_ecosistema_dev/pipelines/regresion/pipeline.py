@@ -27,7 +27,7 @@ def create_pipeline(**kwargs) -> Pipeline:
     # 1. Nodo para dividir los datos
     split_data_node = node(
         func=split_data,
-        inputs=["datos_para_modelado", regression_params],
+        inputs=["datos_para_modelado", regression_params, "plan_cv"],
         outputs=dict(
             X_train="X_train",
             X_test="X_test",
@@ -48,6 +48,7 @@ def create_pipeline(**kwargs) -> Pipeline:
                     "y_train",
                     f"params:regression_pipeline.models.{model_name}.model_name", # Pasamos el nombre del modelo
                     regression_params,
+                    "plan_cv", # Folds compartidos con el resto de nodos de entrenamiento
                 ],
                 outputs=f"{model_name}_model", # Salida única para el modelo entrenado
                 name=f"train_{model_name}_node",
@@ -59,6 +60,7 @@ def create_pipeline(**kwargs) -> Pipeline:
     report_inputs = {f"{name}_model": f"{name}_model" for name in model_names}
     report_inputs["X_test"] = "X_test"
     report_inputs["y_test"] = "y_test"
+    report_inputs["evaluacion"] = "params:regression_pipeline.evaluacion"
 
     report_and_select_node = node(
         func=report_and_select_best_model,
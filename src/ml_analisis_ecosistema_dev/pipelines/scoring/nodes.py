@@ -0,0 +1,97 @@
+"""
+Nodos para el pipeline de scoring.
+"""
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+import numpy as np
+import pandas as pd
+
+from ml_analisis_ecosistema_dev.pipelines.procesamiento_de_datos.preprocesador import PreprocesadorAllowlist
+from ml_analisis_ecosistema_dev.utils.evaluacion import UMBRAL_CLASIFICACION, umbral_en_probabilidad
+from ml_analisis_ecosistema_dev.utils.matrices import preparar_caracteristicas
+from ml_analisis_ecosistema_dev.utils.memoria import pico_memoria_mb
+
+logger = logging.getLogger(__name__)
+
+# Prefijo de las particiones de `predicciones_scoring`
+PREFIJO_LOTE = "lote_"
+
+
+def puntuar_lote(
+    lote: pd.DataFrame,
+    preprocesador: PreprocesadorAllowlist,
+    regresion_model: Any,
+    clasificacion_model: Any,
+    params: Dict[str, Any],
+) -> pd.DataFrame:
+    """Aplica el preprocesamiento persistido y ambos modelos a un lote de encuestados.
+
+    Returns:
+        Un DataFrame con el salario predicho, la probabilidad de superar el umbral y la
+        clase predicha (derivada de la misma probabilidad, sin un segundo ``predict``,
+        salvo en los modelos cuyo ``predict`` no sigue ese umbral, como ``SVC``).
+    """
+    X = preparar_caracteristicas(preprocesador.transform(lote))
+    probabilidad = clasificacion_model.predict_proba(X)[:, 1]
+
+    predicciones = pd.DataFrame(index=lote.index)
+    id_col = params.get("id_col")
+    if id_col and id_col in lote.columns:
+        predicciones[id_col] = lote[id_col].to_numpy()
+    predicciones["salario_predicho"] = regresion_model.predict(X)
+    predicciones["probabilidad_salario_alto"] = probabilidad
+    if umbral_en_probabilidad(clasificacion_model):
+        predicciones["salario_alto"] = (probabilidad > UMBRAL_CLASIFICACION).astype(np.int8)
+    else:
+        predicciones["salario_alto"] = np.asarray(clasificacion_model.predict(X)).astype(np.int8)
+    return predicciones
+
+
+def _vaciar_particiones(directorio: Path) -> None:
+    """Borra las particiones ``lote_*`` que dejó una ejecución anterior en ``directorio``."""
+    anteriores = list(directorio.glob(f"{PREFIJO_LOTE}*")) if directorio.is_dir() else []
+    for particion in anteriores:
+        particion.unlink()
+    if anteriores:
+        logger.info(f"Eliminadas {len(anteriores)} particiones de la ejecución anterior en '{directorio}'.")
+
+
+def puntuar_por_lotes(
+    lotes: Iterator[pd.DataFrame],
+    preprocesador: PreprocesadorAllowlist,
+    regresion_model: Any,
+    clasificacion_model: Any,
+    params: Dict[str, Any],
+) -> Iterator[Dict[str, pd.DataFrame]]:
+    """Puntúa un fichero arbitrariamente grande lote a lote.
+
+    Es un nodo generador: cada lote se guarda como una partición Parquet antes de leer el
+    siguiente, así que la memoria queda acotada por el tamaño del lote. Con
+    ``params["directorio_salida"]`` se borran antes las particiones ``lote_*`` de la
+    ejecución anterior: un fichero más pequeño no deja lotes antiguos mezclados.
+
+    Yields:
+        Un diccionario ``{id_particion: predicciones}`` por lote.
+    """
+    logger.info("--- Iniciando Scoring por Lotes ---")
+    if params.get("directorio_salida"):
+        _vaciar_particiones(Path(params["directorio_salida"]))
+    inicio = time.perf_counter()
+    total_filas = 0
+
+    for numero, lote in enumerate(lotes):
+        predicciones = puntuar_lote(lote, preprocesador, regresion_model, clasificacion_model, params)
+        total_filas += len(predicciones)
+        logger.info(f"Lote {numero}: {len(predicciones)} filas puntuadas ({total_filas} acumuladas).")
+        yield {f"{PREFIJO_LOTE}{numero:05d}": predicciones}
+
+    duracion = time.perf_counter() - inicio
+    pico = pico_memoria_mb()
+    logger.info(
+        f"--- Scoring Completado: {total_filas} filas en {duracion:.2f} s "
+        f"({total_filas / max(duracion, 1e-9):,.0f} filas/s), "
+        f"pico de memoria {'n/d' if pico is None else f'{pico:,.0f} MB'} ---"
+    )
@@ -0,0 +1,25 @@
+"""
+Pipeline para puntuar encuestados nuevos con los modelos de regresión y clasificación.
+"""
+
+from kedro.pipeline import Pipeline, node, pipeline
+from .nodes import puntuar_por_lotes
+
+
+def create_pipeline(**kwargs) -> Pipeline:
+    return pipeline(
+        [
+            node(
+                func=puntuar_por_lotes,
+                inputs=[
+                    "datos_a_puntuar",
+                    "preprocesador_allowlist",
+                    "regresion_model",
+                    "clasificacion_model",
+                    "params:scoring_params",
+                ],
+                outputs="predicciones_scoring",
+                name="puntuar_por_lotes_node",
+            ),
+        ]
+    )
@@ -0,0 +1,9 @@
+"""
+Servicio HTTP local (ASGI) de predicción con micro-lotes para el regresor salarial y el
+clasificador de salario alto.
+"""
+
+from .app import ServicioPrediccion, crear_app
+from .microlotes import AgrupadorMicrolotes
+
+__all__ = ["AgrupadorMicrolotes", "ServicioPrediccion", "crear_app"]
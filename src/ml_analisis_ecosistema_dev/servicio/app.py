@@ -0,0 +1,157 @@
+"""
+Aplicación ASGI mínima (sin framework) que carga los artefactos de ``data/06_models`` una
+sola vez y atiende predicciones agrupándolas en micro-lotes.
+
+Ejecución local (requiere ``uvicorn``)::
+
+    uvicorn --factory ml_analisis_ecosistema_dev.servicio.app:crear_app --port 8000
+
+Endpoints:
+    ``GET /health``: estado del servicio.
+    ``POST /predict``: un encuestado (objeto JSON) o una lista de encuestados.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pandas as pd
+
+from ml_analisis_ecosistema_dev.pipelines.scoring.nodes import puntuar_lote
+from ml_analisis_ecosistema_dev.utils.modelos_nativos import cargar_modelo_nativo
+
+from .microlotes import AgrupadorMicrolotes
+
+logger = logging.getLogger(__name__)
+
+DIRECTORIO_MODELOS = "data/06_models"
+
+
+def _es_peticion_valida(datos: Any) -> bool:
+    """Un encuestado (objeto JSON) o una lista no vacía de encuestados."""
+    if isinstance(datos, list):
+        return bool(datos) and all(isinstance(fila, dict) for fila in datos)
+    return isinstance(datos, dict)
+
+
+def cargar_artefactos(directorio: str = DIRECTORIO_MODELOS) -> Dict[str, Any]:
+    """Carga el preprocesador y los mejores modelos guardados por los pipelines.
+
+    Los modelos son artefactos nativos (``utils/modelos_nativos.py``): los boosters se leen
+    del disco en la primera predicción, no al arrancar.
+    """
+    directorio = Path(directorio)
+    # `pickle` directamente: `PickleDataset` arrastraría Kedro al arranque del servicio
+    with open(directorio / "preprocesador_allowlist.pkl", "rb") as fichero:
+        preprocesador = pickle.load(fichero)
+    return {
+        "preprocesador_allowlist": preprocesador,
+        **{
+            nombre: cargar_modelo_nativo(directorio / nombre)
+            for nombre in ("regresion_model", "clasificacion_model")
+        },
+    }
+
+
+class ServicioPrediccion:
+    """Aplicación ASGI de predicción con micro-lotes."""
+
+    def __init__(self, artefactos: Dict[str, Any], max_lote: int = 64, max_espera_ms: float = 5.0) -> None:
+        self._artefactos = artefactos
+        self.agrupador = AgrupadorMicrolotes(self.predecir_lote, max_lote=max_lote, max_espera_ms=max_espera_ms)
+
+    def predecir_lote(self, filas: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Puntúa un lote de encuestados con una sola llamada a cada modelo."""
+        predicciones = puntuar_lote(
+            pd.DataFrame.from_records(filas),
+            self._artefactos["preprocesador_allowlist"],
+            self._artefactos["regresion_model"],
+            self._artefactos["clasificacion_model"],
+            params={},
+        )
+        columnas = {col: predicciones[col].tolist() for col in predicciones.columns}
+        return [dict(zip(columnas, valores)) for valores in zip(*columnas.values())]
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._http(scope, receive, send)
+
+    async def _lifespan(self, receive, send) -> None:
+        while True:
+            mensaje = await receive()
+            if mensaje["type"] == "lifespan.startup":
+                await self.agrupador.iniciar()
+                await send({"type": "lifespan.startup.complete"})
+            elif mensaje["type"] == "lifespan.shutdown":
+                await self.agrupador.detener()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _http(self, scope, receive, send) -> None:
+        metodo, ruta = scope["method"], scope["path"]
+        if metodo == "GET" and ruta == "/health":
+            await _responder(send, 200, {"estado": "ok"})
+            return
+        if metodo != "POST" or ruta != "/predict":
+            await _responder(send, 404, {"error": f"Ruta no encontrada: {metodo} {ruta}"})
+            return
+
+        cuerpo = b""
+        while True:
+            mensaje = await receive()
+            cuerpo += mensaje.get("body", b"")
+            if not mensaje.get("more_body"):
+                break
+        try:
+            datos = json.loads(cuerpo)
+        except json.JSONDecodeError as exc:
+            await _responder(send, 400, {"error": f"JSON inválido: {exc}"})
+            return
+        # Se valida antes de encolar: una fila mal formada no debe llegar al micro-lote
+        # que comparte con las peticiones de otros clientes.
+        if not _es_peticion_valida(datos):
+            await _responder(send, 400, {"error": "Se esperaba un objeto JSON o una lista no vacía de objetos."})
+            return
+
+        try:
+            if isinstance(datos, list):
+                # Una lista ya es un lote: se puntúa en un hilo, sin pasar por la cola ni
+                # bloquear el bucle de eventos
+                resultado = await asyncio.get_running_loop().run_in_executor(None, self.predecir_lote, datos)
+            else:
+                resultado = await self.agrupador.enviar(datos)
+        except Exception:  # noqa: BLE001 - el detalle queda en el log, no en la respuesta
+            logger.exception("Error al puntuar una petición")
+            await _responder(send, 500, {"error": "Error interno al puntuar la petición."})
+            return
+        await _responder(send, 200, resultado)
+
+
+async def _responder(send, estado: int, contenido: Any) -> None:
+    cuerpo = json.dumps(contenido).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": estado,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(cuerpo)).encode())],
+        }
+    )
+    await send({"type": "http.response.body", "body": cuerpo})
+
+
+def crear_app() -> ServicioPrediccion:
+    """Factoría para ``uvicorn --factory``; se configura con variables de entorno.
+
+    ``SERVICIO_DIRECTORIO_MODELOS``, ``SERVICIO_MAX_LOTE`` y ``SERVICIO_MAX_ESPERA_MS``.
+    """
+    artefactos = cargar_artefactos(os.environ.get("SERVICIO_DIRECTORIO_MODELOS", DIRECTORIO_MODELOS))
+    max_lote = int(os.environ.get("SERVICIO_MAX_LOTE", 64))
+    max_espera_ms = float(os.environ.get("SERVICIO_MAX_ESPERA_MS", 5.0))
+    logger.info(f"Servicio de predicción listo (max_lote={max_lote}, max_espera_ms={max_espera_ms}).")
+    return ServicioPrediccion(artefactos, max_lote=max_lote, max_espera_ms=max_espera_ms)
@@ -0,0 +1,95 @@
+"""
+Generador de carga local para el servicio de predicción. Envía peticiones de una fila con
+conexiones HTTP/1.1 persistentes concurrentes e informa latencias p50/p99 y throughput.
+
+Uso::
+
+    python -m ml_analisis_ecosistema_dev.servicio.carga \\
+        --datos data/01_raw/scoring/encuestados_nuevos.csv --peticiones 5000 --concurrencia 64
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Dict, List
+from urllib.parse import urlparse
+
+import numpy as np
+import pandas as pd
+
+
+async def _cliente(host: str, puerto: int, ruta: str, cuerpos: List[bytes], latencias: List[float]) -> None:
+    lector, escritor = await asyncio.open_connection(host, puerto)
+    try:
+        for cuerpo in cuerpos:
+            peticion = (
+                f"POST {ruta} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(cuerpo)}\r\n\r\n"
+            ).encode() + cuerpo
+            inicio = time.perf_counter()
+            escritor.write(peticion)
+            await escritor.drain()
+            cabeceras = await lector.readuntil(b"\r\n\r\n")
+            estado = int(cabeceras.split(b" ", 2)[1])
+            longitud = next(
+                int(linea.split(b":", 1)[1])
+                for linea in cabeceras.split(b"\r\n")
+                if linea.lower().startswith(b"content-length")
+            )
+            respuesta = await lector.readexactly(longitud)
+            latencias.append(time.perf_counter() - inicio)
+            if estado != 200:
+                raise RuntimeError(f"Respuesta {estado}: {respuesta.decode()}")
+    finally:
+        escritor.close()
+        await escritor.wait_closed()
+
+
+async def generar_carga(url: str, filas: List[Dict[str, Any]], peticiones: int, concurrencia: int) -> Dict[str, float]:
+    """Envía ``peticiones`` filas repartidas entre ``concurrencia`` conexiones.
+
+    Returns:
+        Un diccionario con throughput (peticiones/s) y latencias p50/p99 en milisegundos.
+    """
+    destino = urlparse(url)
+    cuerpos = [json.dumps(filas[i % len(filas)]).encode() for i in range(peticiones)]
+    latencias: List[float] = []
+
+    inicio = time.perf_counter()
+    await asyncio.gather(
+        *(
+            _cliente(destino.hostname, destino.port or 80, destino.path, cuerpos[i::concurrencia], latencias)
+            for i in range(concurrencia)
+        )
+    )
+    duracion = time.perf_counter() - inicio
+
+    latencias_ms = np.array(latencias) * 1000
+    return {
+        "peticiones": len(latencias),
+        "concurrencia": concurrencia,
+        "duracion_s": duracion,
+        "throughput_rps": len(latencias) / duracion,
+        "latencia_p50_ms": float(np.percentile(latencias_ms, 50)),
+        "latencia_p99_ms": float(np.percentile(latencias_ms, 99)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://127.0.0.1:8000/predict")
+    parser.add_argument("--datos", required=True, help="CSV o Parquet con encuestados de ejemplo.")
+    parser.add_argument("--peticiones", type=int, default=5000)
+    parser.add_argument("--concurrencia", type=int, default=64)
+    args = parser.parse_args()
+
+    datos = pd.read_parquet(args.datos) if args.datos.endswith(".parquet") else pd.read_csv(args.datos, nrows=10_000)
+    # `to_json` convierte NaN en null y los tipos numpy en tipos JSON
+    filas = json.loads(datos.to_json(orient="records"))
+    resultado = asyncio.run(generar_carga(args.url, filas, args.peticiones, args.concurrencia))
+    print(json.dumps(resultado, indent=2))
+
+
+if __name__ == "__main__":
+    main()
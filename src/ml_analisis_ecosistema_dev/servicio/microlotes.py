@@ -0,0 +1,104 @@
+"""
+Agrupación de peticiones concurrentes de una fila en micro-lotes.
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Fila = Dict[str, Any]
+
+
+class AgrupadorMicrolotes:
+    """Acumula filas enviadas de forma concurrente y las procesa en lotes.
+
+    Un lote se cierra al alcanzar ``max_lote`` filas o cuando vence ``max_espera_ms``
+    desde la llegada de su primera fila. La función de lote se ejecuta en un hilo para no
+    bloquear el bucle de eventos; mientras tanto, las peticiones nuevas se acumulan para
+    el lote siguiente.
+
+    Si un lote falla, sus filas se vuelven a procesar de una en una: sólo las peticiones
+    cuyas filas fallan por sí solas reciben el error.
+    """
+
+    def __init__(
+        self,
+        funcion_lote: Callable[[List[Fila]], List[Fila]],
+        max_lote: int = 64,
+        max_espera_ms: float = 5.0,
+    ) -> None:
+        self._funcion_lote = funcion_lote
+        self._max_lote = max_lote
+        self._max_espera = max_espera_ms / 1000
+        self._cola: Optional[asyncio.Queue] = None
+        self._tarea: Optional[asyncio.Task] = None
+
+    async def iniciar(self) -> None:
+        self._cola = asyncio.Queue()
+        self._tarea = asyncio.create_task(self._bucle())
+
+    async def detener(self) -> None:
+        if self._tarea is not None:
+            self._tarea.cancel()
+            try:
+                await self._tarea
+            except asyncio.CancelledError:
+                pass
+            self._tarea = None
+
+    async def enviar(self, fila: Fila) -> Fila:
+        """Encola una fila y espera su resultado."""
+        futuro = asyncio.get_running_loop().create_future()
+        await self._cola.put((fila, futuro))
+        return await futuro
+
+    async def _recoger_lote(self) -> List[Tuple[Fila, asyncio.Future]]:
+        loop = asyncio.get_running_loop()
+        lote = [await self._cola.get()]
+        limite = loop.time() + self._max_espera
+        while len(lote) < self._max_lote:
+            restante = limite - loop.time()
+            if restante <= 0:
+                break
+            try:
+                lote.append(await asyncio.wait_for(self._cola.get(), restante))
+            except asyncio.TimeoutError:
+                break
+        return lote
+
+    def _procesar_por_filas(self, filas: List[Fila]) -> List[Tuple[Optional[Fila], Optional[Exception]]]:
+        """Procesa cada fila como un lote de una: devuelve (resultado, error) por fila."""
+        salida = []
+        for fila in filas:
+            try:
+                salida.append((self._funcion_lote([fila])[0], None))
+            except Exception as exc:  # noqa: BLE001 - el error se entrega a su petición
+                salida.append((None, exc))
+        return salida
+
+    async def _bucle(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            lote = await self._recoger_lote()
+            filas = [fila for fila, _ in lote]
+            try:
+                resultados = [
+                    (resultado, None)
+                    for resultado in await loop.run_in_executor(None, self._funcion_lote, filas)
+                ]
+            except Exception as exc:  # noqa: BLE001 - se aísla la fila que falla
+                if len(lote) == 1:
+                    logger.exception("Error al procesar una fila")
+                    resultados = [(None, exc)]
+                else:
+                    logger.warning(f"Falló un micro-lote de {len(lote)} filas ({exc!r}); se reprocesa fila a fila.")
+                    resultados = await loop.run_in_executor(None, self._procesar_por_filas, filas)
+            for (_, futuro), (resultado, error) in zip(lote, resultados):
+                if futuro.done():
+                    continue
+                if error is not None:
+                    futuro.set_exception(error)
+                else:
+                    futuro.set_result(resultado)
@@ -0,0 +1 @@
+"""Utilidades compartidas por los pipelines de modelado."""
@@ -0,0 +1,172 @@
+"""
+Construcción de la búsqueda de hiperparámetros según la estrategia configurada en
+``parameters_data_science.yml`` (clave ``search`` de cada pipeline de modelado).
+"""
+
+import logging
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+from scipy import stats
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import (
+    GridSearchCV,
+    HalvingGridSearchCV,
+    HalvingRandomSearchCV,
+    ParameterGrid,
+    RandomizedSearchCV,
+)
+from sklearn.model_selection._search import BaseSearchCV
+
+from .camino_regularizacion import BusquedaCaminoRegularizacion, parametro_del_camino
+
+logger = logging.getLogger(__name__)
+
+ESTRATEGIAS = ("grid", "random", "halving_grid", "halving_random")
+
+DISTRIBUCIONES = {
+    "loguniform": lambda low, high: stats.loguniform(low, high),
+    "uniform": lambda low, high: stats.uniform(low, high - low),
+    "randint": lambda low, high: stats.randint(low, high + 1),
+}
+
+
+def configuracion_busqueda(params: Dict[str, Any], model_name: str) -> Dict[str, Any]:
+    """Configuración de búsqueda del pipeline, con la del modelo (si existe) por encima."""
+    return {
+        "strategy": "grid",
+        **params.get("search", {}),
+        **params["models"][model_name].get("search", {}),
+    }
+
+
+def _expandir_grilla(param_grid: Dict[str, Any]) -> Dict[str, Any]:
+    """Expande las entradas ``{distribucion: logspace, low, high, n}`` en listas de valores."""
+    return {
+        nombre: (
+            list(np.logspace(valores["low"], valores["high"], valores["n"]))
+            if isinstance(valores, dict) and valores.get("distribucion") == "logspace"
+            else valores
+        )
+        for nombre, valores in param_grid.items()
+    }
+
+
+def numero_candidatos(param_grid: Dict[str, Any], configuracion: Dict[str, Any]) -> int:
+    """Candidatos que evalúa la búsqueda en su primera ronda (la más costosa)."""
+    param_grid = _expandir_grilla(param_grid)
+    if configuracion["strategy"] == "random":
+        return configuracion.get("n_iter", 10)
+    if any(isinstance(valores, dict) for valores in param_grid.values()):
+        n_candidates = configuracion.get("n_candidates", "exhaust")
+        return n_candidates if isinstance(n_candidates, int) else 1
+    return len(ParameterGrid({nombre: list(valores) for nombre, valores in param_grid.items()}))
+
+
+def _espacio_busqueda(param_grid: Dict[str, Any], aleatoria: bool) -> Dict[str, Any]:
+    """Convierte las entradas ``{distribucion, low, high}`` en distribuciones de scipy."""
+    espacio = {}
+    for nombre, valores in _expandir_grilla(param_grid).items():
+        if isinstance(valores, dict):
+            if not aleatoria:
+                raise ValueError(
+                    f"El hiperparámetro '{nombre}' usa una distribución; "
+                    f"sólo las estrategias aleatorias la admiten."
+                )
+            espacio[nombre] = DISTRIBUCIONES[valores["distribucion"]](valores["low"], valores["high"])
+        else:
+            espacio[nombre] = list(valores)
+    return espacio
+
+
+def crear_busqueda(
+    estimator: Any,
+    param_grid: Dict[str, Any],
+    cv: Any,
+    scoring: str,
+    configuracion: Dict[str, Any],
+    random_state: Optional[int] = None,
+    prefijo: str = "",
+    n_jobs: int = -1,
+) -> Union[BaseSearchCV, BusquedaCaminoRegularizacion]:
+    """Crea el buscador de hiperparámetros para la estrategia indicada.
+
+    Args:
+        estimator: Estimador o pipeline a ajustar.
+        param_grid: Grilla de ``parameters_data_science.yml``. Admite
+            ``{distribucion: logspace, low, high, n}`` (``n`` valores en escala log) y, con
+            estrategias aleatorias, ``{distribucion: loguniform|uniform|randint, low, high}``.
+        cv: Validador cruzado.
+        scoring: Métrica de sklearn.
+        configuracion: Resultado de ``configuracion_busqueda``. Claves: ``strategy``,
+            ``n_iter`` (aleatoria), ``factor``, ``resource``, ``min_resources`` y
+            ``max_resources`` (successive halving) y ``camino_regularizacion``.
+        random_state: Semilla para las estrategias aleatorias.
+        prefijo: Prefijo de los hiperparámetros del modelo dentro de ``estimator``
+            (``"model__"`` en el pipeline de clasificación).
+        n_jobs: Workers de validación cruzada (ver ``utils.recursos.asignar_nucleos``).
+
+    Returns:
+        Un ``GridSearchCV``, ``RandomizedSearchCV``, ``HalvingGridSearchCV`` o
+        ``HalvingRandomSearchCV`` sin ajustar. Si la grilla de ``grid`` sólo recorre la
+        regularización de Ridge, Lasso o LogisticRegression (y ``camino_regularizacion``
+        no es ``false``), una ``BusquedaCaminoRegularizacion`` equivalente.
+    """
+    estrategia = configuracion["strategy"]
+    if estrategia not in ESTRATEGIAS:
+        raise ValueError(f"Estrategia de búsqueda '{estrategia}' no soportada. Opciones: {ESTRATEGIAS}.")
+
+    aleatoria = estrategia in ("random", "halving_random")
+    espacio = _espacio_busqueda(param_grid, aleatoria)
+    comunes = dict(estimator=estimator, cv=cv, scoring=scoring, n_jobs=n_jobs, verbose=1, error_score="raise")
+
+    if estrategia == "grid":
+        parametro = parametro_del_camino(estimator, espacio, prefijo)
+        if parametro is not None and configuracion.get("camino_regularizacion", True):
+            return BusquedaCaminoRegularizacion(
+                estimator,
+                parametro,
+                espacio[f"{prefijo}{parametro}"],
+                cv=cv,
+                scoring=scoring,
+                n_jobs=n_jobs,
+                prefijo=prefijo,
+            )
+        return GridSearchCV(param_grid=espacio, **comunes)
+    if estrategia == "random":
+        return RandomizedSearchCV(
+            param_distributions=espacio, n_iter=configuracion.get("n_iter", 10), random_state=random_state, **comunes
+        )
+
+    # Successive halving: el recurso es el número de filas o de árboles del modelo
+    resource = configuracion.get("resource", "n_samples")
+    min_resources = configuracion.get("min_resources", "exhaust")
+    max_resources = configuracion.get("max_resources", "auto")
+    if resource != "n_samples":
+        resource = f"{prefijo}{resource}"
+        if resource not in estimator.get_params():
+            # `min_resources`/`max_resources` estaban en unidades del recurso configurado
+            # (p. ej. árboles): como número de filas no tienen sentido
+            logger.warning(
+                f"El estimador no tiene '{resource}'; se usa 'n_samples' como recurso con "
+                f"min_resources='exhaust' y max_resources='auto'."
+            )
+            resource, min_resources, max_resources = "n_samples", "exhaust", "auto"
+        elif resource in espacio:
+            # El recurso lo asigna la búsqueda; no puede formar parte de la grilla
+            espacio.pop(resource)
+    halving = dict(
+        factor=configuracion.get("factor", 3),
+        resource=resource,
+        min_resources=min_resources,
+        max_resources=max_resources,
+        random_state=random_state,
+        **comunes,
+    )
+    if resource != "n_samples" and halving["max_resources"] == "auto":
+        raise ValueError(f"Con resource='{resource}' hay que indicar 'max_resources'.")
+    if estrategia == "halving_grid":
+        return HalvingGridSearchCV(param_grid=espacio, **halving)
+    return HalvingRandomSearchCV(
+        param_distributions=espacio, n_candidates=configuracion.get("n_candidates", "exhaust"), **halving
+    )
@@ -0,0 +1,135 @@
+"""
+Utilidades comunes de las cachés en disco por fold (SMOTE, conjuntos cuantizados de
+boosting): huella del contenido de un fold, bloqueo entre procesos y poda de las entradas
+menos usadas.
+
+Cada entrada es un fichero o directorio ``<clave>`` o ``<clave>.<extensión>`` acompañado de
+su fichero de bloqueo ``<clave>.lock``.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+import numpy as np
+from scipy import sparse
+
+try:
+    import fcntl
+except ImportError:  # Windows: sin bloqueo, en el peor caso un fold se calcula dos veces
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Entradas que conserva cada directorio de caché: las de más sobran entre ejecuciones
+MAX_ENTRADAS_CACHE = 32
+# Segundos sin usarse tras los que la poda borra un `.lock`
+PLAZO_BLOQUEOS_S = 600
+
+
+def huella_datos(X: Any, y: Any) -> str:
+    """Huella del contenido de un fold: equivale a (índices del fold, datos de origen)."""
+    huella = hashlib.blake2b(digest_size=16)
+    if sparse.issparse(X):
+        X = sparse.csr_matrix(X)
+        partes = [X.data, X.indices, X.indptr]
+        huella.update(repr(X.shape).encode())
+    else:
+        partes = [np.asarray(X)]
+        huella.update(json.dumps([str(col) for col in getattr(X, "columns", [])]).encode())
+    for parte in [*partes, np.asarray(y)]:
+        huella.update(repr((parte.dtype.str, parte.shape)).encode())
+        huella.update(np.ascontiguousarray(parte).data)
+    return huella.hexdigest()
+
+
+@contextmanager
+def bloqueo(ruta: Path) -> Iterator[None]:
+    """Bloqueo exclusivo entre procesos (workers de joblib, nodos en paralelo).
+
+    Si ``podar_cache`` borra el fichero mientras se espera, el bloqueo obtenido es el de un
+    fichero huérfano y se vuelve a pedir sobre el actual: dos procesos nunca calculan a la
+    vez la misma entrada.
+    """
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    while True:
+        fichero = open(ruta, "w")
+        if fcntl is None:
+            break
+        fcntl.flock(fichero, fcntl.LOCK_EX)
+        try:
+            vigente = os.stat(ruta).st_ino == os.fstat(fichero.fileno()).st_ino
+        except FileNotFoundError:
+            vigente = False
+        if vigente:
+            # La fecha del `.lock` es la de su último uso: la poda no borra los recientes
+            os.utime(fichero.fileno())
+            break
+        fichero.close()
+    with fichero:
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fichero, fcntl.LOCK_UN)
+
+
+def marcar_uso(entrada: Path) -> None:
+    """Actualiza la fecha de modificación de ``entrada`` para que la poda la trate como reciente."""
+    os.utime(entrada)
+
+
+def _modificacion(ruta: Path) -> float:
+    try:
+        return ruta.stat().st_mtime
+    except FileNotFoundError:  # Otro proceso la ha podado mientras tanto
+        return 0.0
+
+
+def podar_cache(directorio: Path, max_entradas: int = MAX_ENTRADAS_CACHE) -> List[str]:
+    """Deja en ``directorio`` las ``max_entradas`` entradas usadas más recientemente.
+
+    Las demás se borran. Su ``.lock``, y los que no tienen entrada (cálculos
+    interrumpidos), sólo se borran si nadie los ha usado en ``PLAZO_BLOQUEOS_S``
+    segundos; ``bloqueo`` reintenta si aun así pierde su fichero. Las claves que otro
+    proceso tiene bloqueadas se conservan. Sin ``fcntl`` (Windows) no se poda.
+
+    Returns:
+        Claves eliminadas.
+    """
+    if fcntl is None or not directorio.is_dir():
+        return []
+    rutas: Dict[str, List[Path]] = {ruta.stem: [] for ruta in directorio.glob("*.lock")}
+    for ruta in directorio.iterdir():
+        clave = ruta.name.split(".")[0]
+        if ruta.suffix != ".lock" and clave in rutas:
+            rutas[clave].append(ruta)
+    usos = {clave: max(map(_modificacion, entrada), default=0.0) for clave, entrada in rutas.items()}
+    conservadas = sorted((clave for clave in usos if rutas[clave]), key=usos.get, reverse=True)[:max_entradas]
+
+    eliminadas = []
+    for clave in set(rutas) - set(conservadas):
+        cerrojo = directorio / f"{clave}.lock"
+        with open(cerrojo, "a") as fichero:
+            try:
+                fcntl.flock(fichero, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                continue
+            for ruta in rutas[clave]:
+                if ruta.is_dir():
+                    shutil.rmtree(ruta, ignore_errors=True)
+                else:
+                    ruta.unlink(missing_ok=True)
+            if time.time() - os.fstat(fichero.fileno()).st_mtime > PLAZO_BLOQUEOS_S:
+                cerrojo.unlink(missing_ok=True)
+        if rutas[clave]:
+            eliminadas.append(clave)
+    if eliminadas:
+        logger.info(f"Caché '{directorio}': {len(eliminadas)} entradas eliminadas, {len(conservadas)} conservadas.")
+    return eliminadas
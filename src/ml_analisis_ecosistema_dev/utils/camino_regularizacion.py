@@ -0,0 +1,182 @@
+"""
+Búsqueda de la regularización de Ridge, Lasso y LogisticRegression a lo largo de su
+camino de regularización, en lugar de un ajuste independiente por valor y fold.
+
+- Ridge: una descomposición espectral de ``XᵀX`` por fold da la solución cerrada para
+  todos los ``alpha`` a la vez.
+- Lasso: ``lasso_path`` calcula todo el camino en una llamada, con warm start interno.
+- LogisticRegression: el camino se recorre de más a menos regularización con
+  ``warm_start``, de modo que cada ajuste parte de la solución del valor anterior.
+
+Se usa desde ``utils.busqueda.crear_busqueda`` cuando la grilla sólo contiene el
+parámetro de regularización y la estrategia es ``grid``.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from joblib import Parallel, delayed
+from scipy import sparse
+from sklearn.base import clone, is_classifier
+from sklearn.linear_model import Lasso, LogisticRegression, Ridge, lasso_path
+from sklearn.metrics import check_scoring
+from sklearn.model_selection import check_cv
+from sklearn.utils import _safe_indexing
+
+logger = logging.getLogger(__name__)
+
+# Parámetro de regularización de cada modelo y si el camino se recorre de forma ascendente
+CAMINOS = {Ridge: ("alpha", False), Lasso: ("alpha", False), LogisticRegression: ("C", True)}
+
+# Por encima de este número de columnas la descomposición de XᵀX deja de compensar
+MAX_COLUMNAS_RIDGE = 4000
+
+
+def _modelo_final(estimator: Any) -> Any:
+    return estimator.steps[-1][1] if hasattr(estimator, "steps") else estimator
+
+
+def parametro_del_camino(estimator: Any, param_grid: Dict[str, Any], prefijo: str = "") -> Optional[str]:
+    """Parámetro de regularización a recorrer, o ``None`` si la grilla no admite el camino."""
+    camino = CAMINOS.get(type(_modelo_final(estimator)))
+    if camino is None or set(param_grid) != {f"{prefijo}{camino[0]}"}:
+        return None
+    # En un pipeline sólo se admiten muestreadores (SMOTE) antes del modelo
+    if hasattr(estimator, "steps") and not all(hasattr(paso, "fit_resample") for _, paso in estimator.steps[:-1]):
+        return None
+    return camino[0]
+
+
+class BusquedaCaminoRegularizacion:
+    """Sustituto de ``GridSearchCV`` para una grilla de un solo parámetro de regularización.
+
+    Expone ``best_params_``, ``best_score_``, ``best_estimator_`` y ``cv_results_`` como
+    ``GridSearchCV``; el mejor valor se reajusta sobre todo el entrenamiento.
+    """
+
+    def __init__(
+        self,
+        estimator: Any,
+        parametro: str,
+        valores: Sequence[float],
+        cv: Any,
+        scoring: str,
+        n_jobs: Optional[int] = None,
+        prefijo: str = "",
+    ) -> None:
+        self.estimator = estimator
+        self.parametro = parametro
+        self.valores = list(valores)
+        self.cv = cv
+        self.scoring = scoring
+        self.n_jobs = n_jobs
+        self.prefijo = prefijo
+
+    def fit(self, X, y) -> "BusquedaCaminoRegularizacion":
+        cv = check_cv(self.cv, y, classifier=is_classifier(self.estimator))
+        folds = list(cv.split(X, y))
+        logger.info(
+            f"Camino de regularización de {type(_modelo_final(self.estimator)).__name__}: "
+            f"{len(self.valores)} valores de '{self.parametro}' x {len(folds)} folds."
+        )
+        puntuaciones = np.array(
+            Parallel(n_jobs=self.n_jobs)(
+                delayed(self._puntuar_fold)(X, y, entrenamiento, validacion) for entrenamiento, validacion in folds
+            )
+        )
+
+        medias = puntuaciones.mean(axis=0)
+        mejor = int(np.argmax(medias))
+        clave = f"{self.prefijo}{self.parametro}"
+        self.cv_results_ = {
+            "params": [{clave: valor} for valor in self.valores],
+            "mean_test_score": medias,
+            "std_test_score": puntuaciones.std(axis=0),
+            "rank_test_score": (-medias).argsort().argsort() + 1,
+        }
+        self.best_index_ = mejor
+        self.best_score_ = float(medias[mejor])
+        self.best_params_ = {clave: self.valores[mejor]}
+        self.best_estimator_ = clone(self.estimator).set_params(**self.best_params_).fit(X, y)
+        return self
+
+    def _puntuar_fold(self, X, y, entrenamiento: np.ndarray, validacion: np.ndarray) -> List[float]:
+        X_ajuste, y_ajuste = _safe_indexing(X, entrenamiento), _safe_indexing(y, entrenamiento)
+        X_validacion, y_validacion = _safe_indexing(X, validacion), _safe_indexing(y, validacion)
+        if hasattr(self.estimator, "steps"):
+            for _, paso in self.estimator.steps[:-1]:
+                X_ajuste, y_ajuste = clone(paso).fit_resample(X_ajuste, y_ajuste)
+
+        modelo = clone(_modelo_final(self.estimator))
+        scorer = check_scoring(modelo, scoring=self.scoring)
+        camino = None
+        if isinstance(modelo, Ridge) and X_ajuste.shape[1] <= MAX_COLUMNAS_RIDGE:
+            camino = self._camino_ridge(modelo, X_ajuste, y_ajuste)
+        elif isinstance(modelo, Lasso):
+            camino = self._camino_lasso(modelo, X_ajuste, y_ajuste)
+        if camino is not None:
+            return [scorer(ajustado, X_validacion, y_validacion) for ajustado in camino]
+
+        ascendente = CAMINOS[type(modelo)][1]
+        orden = sorted(range(len(self.valores)), key=lambda i: self.valores[i], reverse=not ascendente)
+        puntuaciones = [0.0] * len(self.valores)
+        modelo.set_params(warm_start=True)
+        for i in orden:
+            modelo.set_params(**{self.parametro: self.valores[i]}).fit(X_ajuste, y_ajuste)
+            puntuaciones[i] = scorer(modelo, X_validacion, y_validacion)
+        return puntuaciones
+
+    def _camino_ridge(self, modelo: Ridge, X, y) -> List[Ridge]:
+        """Ridge ajustado para cada ``alpha`` a partir de una sola descomposición de ``XᵀX``."""
+        matriz, objetivo, medias_X, media_y = _centrado(modelo, X, y)
+        n = matriz.shape[0]
+        gram = matriz.T @ matriz
+        gram = gram.toarray() if sparse.issparse(gram) else gram
+        correlacion = matriz.T @ objetivo
+        if sparse.issparse(matriz):
+            # Centrado implícito: no densifica una matriz dispersa
+            gram = gram - n * np.outer(medias_X, medias_X)
+            correlacion = correlacion - n * medias_X * objetivo.mean()
+        autovalores, autovectores = np.linalg.eigh(gram)
+        proyeccion = autovectores.T @ correlacion
+
+        return [
+            _ajustado(modelo, "alpha", alpha, autovectores @ (proyeccion / (autovalores + alpha)), medias_X, media_y, X)
+            for alpha in self.valores
+        ]
+
+    def _camino_lasso(self, modelo: Lasso, X, y) -> List[Lasso]:
+        """Lasso ajustado para cada ``alpha`` con una sola llamada a ``lasso_path``."""
+        matriz, objetivo, medias_X, media_y = _centrado(modelo, X, y)
+        argumentos = dict(max_iter=modelo.max_iter, tol=modelo.tol, positive=modelo.positive)
+        if sparse.issparse(matriz) and modelo.fit_intercept:
+            argumentos.update(X_offset=medias_X, X_scale=np.ones_like(medias_X))
+        alphas, coefs, _ = lasso_path(matriz, objetivo, alphas=self.valores, **argumentos)
+        # `lasso_path` devuelve el camino en orden descendente de alpha
+        por_alpha = {alpha: coefs[:, i] for i, alpha in enumerate(alphas)}
+        return [_ajustado(modelo, "alpha", alpha, por_alpha[alpha], medias_X, media_y, X) for alpha in self.valores]
+
+
+def _centrado(modelo: Any, X, y):
+    """Matriz ``float64`` y objetivo centrados (los dispersos se centran de forma implícita)."""
+    matriz = X.astype(np.float64) if sparse.issparse(X) else np.asarray(X, dtype=np.float64)
+    objetivo = np.asarray(y, dtype=np.float64)
+    medias_X = np.asarray(matriz.mean(axis=0)).ravel() if modelo.fit_intercept else np.zeros(matriz.shape[1])
+    media_y = objetivo.mean() if modelo.fit_intercept else 0.0
+    if modelo.fit_intercept:
+        objetivo = objetivo - media_y
+        if not sparse.issparse(matriz):
+            matriz = matriz - medias_X
+    return matriz, objetivo, medias_X, media_y
+
+
+def _ajustado(modelo: Any, parametro: str, valor: float, coef: np.ndarray, medias_X, media_y, X) -> Any:
+    """Copia de ``modelo`` con los coeficientes de un punto del camino, lista para puntuar."""
+    ajustado = clone(modelo).set_params(**{parametro: valor})
+    ajustado.coef_ = coef
+    ajustado.intercept_ = float(media_y - medias_X @ coef)
+    ajustado.n_features_in_ = len(coef)
+    if hasattr(X, "columns"):
+        ajustado.feature_names_in_ = np.asarray(X.columns, dtype=object)
+    return ajustado
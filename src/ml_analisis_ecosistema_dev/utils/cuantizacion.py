@@ -0,0 +1,231 @@
+"""
+Conjuntos cuantizados (histogramas) de XGBoost y LightGBM construidos una vez por fold y
+reutilizados por todos los candidatos de la búsqueda de hiperparámetros.
+
+Los hiperparámetros de la grilla (``n_estimators``, ``learning_rate``, ``max_depth``,
+``num_leaves``) no cambian la discretización de las características, así que el
+``QuantileDMatrix`` de XGBoost y el ``Dataset`` discretizado de LightGBM de un fold sirven
+para todos los candidatos. La clave es la huella del fold (``utils.cache.huella_datos``)
+más los parámetros que sí fijan los bins (``max_bin``, muestreo de bins...).
+
+- XGBoost sólo serializa ``DMatrix`` sin cuantizar, de modo que los ``QuantileDMatrix``
+  se guardan en memoria del proceso (los workers de joblib se reutilizan entre tareas).
+- LightGBM guarda el ``Dataset`` ya discretizado con ``save_binary`` en
+  ``directorio_cache`` (``data/05_model_input/cache_cuantizacion``), compartido entre
+  workers, nodos y ejecuciones, y poda las entradas menos usadas (``utils.cache.podar_cache``).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import lightgbm
+from lightgbm import LGBMClassifier, LGBMModel, LGBMRegressor
+from xgboost import DMatrix, QuantileDMatrix, XGBClassifier, XGBModel, XGBRegressor
+
+from ml_analisis_ecosistema_dev.utils.cache import bloqueo, huella_datos, marcar_uso, podar_cache
+
+logger = logging.getLogger(__name__)
+
+# Conjuntos de XGBoost en memoria por proceso: entrenamiento y validación de cada fold
+MAX_CONJUNTOS_EN_MEMORIA = 16
+
+# Parámetros de LightGBM que intervienen en la construcción del Dataset
+PARAMETROS_DATASET_LIGHTGBM = (
+    "max_bin",
+    "max_bin_by_feature",
+    "min_data_in_bin",
+    "bin_construct_sample_cnt",
+    "min_data_in_leaf",
+    "feature_pre_filter",
+    "use_missing",
+    "zero_as_missing",
+    "linear_tree",
+    "seed",
+    "data_random_seed",
+)
+
+_conjuntos_xgboost: "OrderedDict[str, DMatrix]" = OrderedDict()
+_lock_xgboost = threading.Lock()
+
+
+def _clave(X: Any, y: Any, parametros: Dict[str, Any]) -> str:
+    contenido = huella_datos(X, y) + json.dumps(parametros, sort_keys=True, default=repr)
+    return hashlib.blake2b(contenido.encode(), digest_size=16).hexdigest()
+
+
+def quantile_dmatrix_cacheado(modelo: XGBModel, ref: Optional[DMatrix], **kwargs: Any) -> DMatrix:
+    """``XGBModel._create_dmatrix`` con un ``QuantileDMatrix`` por fold y ``max_bin``.
+
+    Con pesos, márgenes o grupos, o sin ``tree_method="hist"``, se delega en XGBoost.
+    """
+    cacheable = modelo.tree_method in ("hist", None, "auto") and modelo.booster != "gblinear"
+    extras = ("weight", "base_margin", "group", "qid", "feature_weights")
+    if not cacheable or any(kwargs.get(nombre) is not None for nombre in extras):
+        return XGBModel._create_dmatrix(modelo, ref=ref, **kwargs)
+
+    clave = _clave(
+        kwargs["data"],
+        kwargs["label"],
+        {
+            "max_bin": modelo.max_bin,
+            "missing": kwargs.get("missing"),
+            "enable_categorical": kwargs.get("enable_categorical"),
+            # El conjunto de validación usa los bins del de entrenamiento
+            "referencia": getattr(ref, "clave_cuantizacion", None),
+        },
+    )
+    with _lock_xgboost:
+        if clave in _conjuntos_xgboost:
+            _conjuntos_xgboost.move_to_end(clave)
+            return _conjuntos_xgboost[clave]
+
+    conjunto = QuantileDMatrix(**kwargs, ref=ref, nthread=modelo.n_jobs, max_bin=modelo.max_bin)
+    conjunto.clave_cuantizacion = clave
+    with _lock_xgboost:
+        _conjuntos_xgboost[clave] = conjunto
+        while len(_conjuntos_xgboost) > MAX_CONJUNTOS_EN_MEMORIA:
+            _conjuntos_xgboost.popitem(last=False)
+    return conjunto
+
+
+class XGBRegressorCuantizado(XGBRegressor):
+    """``XGBRegressor`` que reutiliza el ``QuantileDMatrix`` de cada fold entre ajustes."""
+
+    def _create_dmatrix(self, ref: Optional[DMatrix], **kwargs: Any) -> DMatrix:
+        return quantile_dmatrix_cacheado(self, ref, **kwargs)
+
+
+class XGBClassifierCuantizado(XGBClassifier):
+    """``XGBClassifier`` que reutiliza el ``QuantileDMatrix`` de cada fold entre ajustes."""
+
+    def _create_dmatrix(self, ref: Optional[DMatrix], **kwargs: Any) -> DMatrix:
+        return quantile_dmatrix_cacheado(self, ref, **kwargs)
+
+
+def conjunto_lightgbm(X: Any, y: Any, parametros: Dict[str, Any], directorio_cache: str) -> lightgbm.Dataset:
+    """``Dataset`` de LightGBM discretizado, leído de ``directorio_cache`` o construido y guardado."""
+    parametros_dataset = {
+        nombre: parametros[nombre] for nombre in PARAMETROS_DATASET_LIGHTGBM if nombre in parametros
+    }
+    clave = _clave(X, y, parametros_dataset)
+    ruta = Path(directorio_cache) / f"{clave}.bin"
+    with bloqueo(Path(directorio_cache) / f"{clave}.lock"):
+        if ruta.exists():
+            logger.debug(f"Dataset LightGBM caché HIT {clave}")
+            marcar_uso(ruta)
+            return lightgbm.Dataset(str(ruta), params=parametros).construct()
+        logger.debug(f"Dataset LightGBM caché MISS {clave}")
+        conjunto = lightgbm.Dataset(X, label=y, params=parametros, free_raw_data=False).construct()
+        temporal = ruta.with_name(f"{clave}.{os.getpid()}.bin")
+        conjunto.save_binary(str(temporal))
+        os.replace(temporal, ruta)
+    podar_cache(Path(directorio_cache))
+    return conjunto
+
+
+class _DatasetLightGBMCacheado(LGBMModel):
+    """Sustituye ``LGBMModel.fit`` por un entrenamiento sobre el ``Dataset`` cacheado del fold.
+
+    Se sitúa entre ``LGBMClassifier``/``LGBMRegressor`` y ``LGBMModel`` en el MRO: recibe las
+    etiquetas ya codificadas. Con pesos, ``init_score``, métricas propias o características
+    categóricas explícitas se usa el ajuste original.
+    """
+
+    def fit(
+        self,
+        X,
+        y,
+        sample_weight=None,
+        init_score=None,
+        eval_set=None,
+        eval_names=None,
+        eval_metric=None,
+        feature_name="auto",
+        categorical_feature="auto",
+        callbacks=None,
+        init_model=None,
+        **kwargs,
+    ):
+        sin_cache = (
+            self.directorio_cache is None
+            or sample_weight is not None
+            or init_score is not None
+            or eval_metric
+            or init_model is not None
+            or self.class_weight is not None
+            or feature_name != "auto"
+            or categorical_feature != "auto"
+            or any(valor is not None for valor in kwargs.values())
+        )
+        if sin_cache:
+            return super().fit(
+                X,
+                y,
+                sample_weight=sample_weight,
+                init_score=init_score,
+                eval_set=eval_set,
+                eval_names=eval_names,
+                eval_metric=eval_metric,
+                feature_name=feature_name,
+                categorical_feature=categorical_feature,
+                callbacks=callbacks,
+                init_model=init_model,
+                **kwargs,
+            )
+
+        params = self._process_params(stage="fit")
+        metricas = params["metric"] if isinstance(params["metric"], list) else [params["metric"]]
+        params["metric"] = [metrica for metrica in metricas if metrica is not None]
+        self._n_features = self._n_features_in = X.shape[1]
+
+        conjunto = conjunto_lightgbm(X, y, params, self.directorio_cache)
+        validacion = [
+            lightgbm.Dataset(X_validacion, label=y_validacion, reference=conjunto, params=params)
+            for X_validacion, y_validacion in (eval_set or [])
+        ]
+        resultados: Dict[str, Any] = {}
+        self._Booster = lightgbm.train(
+            params=params,
+            train_set=conjunto,
+            num_boost_round=self.n_estimators,
+            valid_sets=validacion,
+            valid_names=eval_names,
+            callbacks=[*(callbacks or []), lightgbm.record_evaluation(resultados)],
+        )
+        self._evals_result = resultados
+        self._best_iteration = self._Booster.best_iteration
+        self._best_score = self._Booster.best_score
+        self.fitted_ = True
+        self._Booster.free_dataset()
+        return self
+
+
+class _ConDirectorioCache:
+    """Añade ``directorio_cache`` a los parámetros del estimador sin pasarlo a LightGBM."""
+
+    def __init__(self, *, directorio_cache: Optional[str] = None, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.directorio_cache = directorio_cache
+
+    @classmethod
+    def _get_param_names(cls):
+        return sorted({*LGBMModel._get_param_names(), "directorio_cache"})
+
+    def _process_params(self, stage: str) -> Dict[str, Any]:
+        params = super()._process_params(stage)
+        params.pop("directorio_cache", None)
+        return params
+
+
+class LGBMClassifierCuantizado(_ConDirectorioCache, LGBMClassifier, _DatasetLightGBMCacheado):
+    """``LGBMClassifier`` que guarda y reutiliza el ``Dataset`` discretizado de cada fold."""
+
+
+class LGBMRegressorCuantizado(_ConDirectorioCache, LGBMRegressor, _DatasetLightGBMCacheado):
+    """``LGBMRegressor`` que guarda y reutiliza el ``Dataset`` discretizado de cada fold."""
@@ -0,0 +1,280 @@
+"""
+Evaluación de los modelos candidatos sobre el holdout en los nodos ``report_and_select_*``.
+
+- Los modelos se evalúan a la vez en un pool de hilos: la predicción de sklearn, XGBoost y
+  LightGBM libera el GIL y así no hay que copiar ``X_test`` ni los modelos a otro proceso.
+- El holdout se predice por bloques de ``filas_por_bloque`` filas, de modo que un holdout
+  mucho mayor no densifica ni duplica toda la matriz a la vez.
+- Los clasificadores binarios hacen una sola pasada de ``predict_proba``: la etiqueta es
+  la clase positiva si su probabilidad supera 0.5, como en su ``predict``. Los modelos
+  cuyo ``predict`` no sigue ese umbral (``SVC`` con ``probability=True``: ``predict`` usa
+  ``decision_function`` y ``predict_proba`` la calibración de Platt) hacen además una
+  pasada de ``predict`` para las etiquetas (``umbral_en_probabilidad``).
+- Las métricas se calculan con aritmética vectorizada: la matriz de confusión con un
+  ``np.bincount`` y el ROC-AUC por rangos (Mann-Whitney), sin una pasada por métrica.
+- Los intervalos de confianza bootstrap reutilizan esas predicciones: cada lote de
+  remuestreos es una matriz de índices ``(lote, n)`` que se convierte en pesos (veces que
+  se repite cada fila) y las métricas de todo el lote salen de productos matriz-vector.
+  Todos los modelos usan los mismos remuestreos (bootstrap pareado).
+"""
+
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+from joblib import Parallel, delayed
+
+FILAS_POR_BLOQUE = 100_000
+UMBRAL_CLASIFICACION = 0.5
+REMUESTREOS_BOOTSTRAP = 5000
+NIVEL_CONFIANZA = 0.95
+# Tamaño máximo (remuestreos x filas) de cada lote de la matriz de pesos
+ELEMENTOS_POR_LOTE = 5_000_000
+
+
+def _filas(X: Any, inicio: int, fin: int) -> Any:
+    return X.iloc[inicio:fin] if hasattr(X, "iloc") else X[inicio:fin]
+
+
+def predecir_por_bloques(predecir: Callable[[Any], Any], X: Any, filas_por_bloque: int = FILAS_POR_BLOQUE) -> np.ndarray:
+    """Aplica ``predecir`` (``model.predict``, ``model.predict_proba``...) por bloques de filas."""
+    n = X.shape[0]
+    if n <= filas_por_bloque:
+        return np.asarray(predecir(X))
+    return np.concatenate(
+        [np.asarray(predecir(_filas(X, inicio, inicio + filas_por_bloque))) for inicio in range(0, n, filas_por_bloque)]
+    )
+
+
+def predecir_modelos(
+    modelos: Dict[str, Any],
+    X: Any,
+    metodo: str = "predict",
+    filas_por_bloque: int = FILAS_POR_BLOQUE,
+    n_jobs: Optional[int] = -1,
+) -> Dict[str, np.ndarray]:
+    """Predicciones de todos los modelos sobre ``X``, calculadas a la vez en un pool de hilos.
+
+    Con ``metodo="predict_proba"`` se devuelve la probabilidad de la clase positiva.
+    """
+
+    def predecir(modelo: Any) -> np.ndarray:
+        prediccion = predecir_por_bloques(getattr(modelo, metodo), X, filas_por_bloque)
+        return prediccion[:, 1] if metodo == "predict_proba" else prediccion
+
+    predicciones = Parallel(n_jobs=n_jobs, prefer="threads")(
+        delayed(predecir)(modelo) for modelo in modelos.values()
+    )
+    return dict(zip(modelos, predicciones))
+
+
+def umbral_en_probabilidad(modelo: Any) -> bool:
+    """Si el ``predict`` de ``modelo`` equivale a ``predict_proba(X)[:, 1] > 0.5``.
+
+    No es así en los estimadores con ``probability=True`` (``SVC``, ``NuSVC``): su
+    ``predict_proba`` sale de una calibración de Platt aparte y puede discrepar de
+    ``predict`` cerca de la frontera.
+    """
+    if hasattr(modelo, "steps"):
+        modelo = modelo.steps[-1][1]
+    # `ParadaTemprana` y las búsquedas guardan el modelo ajustado en otro atributo
+    modelo = getattr(modelo, "estimator_", modelo)
+    modelo = getattr(modelo, "best_estimator_", modelo)
+    return not getattr(modelo, "probability", False)
+
+
+def matriz_confusion_binaria(y_true: Any, y_pred: Any) -> np.ndarray:
+    """Matriz ``[[tn, fp], [fn, tp]]``, como ``sklearn.metrics.confusion_matrix`` con etiquetas 0/1."""
+    y_true = np.asarray(y_true, dtype=np.int64)
+    y_pred = np.asarray(y_pred, dtype=np.int64)
+    return np.bincount(2 * y_true + y_pred, minlength=4).reshape(2, 2)
+
+
+def roc_auc(y_true: Any, probabilidad: Any) -> float:
+    """ROC-AUC por rangos: equivale a ``roc_auc_score`` (los empates cuentan 1/2)."""
+    # `scipy.stats` tarda ~1 s en importarse: sólo al evaluar, no al registrar los pipelines
+    from scipy.stats import rankdata
+
+    y_true = np.asarray(y_true, dtype=bool)
+    positivos = int(y_true.sum())
+    negativos = len(y_true) - positivos
+    if positivos == 0 or negativos == 0:
+        return float("nan")
+    rangos = rankdata(probabilidad)
+    return float((rangos[y_true].sum() - positivos * (positivos + 1) / 2) / (positivos * negativos))
+
+
+def _cociente(numerador: float, denominador: float) -> float:
+    # Como sklearn con `zero_division="warn"`: 0 cuando el denominador es 0
+    return float(numerador / denominador) if denominador else 0.0
+
+
+def _etiquetas(probabilidad: Any, y_pred: Optional[Any]) -> np.ndarray:
+    if y_pred is None:
+        return np.asarray(probabilidad) > UMBRAL_CLASIFICACION
+    return np.asarray(y_pred).astype(bool)
+
+
+def metricas_clasificacion(y_true: Any, probabilidad: Any, y_pred: Optional[Any] = None) -> Dict[str, Any]:
+    """Accuracy, F1, precisión, recall, ROC-AUC y matriz de confusión de un clasificador
+    binario (etiquetas 0/1) a partir de la probabilidad de la clase positiva.
+
+    ``y_pred`` son las etiquetas de ``predict`` para los modelos sin
+    ``umbral_en_probabilidad``; por defecto se derivan de ``probabilidad``.
+    """
+    y_pred = _etiquetas(probabilidad, y_pred).astype(np.int64)
+    matriz = matriz_confusion_binaria(y_true, y_pred)
+    (tn, fp), (fn, tp) = matriz
+    precision = _cociente(tp, tp + fp)
+    recall = _cociente(tp, tp + fn)
+    return {
+        "accuracy": _cociente(tp + tn, matriz.sum()),
+        "f1_score": _cociente(2 * tp, 2 * tp + fp + fn),
+        "precision": precision,
+        "recall": recall,
+        "roc_auc": roc_auc(y_true, probabilidad),
+        "confusion_matrix": matriz.tolist(),
+    }
+
+
+def metricas_regresion(y_true: Any, y_pred: Any) -> Dict[str, float]:
+    """RMSE, MAE y R² a partir de los residuos, en una sola pasada (``float64``)."""
+    y_true = np.asarray(y_true, dtype=np.float64)
+    residuos = y_true - np.asarray(y_pred, dtype=np.float64)
+    sse = float(residuos @ residuos)
+    centrado = y_true - y_true.mean()
+    sst = float(centrado @ centrado)
+    return {
+        "rmse": float(np.sqrt(sse / len(y_true))),
+        "mae": float(np.abs(residuos).mean()),
+        "r2": 1.0 - sse / sst if sst else float("nan"),
+    }
+
+
+# --- Intervalos bootstrap ------------------------------------------------------
+
+
+def pesos_bootstrap(
+    n: int,
+    remuestreos: int = REMUESTREOS_BOOTSTRAP,
+    semilla: Optional[int] = None,
+    elementos_por_lote: int = ELEMENTOS_POR_LOTE,
+) -> Iterator[np.ndarray]:
+    """Lotes de remuestreos bootstrap de ``n`` filas como matrices de pesos ``(lote, n)``.
+
+    Cada lote se sortea como una matriz de índices y se cuenta por fila con un único
+    ``np.bincount``: el peso de una fila es el número de veces que aparece en el remuestreo.
+    """
+    rng = np.random.default_rng(semilla)
+    lote = max(1, min(remuestreos, elementos_por_lote // max(n, 1)))
+    for inicio in range(0, remuestreos, lote):
+        filas = min(lote, remuestreos - inicio)
+        indices = rng.integers(0, n, size=(filas, n))
+        indices += np.arange(filas)[:, None] * n
+        yield np.bincount(indices.ravel(), minlength=filas * n).reshape(filas, n).astype(np.float64)
+
+
+def _dividir(numerador: np.ndarray, denominador: np.ndarray, vacio: float = 0.0) -> np.ndarray:
+    return np.divide(numerador, denominador, out=np.full_like(numerador, vacio), where=denominador != 0)
+
+
+def metricas_regresion_ponderadas(pesos: np.ndarray, y_true: Any, y_pred: Any) -> Dict[str, np.ndarray]:
+    """RMSE, MAE y R² de cada fila de ``pesos`` (un remuestreo por fila)."""
+    y_true = np.asarray(y_true, dtype=np.float64)
+    residuos = y_true - np.asarray(y_pred, dtype=np.float64)
+    n = pesos.sum(axis=1)
+    sse = pesos @ (residuos * residuos)
+    # Centrado con la media del holdout para no perder precisión con salarios grandes
+    centrado = y_true - y_true.mean()
+    media = (pesos @ centrado) / n
+    sst = pesos @ (centrado * centrado) - n * media * media
+    return {
+        "rmse": np.sqrt(sse / n),
+        "mae": (pesos @ np.abs(residuos)) / n,
+        "r2": 1.0 - _dividir(sse, sst, vacio=np.nan),
+    }
+
+
+def metricas_clasificacion_ponderadas(
+    pesos: np.ndarray, y_true: Any, probabilidad: Any, y_pred: Optional[Any] = None
+) -> Dict[str, np.ndarray]:
+    """F1, precisión, recall y ROC-AUC de cada fila de ``pesos`` (un remuestreo por fila).
+
+    El ROC-AUC ponderado agrupa las filas por probabilidad: cada positivo suma los
+    negativos con menor probabilidad y la mitad de los empatados. ``y_pred`` como en
+    ``metricas_clasificacion``.
+    """
+    y_true = np.asarray(y_true, dtype=bool)
+    probabilidad = np.asarray(probabilidad, dtype=np.float64)
+    y_pred = _etiquetas(probabilidad, y_pred)
+    tp = pesos @ (y_true & y_pred).astype(np.float64)
+    fp = pesos @ (~y_true & y_pred).astype(np.float64)
+    fn = pesos @ (y_true & ~y_pred).astype(np.float64)
+
+    orden = np.argsort(probabilidad, kind="stable")
+    inicios = np.flatnonzero(np.r_[True, np.diff(probabilidad[orden]) != 0])
+    pesos_ordenados = pesos[:, orden]
+    positivos_grupo = np.add.reduceat(pesos_ordenados * y_true[orden], inicios, axis=1)
+    negativos_grupo = np.add.reduceat(pesos_ordenados * ~y_true[orden], inicios, axis=1)
+    negativos_previos = np.cumsum(negativos_grupo, axis=1) - negativos_grupo
+    positivos, negativos = positivos_grupo.sum(axis=1), negativos_grupo.sum(axis=1)
+    pares = (positivos_grupo * (negativos_previos + 0.5 * negativos_grupo)).sum(axis=1)
+
+    return {
+        "f1_score": _dividir(2 * tp, 2 * tp + fp + fn),
+        "precision": _dividir(tp, tp + fp),
+        "recall": _dividir(tp, tp + fn),
+        "roc_auc": _dividir(pares, positivos * negativos, vacio=np.nan),
+    }
+
+
+def intervalos_bootstrap(
+    metricas_ponderadas: Callable[[np.ndarray, Any, Any], Dict[str, np.ndarray]],
+    y_true: Any,
+    prediccion: Any,
+    remuestreos: int = REMUESTREOS_BOOTSTRAP,
+    nivel: float = NIVEL_CONFIANZA,
+    semilla: Optional[int] = None,
+    elementos_por_lote: int = ELEMENTOS_POR_LOTE,
+) -> Dict[str, Any]:
+    """Intervalos de confianza por percentiles de las métricas sobre ``remuestreos`` remuestreos.
+
+    ``metricas_ponderadas`` es ``metricas_regresion_ponderadas`` o
+    ``metricas_clasificacion_ponderadas``; ``prediccion`` son las predicciones o la
+    probabilidad de la clase positiva ya calculadas en el holdout.
+    """
+    lotes = [
+        metricas_ponderadas(pesos, y_true, prediccion)
+        for pesos in pesos_bootstrap(len(prediccion), remuestreos, semilla, elementos_por_lote)
+    ]
+    cola = 100 * (1 - nivel) / 2
+    intervalos: Dict[str, Any] = {"nivel": nivel, "remuestreos": remuestreos}
+    for metrica in lotes[0]:
+        valores = np.concatenate([lote[metrica] for lote in lotes])
+        inferior, superior = np.nanpercentile(valores, [cola, 100 - cola])
+        intervalos[metrica] = [float(inferior), float(superior)]
+    return intervalos
+
+
+def configuracion_bootstrap(evaluacion: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Argumentos de ``intervalos_bootstrap`` a partir del bloque ``evaluacion.bootstrap``.
+
+    ``remuestreos: 0`` desactiva los intervalos.
+    """
+    bootstrap = (evaluacion or {}).get("bootstrap") or {}
+    return {
+        "remuestreos": bootstrap.get("remuestreos", REMUESTREOS_BOOTSTRAP),
+        "nivel": bootstrap.get("nivel", NIVEL_CONFIANZA),
+        "semilla": bootstrap.get("semilla"),
+    }
+
+
+def solapan_con_el_mejor(informe: Dict[str, Dict[str, Any]], mejor: str, metrica: str) -> List[str]:
+    """Modelos cuyo intervalo de ``metrica`` (mayor es mejor) alcanza el del modelo ``mejor``."""
+    if "intervalo_confianza" not in informe[mejor]:
+        return []
+    inferior = informe[mejor]["intervalo_confianza"][metrica][0]
+    return [
+        nombre
+        for nombre, metricas in informe.items()
+        if nombre != mejor and "intervalo_confianza" in metricas and metricas["intervalo_confianza"][metrica][1] >= inferior
+    ]
@@ -0,0 +1,25 @@
+"""
+Conversión de las características de `datos_para_modelado` al formato que reciben los modelos.
+"""
+
+from typing import Union
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+def es_dispersa(X: pd.DataFrame) -> bool:
+    """Indica si todas las columnas del DataFrame son ``pandas.SparseDtype``."""
+    return len(X.columns) > 0 and all(isinstance(dtype, pd.SparseDtype) for dtype in X.dtypes)
+
+
+def preparar_caracteristicas(X: pd.DataFrame) -> Union[pd.DataFrame, sparse.csr_matrix]:
+    """Convierte un DataFrame disperso en una matriz CSR ``float32``.
+
+    Los DataFrames densos se devuelven sin cambios. sklearn, XGBoost, LightGBM y SMOTE
+    aceptan CSR directamente, mientras que un DataFrame disperso se densificaría.
+    """
+    if not es_dispersa(X):
+        return X
+    return X.sparse.to_coo().tocsr().astype(np.float32)
@@ -0,0 +1,25 @@
+"""
+Medición de memoria del proceso sin dependencias adicionales.
+"""
+
+import sys
+from typing import Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def pico_memoria_mb() -> Optional[float]:
+    """Pico de memoria residente (RSS) del proceso en MB, o ``None`` si no se puede medir."""
+    if resource is not None:
+        pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux informa en KB y macOS en bytes
+        return pico / 1024**2 if sys.platform == "darwin" else pico / 1024
+    try:
+        import psutil
+    except ImportError:
+        return None
+    info = psutil.Process().memory_info()
+    return getattr(info, "peak_wset", info.rss) / 1024**2
@@ -0,0 +1,264 @@
+"""
+Artefactos de modelos en el formato nativo de su librería, sin los pasos que sólo sirven
+para entrenar, y predictores ligeros para cargarlos.
+
+Cargar el pickle de un ``ImbPipeline`` completo importa imblearn, todas las familias de
+modelos de sklearn y la librería de boosting, y deserializa objetos que la inferencia no
+usa (SMOTE, ``ParadaTemprana``, la configuración de la búsqueda). Un artefacto es un
+directorio con ``manifiesto.json`` y:
+
+- XGBoost: el booster en UBJSON (``modelo.ubj``), que predice con ``inplace_predict``.
+- LightGBM: el booster en su formato de texto (``modelo.txt``).
+- Modelos lineales (``LinearRegression``, ``Ridge``, ``Lasso``, ``SGDRegressor`` y
+  ``LogisticRegression`` binaria): coeficientes e intercepto en ``coeficientes.npy`` e
+  ``intercepto.npy``; se cargan con ``np.memmap`` y predicen sólo con NumPy.
+- Cualquier otro modelo (random forests...): ``joblib``. No se mapea en memoria: al
+  deserializarse, los árboles de sklearn copian sus arrays de nodos y valores.
+
+Los samplers de imblearn (pasos con ``fit_resample``) se descartan y ``ParadaTemprana`` se
+sustituye por el modelo que envuelve. Los boosters se leen, por defecto, en la primera
+predicción: cargar el artefacto no importa xgboost/lightgbm. Este módulo sólo importa
+NumPy; el servicio y los jobs de scoring siguen importando sklearn al deserializar el
+preprocesador (``benchmarks/arranque_en_frio.py`` mide el arranque completo).
+"""
+
+import json
+import shutil
+import sys
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+FICHERO_MANIFIESTO = "manifiesto.json"
+VERSION_FORMATO = 1
+
+
+def _es_instancia(objeto: Any, modulo: str, clase: str) -> bool:
+    """``isinstance`` sin importar ``modulo``: si no está cargado, el objeto no puede ser suyo."""
+    cargado = sys.modules.get(modulo)
+    return cargado is not None and isinstance(objeto, getattr(cargado, clase))
+
+
+def modelo_de_inferencia(modelo: Any) -> Any:
+    """Quita los pasos de sólo entrenamiento (samplers) y los envoltorios de ``modelo``."""
+    if hasattr(modelo, "steps"):
+        pasos = [
+            (nombre, paso)
+            for nombre, paso in modelo.steps
+            if paso not in (None, "passthrough") and not hasattr(paso, "fit_resample")
+        ]
+        if len(pasos) > 1:
+            from sklearn.pipeline import Pipeline
+
+            return Pipeline(pasos)
+        modelo = pasos[0][1]
+    if _es_instancia(modelo, "ml_analisis_ecosistema_dev.utils.parada_temprana", "ParadaTemprana"):
+        modelo = modelo.estimator_
+    return getattr(modelo, "best_estimator_", modelo)
+
+
+def _tipo_nativo(modelo: Any) -> str:
+    binario = len(getattr(modelo, "classes_", [])) == 2
+    if _es_instancia(modelo, "xgboost", "XGBRegressor") or (_es_instancia(modelo, "xgboost", "XGBClassifier") and binario):
+        return "xgboost"
+    if _es_instancia(modelo, "lightgbm", "LGBMRegressor") or (_es_instancia(modelo, "lightgbm", "LGBMClassifier") and binario):
+        return "lightgbm"
+    if _es_instancia(modelo, "sklearn.linear_model", "LogisticRegression"):
+        return "lineal" if binario else "joblib"
+    lineal = _es_instancia(modelo, "sklearn.linear_model._base", "LinearModel") or _es_instancia(
+        modelo, "sklearn.linear_model", "SGDRegressor"
+    )
+    if lineal and not hasattr(modelo, "classes_") and np.ndim(modelo.coef_) == 1:
+        return "lineal"
+    return "joblib"
+
+
+class _ModeloNativo(ABC):
+    """Predictor cargado de un artefacto nativo, con la interfaz ``predict``/``predict_proba``."""
+
+    def __init__(self, directorio: Path, manifiesto: Dict[str, Any]) -> None:
+        self._directorio = directorio
+        self.manifiesto = manifiesto
+        self.feature_names_in_ = np.asarray(manifiesto["columnas"], dtype=object) if manifiesto["columnas"] else None
+        self.n_features_in_ = manifiesto["n_columnas"]
+        if manifiesto["clases"] is not None:
+            self.classes_ = np.asarray(manifiesto["clases"])
+
+    def _matriz(self, X: Any) -> Any:
+        # Las columnas de un DataFrame se alinean por nombre con las del entrenamiento
+        if hasattr(X, "columns") and self.feature_names_in_ is not None:
+            nombres = X.columns.astype(str)
+            if list(nombres) != self.manifiesto["columnas"]:
+                posiciones = nombres.get_indexer(self.manifiesto["columnas"])
+                if (posiciones < 0).any():
+                    faltan = [col for col, pos in zip(self.manifiesto["columnas"], posiciones) if pos < 0]
+                    raise ValueError(f"Faltan columnas para {self.manifiesto['origen']}: {faltan[:10]}")
+                X = X.iloc[:, posiciones]
+        return X
+
+    @abstractmethod
+    def _probabilidad(self, X: Any) -> np.ndarray:
+        """Probabilidad de la clase positiva."""
+
+    def predict_proba(self, X: Any) -> np.ndarray:
+        if self.manifiesto["clases"] is None:
+            raise AttributeError(f"El modelo {self.manifiesto['origen']} no es un clasificador.")
+        probabilidad = self._probabilidad(self._matriz(X))
+        return np.column_stack([1 - probabilidad, probabilidad])
+
+    def predict(self, X: Any) -> np.ndarray:
+        if self.manifiesto["clases"] is None:
+            return self._valor(self._matriz(X))
+        return self.classes_[(self._probabilidad(self._matriz(X)) > 0.5).astype(np.int64)]
+
+    @abstractmethod
+    def _valor(self, X: Any) -> np.ndarray:
+        """Predicción de un regresor."""
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.manifiesto['origen']}, '{self._directorio}')"
+
+
+class ModeloLineal(_ModeloNativo):
+    """Modelo lineal a partir de coeficientes mapeados en memoria."""
+
+    def __init__(self, directorio: Path, manifiesto: Dict[str, Any]) -> None:
+        super().__init__(directorio, manifiesto)
+        self.coef_ = np.load(directorio / "coeficientes.npy", mmap_mode="r")
+        self.intercept_ = np.load(directorio / "intercepto.npy")
+
+    def decision_function(self, X: Any) -> np.ndarray:
+        X = self._matriz(X)
+        if not hasattr(X, "tocsr"):
+            # Como la validación de sklearn: float32/float64 se conservan, el resto pasa a float64
+            X = np.asarray(X)
+            if X.dtype not in (np.float32, np.float64):
+                X = X.astype(np.float64)
+        return np.asarray(X @ self.coef_).ravel() + self.intercept_
+
+    def _valor(self, X: Any) -> np.ndarray:
+        return self.decision_function(X)
+
+    def _probabilidad(self, X: Any) -> np.ndarray:
+        # Sigmoide de la función de decisión, como `LogisticRegression` binaria (sin scipy)
+        return 1.0 / (1.0 + np.exp(-self.decision_function(X)))
+
+
+class ModeloBooster(_ModeloNativo):
+    """Booster de XGBoost o LightGBM, leído de su fichero nativo en la primera predicción."""
+
+    def __init__(self, directorio: Path, manifiesto: Dict[str, Any], perezoso: bool = True) -> None:
+        super().__init__(directorio, manifiesto)
+        self._lock = threading.Lock()
+        self._booster = None
+        if not perezoso:
+            self._booster = self._leer_booster()
+
+    @property
+    def booster(self) -> Any:
+        if self._booster is None:
+            with self._lock:
+                if self._booster is None:
+                    self._booster = self._leer_booster()
+        return self._booster
+
+    def _leer_booster(self) -> Any:
+        if self.manifiesto["tipo"] == "xgboost":
+            import xgboost
+
+            booster = xgboost.Booster()
+            booster.load_model(str(self._directorio / "modelo.ubj"))
+            return booster
+        import lightgbm
+
+        return lightgbm.Booster(model_file=str(self._directorio / "modelo.txt"))
+
+    def _salida(self, X: Any) -> np.ndarray:
+        if self.manifiesto["tipo"] == "xgboost":
+            rondas = self.manifiesto["rondas"]
+            return self.booster.inplace_predict(
+                X, iteration_range=(0, rondas or 0), missing=np.nan, validate_features=False
+            )
+        return self.booster.predict(X, validate_features=False)
+
+    def _valor(self, X: Any) -> np.ndarray:
+        return self._salida(X)
+
+    def _probabilidad(self, X: Any) -> np.ndarray:
+        return self._salida(X)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # El booster se vuelve a leer del fichero en el otro proceso
+        return {**self.__dict__, "_lock": None, "_booster": None}
+
+    def __setstate__(self, estado: Dict[str, Any]) -> None:
+        self.__dict__.update(estado, _lock=threading.Lock())
+
+
+def guardar_modelo_nativo(modelo: Any, directorio: Union[str, Path]) -> None:
+    """Guarda ``modelo`` (estimador o pipeline de entrenamiento) como artefacto nativo.
+
+    El directorio se escribe aparte y se sustituye al final, así que un lector nunca ve un
+    artefacto a medias.
+    """
+    directorio = Path(directorio)
+    modelo = modelo_de_inferencia(modelo)
+    tipo = _tipo_nativo(modelo)
+    temporal = directorio.with_name(f".{directorio.name}.tmp")
+    if temporal.exists():
+        shutil.rmtree(temporal)
+    temporal.mkdir(parents=True)
+
+    clases: Optional[List[Any]] = getattr(modelo, "classes_", None)
+    columnas = getattr(modelo, "feature_names_in_", None)
+    manifiesto = {
+        "version": VERSION_FORMATO,
+        "tipo": tipo,
+        "origen": type(modelo).__name__,
+        "clases": None if clases is None else np.asarray(clases).tolist(),
+        "columnas": None if columnas is None else [str(columna) for columna in columnas],
+        "n_columnas": getattr(modelo, "n_features_in_", None),
+        "rondas": None,
+    }
+    if tipo == "xgboost":
+        booster = modelo.get_booster()
+        # Con parada temprana se predice hasta la mejor ronda, como `XGBModel.predict`
+        mejor = booster.attr("best_iteration")
+        manifiesto["rondas"] = None if mejor is None else int(mejor) + 1
+        booster.save_model(str(temporal / "modelo.ubj"))
+    elif tipo == "lightgbm":
+        # `save_model` guarda hasta `best_iteration`, las mismas rondas que usa `predict`
+        modelo.booster_.save_model(str(temporal / "modelo.txt"))
+    elif tipo == "lineal":
+        np.save(temporal / "coeficientes.npy", np.ascontiguousarray(np.ravel(modelo.coef_)))
+        np.save(temporal / "intercepto.npy", np.atleast_1d(modelo.intercept_)[:1])
+    else:
+        import joblib
+
+        joblib.dump(modelo, temporal / "modelo.joblib")
+    (temporal / FICHERO_MANIFIESTO).write_text(json.dumps(manifiesto, indent=2))
+
+    if directorio.exists():
+        shutil.rmtree(directorio)
+    temporal.rename(directorio)
+
+
+def cargar_modelo_nativo(directorio: Union[str, Path], perezoso: bool = True) -> Any:
+    """Carga un artefacto de ``guardar_modelo_nativo``.
+
+    Returns:
+        Un predictor con ``predict``, ``predict_proba`` (clasificadores), ``classes_`` y
+        ``n_features_in_``; para el formato ``joblib``, el estimador de sklearn.
+    """
+    directorio = Path(directorio)
+    manifiesto = json.loads((directorio / FICHERO_MANIFIESTO).read_text())
+    if manifiesto["tipo"] in ("xgboost", "lightgbm"):
+        return ModeloBooster(directorio, manifiesto, perezoso=perezoso)
+    if manifiesto["tipo"] == "lineal":
+        return ModeloLineal(directorio, manifiesto)
+    import joblib
+
+    return joblib.load(directorio / "modelo.joblib")
@@ -0,0 +1,219 @@
+"""
+Ajuste de modelos de árboles con parada temprana: un solo ajuste cubre todos los valores
+de ``n_estimators`` de la grilla, que pasa a ser sólo el máximo permitido.
+
+Se reserva una fracción del fold de entrenamiento como validación interna:
+
+- Boosting (XGBoost, LightGBM): se detiene tras ``paciencia`` rondas sin mejora de la
+  métrica de evaluación de la librería.
+- Random forests: se crece el bosque con ``warm_start`` de ``paso_bosque`` en
+  ``paso_bosque`` árboles y se detiene cuando deja de mejorar la métrica de la búsqueda
+  (``scoring``) sobre la validación.
+
+Con un ``remuestreo`` (SMOTE) la validación se separa antes de remuestrear: sólo la parte
+de ajuste recibe filas sintéticas, interpoladas a partir de ella misma.
+"""
+
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+from sklearn.base import BaseEstimator, MetaEstimatorMixin, clone, is_classifier
+from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+from sklearn.metrics import get_scorer
+from sklearn.model_selection import train_test_split
+from sklearn.utils.metaestimators import available_if
+
+logger = logging.getLogger(__name__)
+
+MODELOS_BOOSTING = ("XGBRegressor", "XGBClassifier", "LGBMClassifier", "LGBMRegressor")
+MODELOS_BOSQUE = ("RandomForestRegressor", "RandomForestClassifier")
+
+
+def admite_parada_temprana(model_name: str, configuracion_busqueda: Optional[Dict[str, Any]] = None) -> bool:
+    """Si ``model_name`` puede envolverse con ``ParadaTemprana`` dada la búsqueda configurada.
+
+    Con successive halving sobre ``n_estimators`` la búsqueda ya asigna el número de
+    árboles de cada ronda: la parada temprana no se aplica (``ParadaTemprana`` sólo expone
+    ``estimator__n_estimators`` y la búsqueda volvería a ``n_samples``).
+    """
+    if model_name not in MODELOS_BOOSTING + MODELOS_BOSQUE:
+        return False
+    configuracion_busqueda = configuracion_busqueda or {}
+    if (
+        str(configuracion_busqueda.get("strategy", "")).startswith("halving")
+        and configuracion_busqueda.get("resource") == "n_estimators"
+    ):
+        logger.info(f"{model_name}: halving con recurso 'n_estimators'; no se aplica la parada temprana.")
+        return False
+    return True
+
+
+def _delegado_tiene(metodo: str):
+    return lambda self: hasattr(self.estimator, metodo)
+
+
+class ParadaTemprana(MetaEstimatorMixin, BaseEstimator):
+    """Envuelve un modelo de boosting o un random forest y elige el número de árboles
+    con parada temprana en cada ``fit``.
+
+    ``remuestreo`` es un sampler de imblearn (``fit_resample``) que se aplica sólo a la
+    parte de ajuste; sustituye al paso de remuestreo del pipeline, que contaminaría la
+    validación interna con filas sintéticas. ``scoring`` es la métrica de la búsqueda con
+    la que se evalúa el bosque (``None``: ``score`` del modelo).
+
+    Atributos tras ``fit``:
+        estimator_: El modelo ajustado.
+        n_rondas_: Árboles (o rondas de boosting) realmente usados.
+    """
+
+    def __init__(
+        self,
+        estimator: Any,
+        fraccion_validacion: float = 0.1,
+        paciencia: int = 20,
+        paso_bosque: int = 25,
+        random_state: Optional[int] = None,
+        scoring: Optional[str] = None,
+        remuestreo: Any = None,
+    ) -> None:
+        self.estimator = estimator
+        self.fraccion_validacion = fraccion_validacion
+        self.paciencia = paciencia
+        self.paso_bosque = paso_bosque
+        self.random_state = random_state
+        self.scoring = scoring
+        self.remuestreo = remuestreo
+
+    @property
+    def _estimator_type(self) -> Optional[str]:
+        return getattr(self.estimator, "_estimator_type", None)
+
+    def fit(self, X, y) -> "ParadaTemprana":
+        modelo = clone(self.estimator)
+        if isinstance(modelo, (RandomForestRegressor, RandomForestClassifier)):
+            self.n_rondas_ = self._ajustar_bosque(modelo, X, y)
+        else:
+            self.n_rondas_ = self._ajustar_boosting(modelo, X, y)
+        self.estimator_ = modelo
+        if is_classifier(modelo):
+            self.classes_ = modelo.classes_
+        return self
+
+    def _dividir(self, modelo: Any, X, y) -> Tuple[Any, Any, Any, Any]:
+        """Partes de ajuste y de validación interna; sólo la de ajuste se remuestrea."""
+        X_ajuste, X_validacion, y_ajuste, y_validacion = train_test_split(
+            X,
+            y,
+            test_size=self.fraccion_validacion,
+            random_state=self.random_state,
+            stratify=y if is_classifier(modelo) else None,
+        )
+        if self.remuestreo is not None:
+            X_ajuste, y_ajuste = clone(self.remuestreo).fit_resample(X_ajuste, y_ajuste)
+        return X_ajuste, X_validacion, y_ajuste, y_validacion
+
+    def _ajustar_boosting(self, modelo: Any, X, y) -> int:
+        X_ajuste, X_validacion, y_ajuste, y_validacion = self._dividir(modelo, X, y)
+        conjunto_validacion = [(X_validacion, y_validacion)]
+        if type(modelo).__name__.startswith("LGBM"):
+            import lightgbm
+
+            modelo.fit(
+                X_ajuste,
+                y_ajuste,
+                eval_set=conjunto_validacion,
+                callbacks=[lightgbm.early_stopping(self.paciencia, verbose=False)],
+            )
+            # `best_iteration_` es 0 si no llegó a detenerse: se usaron todas las rondas
+            return int(modelo.best_iteration_ or modelo.n_estimators)
+
+        modelo.set_params(early_stopping_rounds=self.paciencia)
+        modelo.fit(X_ajuste, y_ajuste, eval_set=conjunto_validacion, verbose=False)
+        return int(modelo.best_iteration) + 1
+
+    def _ajustar_bosque(self, modelo: Any, X, y) -> int:
+        X_ajuste, X_validacion, y_ajuste, y_validacion = self._dividir(modelo, X, y)
+        puntuar = get_scorer(self.scoring) if self.scoring else lambda m, X_, y_: m.score(X_, y_)
+        maximo = modelo.n_estimators
+        mejor_puntuacion, mejor_n, sin_mejora = -np.inf, 0, 0
+        modelo.set_params(warm_start=True)
+        for n in range(min(self.paso_bosque, maximo), maximo + self.paso_bosque, self.paso_bosque):
+            modelo.set_params(n_estimators=min(n, maximo))
+            modelo.fit(X_ajuste, y_ajuste)
+            puntuacion = puntuar(modelo, X_validacion, y_validacion)
+            if puntuacion > mejor_puntuacion:
+                mejor_puntuacion, mejor_n, sin_mejora = puntuacion, modelo.n_estimators, 0
+            else:
+                sin_mejora += self.paso_bosque
+                if sin_mejora >= self.paciencia:
+                    break
+            if n >= maximo:
+                break
+        # Se descartan los árboles crecidos después del mejor punto
+        modelo.estimators_ = modelo.estimators_[:mejor_n]
+        modelo.set_params(n_estimators=mejor_n, warm_start=False)
+        return mejor_n
+
+    def predict(self, X):
+        return self.estimator_.predict(X)
+
+    @available_if(_delegado_tiene("predict_proba"))
+    def predict_proba(self, X):
+        return self.estimator_.predict_proba(X)
+
+    @property
+    def feature_importances_(self) -> np.ndarray:
+        return self.estimator_.feature_importances_
+
+
+def envolver_con_parada_temprana(
+    model: Any,
+    param_grid: Dict[str, Any],
+    configuracion: Dict[str, Any],
+    prefijo: str = "",
+    scoring: Optional[str] = None,
+    remuestreo: Any = None,
+) -> Tuple[ParadaTemprana, Dict[str, Any]]:
+    """Envuelve ``model`` y adapta la grilla: ``n_estimators`` pasa a ser el máximo y el
+    resto de hiperparámetros del modelo se redirigen a ``estimator__``.
+
+    Args:
+        model: Modelo de boosting o random forest sin ajustar.
+        param_grid: Grilla de ``parameters_data_science.yml``.
+        configuracion: Bloque ``parada_temprana`` (fraccion_validacion, paciencia,
+            paso_bosque) de los parámetros del pipeline.
+        prefijo: Prefijo de los hiperparámetros del modelo en la grilla (``"model__"``).
+        scoring: Métrica de la búsqueda, con la que se detienen los random forests.
+        remuestreo: Sampler que se aplica sólo a la parte de ajuste (ver ``ParadaTemprana``).
+
+    Returns:
+        El modelo envuelto y la grilla adaptada.
+    """
+    grilla = dict(param_grid)
+    valores = grilla.pop(f"{prefijo}n_estimators", None)
+    if valores is not None:
+        maximo = max(valores["high"] if isinstance(valores, dict) else valores)
+        model.set_params(n_estimators=int(maximo))
+    envuelto = ParadaTemprana(
+        model,
+        fraccion_validacion=configuracion.get("fraccion_validacion", 0.1),
+        paciencia=configuracion.get("paciencia", 20),
+        paso_bosque=configuracion.get("paso_bosque", 25),
+        random_state=model.get_params().get("random_state"),
+        scoring=scoring,
+        remuestreo=remuestreo,
+    )
+    grilla = {
+        (f"{prefijo}estimator__{nombre[len(prefijo):]}" if nombre.startswith(prefijo) else nombre): valor
+        for nombre, valor in grilla.items()
+    }
+    return envuelto, grilla
+
+
+def rondas_usadas(model: Any) -> Optional[int]:
+    """Árboles o rondas de boosting usados por el modelo (o por el último paso de un pipeline)."""
+    if hasattr(model, "steps"):
+        model = model.steps[-1][1]
+    rondas = getattr(model, "n_rondas_", None)
+    return int(rondas) if rondas is not None else None
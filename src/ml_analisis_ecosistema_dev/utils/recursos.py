@@ -0,0 +1,92 @@
+"""
+Presupuesto de CPU coordinado para los nodos de entrenamiento.
+
+Los núcleos disponibles se reparten primero entre los entrenamientos que corren a la vez
+(``ParallelRunner`` o tareas paralelas del DAG de Airflow) y después, dentro de cada nodo,
+entre los workers de validación cruzada (``n_jobs`` de la búsqueda) y los hilos de cada
+estimador (``n_jobs``/``nthread`` de RandomForest, XGBoost y LightGBM, y los pools de
+BLAS/OpenMP). Así el producto total nunca supera el presupuesto.
+
+La configuración vive en ``globals.yml`` (``recursos_cpu``) y se puede sobrescribir con
+variables de entorno:
+
+- ``ML_NUCLEOS``: núcleos del presupuesto (por defecto, los de la máquina).
+- ``ML_ENTRENAMIENTOS_CONCURRENTES``: entrenamientos que se ejecutan a la vez.
+- ``ML_PRESUPUESTO_CPU=0``: desactiva el reparto (``n_jobs=-1`` en todas partes).
+"""
+
+import logging
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional
+
+from joblib import parallel_config
+from threadpoolctl import threadpool_limits
+
+logger = logging.getLogger(__name__)
+
+PARAMETROS_HILOS = ("n_jobs", "nthread", "thread_count")
+
+
+@dataclass(frozen=True)
+class AsignacionCPU:
+    """Núcleos asignados a un nodo de entrenamiento."""
+
+    nucleos_nodo: int
+    n_jobs_cv: int
+    hilos_estimador: int
+
+
+def _nucleos_maquina() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def asignar_nucleos(recursos: Optional[Dict[str, Any]], tareas_cv: int) -> Optional[AsignacionCPU]:
+    """Reparte el presupuesto de CPU de un nodo entre workers de CV e hilos del estimador.
+
+    Args:
+        recursos: Bloque ``recursos`` de los parámetros del pipeline (``nucleos``,
+            ``entrenamientos_concurrentes``, ``activo``).
+        tareas_cv: Número de ajustes independientes de la búsqueda (candidatos × folds).
+
+    Returns:
+        La asignación, o ``None`` si el presupuesto está desactivado.
+    """
+    recursos = recursos or {}
+    activo = os.environ.get("ML_PRESUPUESTO_CPU", str(recursos.get("activo", True))).lower()
+    if activo in ("0", "false", "no"):
+        return None
+
+    nucleos = int(os.environ.get("ML_NUCLEOS") or recursos.get("nucleos") or _nucleos_maquina())
+    concurrentes = int(
+        os.environ.get("ML_ENTRENAMIENTOS_CONCURRENTES") or recursos.get("entrenamientos_concurrentes") or 1
+    )
+    nucleos_nodo = max(1, nucleos // concurrentes)
+    # Paralelizar entre ajustes escala mejor que los hilos internos de un solo ajuste;
+    # los núcleos sobrantes se entregan como hilos a cada estimador.
+    n_jobs_cv = max(1, min(nucleos_nodo, tareas_cv))
+    hilos_estimador = max(1, nucleos_nodo // n_jobs_cv)
+    return AsignacionCPU(nucleos_nodo=nucleos_nodo, n_jobs_cv=n_jobs_cv, hilos_estimador=hilos_estimador)
+
+
+def fijar_hilos_estimador(estimador: Any, hilos: int, prefijo: str = "") -> None:
+    """Fija los hilos internos del estimador (``n_jobs``, ``nthread``...) si los admite."""
+    parametros = estimador.get_params()
+    estimador.set_params(
+        **{f"{prefijo}{clave}": hilos for clave in PARAMETROS_HILOS if f"{prefijo}{clave}" in parametros}
+    )
+
+
+@contextmanager
+def limitar_hilos(asignacion: Optional[AsignacionCPU]) -> Iterator[None]:
+    """Limita BLAS/OpenMP en este proceso y en los workers de joblib a ``hilos_estimador``."""
+    if asignacion is None:
+        yield
+        return
+    with threadpool_limits(limits=asignacion.hilos_estimador), parallel_config(
+        backend="loky", inner_max_num_threads=asignacion.hilos_estimador
+    ):
+        yield
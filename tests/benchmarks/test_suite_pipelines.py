@@ -0,0 +1,61 @@
+"""Tests para la suite de rendimiento de `benchmarks.suite_pipelines`."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from ml_analisis_ecosistema_dev.benchmarks import suite_pipelines
+from ml_analisis_ecosistema_dev.benchmarks.suite_pipelines import comparar, ejecutar_escala, generar_encuesta
+
+CONF = str(Path(__file__).resolve().parents[2] / "conf")
+
+COLUMNAS = {
+    "target_col": "ConvertedCompYearly",
+    "multi_answer_cols": ["LearnCode"],
+    "standard_categorical_cols": ["Country", "DevType"],
+    "numeric_cols": ["WorkExp"],
+}
+
+
+def test_encuesta_sintetica_imita_la_real():
+    df = generar_encuesta(5000, COLUMNAS, semilla=1)
+    assert list(df.columns) == ["LearnCode", "Country", "DevType", "WorkExp", "ConvertedCompYearly"]
+    assert df["LearnCode"].dtype == "category" and df["WorkExp"].dtype == "float32"
+    assert df["LearnCode"].cat.categories.str.contains(";").any()
+    assert df["Country"].nunique() > 100
+    assert df["ConvertedCompYearly"].isna().any() and df["LearnCode"].isna().any()
+    assert generar_encuesta(5000, COLUMNAS, semilla=1).equals(df)
+
+
+def test_comparar_detecta_regresiones():
+    linea_base = {"escalas": {"10000": {"pico_rss_mb": 500.0, "nodos": {"a": {"tiempo_pared_s": 1.0}}}}}
+    igual = {"escalas": {"10000": {"pico_rss_mb": 520.0, "nodos": {"a": {"tiempo_pared_s": 1.2}}}}}
+    assert comparar(igual, linea_base) == []
+
+    lento = {"escalas": {"10000": {"pico_rss_mb": 600.0, "nodos": {"a": {"tiempo_pared_s": 2.0}, "b": {}}}}}
+    regresiones = comparar(lento, linea_base)
+    assert len(regresiones) == 2 and regresiones[0].startswith("10000 filas, a:")
+
+
+def test_escala_pequena_del_procesamiento():
+    resultado = ejecutar_escala(3000, ["procesamiento_de_datos"], conf_source=CONF)
+    assert resultado["filas"] == 3000
+    assert {"preprocesamiento_final_node", "crear_plan_cv_node"} <= set(resultado["nodos"])
+    assert all(nodo["tiempo_pared_s"] >= 0 for nodo in resultado["nodos"].values())
+
+
+def test_sin_linea_base_la_suite_falla_antes_de_medir(tmp_path, monkeypatch):
+    monkeypatch.setattr(suite_pipelines, "medir", lambda *args: pytest.fail("No debe medir sin línea base"))
+    monkeypatch.setattr(sys, "argv", ["suite", "--linea-base", str(tmp_path / "no_existe.json")])
+
+    with pytest.raises(SystemExit) as salida:
+        suite_pipelines.main()
+    assert salida.value.code == 1
+
+
+def test_linea_base_versionada_cubre_la_escala_menor():
+    linea_base = json.loads(suite_pipelines.LINEA_BASE.read_text())
+    nodos = linea_base["escalas"][str(suite_pipelines.ESCALAS[0])]["nodos"]
+    assert {"preprocesamiento_final_node", "train_XGBRegressor_node"} <= set(nodos)
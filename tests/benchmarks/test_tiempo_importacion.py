@@ -0,0 +1,18 @@
+"""Tests para el benchmark de arranque de `benchmarks.tiempo_importacion`."""
+
+from ml_analisis_ecosistema_dev.benchmarks.tiempo_importacion import medir_registro, problemas
+
+
+def test_registrar_pipelines_no_importa_librerias_de_modelos():
+    # Intérprete nuevo: el proceso de pytest ya tiene sklearn y compañía importados. El
+    # límite de tiempo depende de la máquina y sólo lo aplica el benchmark (`--limite`).
+    medicion = medir_registro()
+
+    assert medicion["pipelines"] >= 9
+    assert medicion["librerias_pesadas"] == []
+
+
+def test_problemas_lista_los_incumplimientos():
+    assert problemas({"registro_s": 0.5, "librerias_pesadas": []}, limite=1.0) == []
+    encontrados = problemas({"registro_s": 2.0, "librerias_pesadas": ["xgboost"]}, limite=1.0)
+    assert len(encontrados) == 2 and "xgboost" in encontrados[1]
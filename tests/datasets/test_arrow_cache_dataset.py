@@ -0,0 +1,78 @@
+"""Tests para `ArrowCacheDataset` (caché Feather de los datos crudos)."""
+
+import logging
+
+import pandas as pd
+import pyarrow.feather as feather
+import pytest
+from kedro_datasets.pandas import CSVDataset
+
+from ml_analisis_ecosistema_dev.datasets import ArrowCacheDataset
+
+
+def _dataset(tmp_path, filepath):
+    return ArrowCacheDataset(
+        dataset={"type": "pandas.CSVDataset", "filepath": str(filepath)},
+        cache_dir=str(tmp_path / "cache"),
+    )
+
+
+def test_segunda_carga_usa_la_cache(tmp_path, caplog, monkeypatch):
+    filepath = tmp_path / "crudo.csv"
+    pd.DataFrame({"Country": ["Chile", "Peru"], "WorkExp": [1.5, 2.0]}).to_csv(filepath, index=False)
+    dataset = _dataset(tmp_path, filepath)
+
+    with caplog.at_level(logging.INFO):
+        primera = dataset.load()
+    assert "MISS" in caplog.text
+    assert len(list((tmp_path / "cache").glob("*.feather"))) == 1
+
+    # Con la caché caliente el CSV no se vuelve a parsear
+    monkeypatch.setattr(CSVDataset, "load", lambda self: (_ for _ in ()).throw(AssertionError))
+    caplog.clear()
+    with caplog.at_level(logging.INFO):
+        segunda = dataset.load()
+    assert "HIT" in caplog.text
+    pd.testing.assert_frame_equal(primera, segunda)
+
+
+def test_cambio_en_el_origen_invalida_la_cache(tmp_path):
+    filepath = tmp_path / "crudo.csv"
+    pd.DataFrame({"WorkExp": [1.0, 2.0]}).to_csv(filepath, index=False)
+    dataset = _dataset(tmp_path, filepath)
+    dataset.load()
+
+    pd.DataFrame({"WorkExp": [1.0, 2.0, 3.0]}).to_csv(filepath, index=False)
+    assert len(dataset.load()) == 3
+    # La entrada obsoleta se elimina al regenerar la caché
+    assert len(list((tmp_path / "cache").glob("*.feather"))) == 1
+
+
+def test_escritura_interrumpida_no_deja_una_entrada_valida(tmp_path, monkeypatch):
+    filepath = tmp_path / "crudo.csv"
+    pd.DataFrame({"WorkExp": [1.0, 2.0]}).to_csv(filepath, index=False)
+    dataset = _dataset(tmp_path, filepath)
+
+    def escritura_truncada(data, destino, **kwargs):
+        open(destino, "wb").write(b"ARROW1")
+        raise KeyboardInterrupt
+
+    with monkeypatch.context() as parche:
+        parche.setattr(feather, "write_feather", escritura_truncada)
+        with pytest.raises(KeyboardInterrupt):
+            dataset.load()
+    assert list((tmp_path / "cache").iterdir()) == []
+    # La siguiente carga vuelve a parsear el origen en lugar de leer el fichero truncado
+    assert len(dataset.load()) == 2
+
+
+def test_origenes_con_el_mismo_nombre_no_se_invalidan_entre_si(tmp_path):
+    for anio in ("2024", "2025"):
+        (tmp_path / anio).mkdir()
+        pd.DataFrame({"WorkExp": [1.0] * int(anio[-1])}).to_csv(tmp_path / anio / "survey.csv", index=False)
+    datasets = [_dataset(tmp_path, tmp_path / anio / "survey.csv") for anio in ("2024", "2025")]
+    for dataset in datasets:
+        dataset.load()
+
+    assert len(list((tmp_path / "cache").glob("survey-*.feather"))) == 2
+    assert [len(dataset.load()) for dataset in datasets] == [4, 5]
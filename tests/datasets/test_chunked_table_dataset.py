@@ -0,0 +1,31 @@
+"""Tests para `ChunkedTableDataset`."""
+
+import pandas as pd
+
+from ml_analisis_ecosistema_dev.datasets import ChunkedTableDataset
+
+COLUMNAS = {"target_col": "ConvertedCompYearly", "standard_categorical_cols": ["Country"], "numeric_cols": []}
+
+
+def _datos() -> pd.DataFrame:
+    return pd.DataFrame({"ResponseId": range(10), "Country": ["Chile", "Peru"] * 5, "Comentario": ["x"] * 10})
+
+
+def test_lotes_csv_con_columnas(tmp_path):
+    _datos().to_csv(tmp_path / "datos.csv", index=False)
+    dataset = ChunkedTableDataset(
+        filepath=str(tmp_path / "datos.csv"), filas_por_lote=4, columnas=COLUMNAS, columnas_extra=["ResponseId"]
+    )
+    lotes = list(dataset.load())
+
+    assert [len(lote) for lote in lotes] == [4, 4, 2]
+    assert set(lotes[0].columns) == {"ResponseId", "Country"}
+    assert lotes[0]["Country"].dtype == "category"
+
+
+def test_lotes_parquet(tmp_path):
+    _datos().to_parquet(tmp_path / "datos.parquet")
+    lotes = list(ChunkedTableDataset(filepath=str(tmp_path / "datos.parquet"), filas_por_lote=6).load())
+
+    assert [len(lote) for lote in lotes] == [6, 4]
+    pd.testing.assert_frame_equal(pd.concat(lotes, ignore_index=True), _datos())
@@ -0,0 +1,64 @@
+"""Tests para `MatrizMemmapDataset`."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from joblib import Parallel, delayed
+from kedro.io import DatasetError
+from scipy import sparse
+
+from ml_analisis_ecosistema_dev.datasets import MatrizMemmapDataset
+
+
+def _fichero_respaldo(X) -> str:
+    """Fichero del ``np.memmap`` que respalda la matriz (también desde un worker)."""
+    valores = X.data if sparse.issparse(X) else X._mgr.blocks[0].values
+    while not isinstance(valores, np.memmap):
+        valores = valores.base
+    return str(valores.filename)
+
+
+def test_denso_ida_y_vuelta_float32_mapeado(tmp_path):
+    X = pd.DataFrame({"WorkExp": [0.5, -1.0, 2.0], "Country_Chile": [True, False, True]}, index=[7, 3, 9])
+    dataset = MatrizMemmapDataset(filepath=str(tmp_path / "X_train"))
+    dataset.save(X)
+    cargado = dataset.load()
+
+    pd.testing.assert_frame_equal(cargado, X.astype(np.float32))
+    assert _fichero_respaldo(cargado) == str(tmp_path / "X_train" / "matriz.npy")
+
+
+def test_workers_reciben_el_mismo_fichero(tmp_path):
+    dataset = MatrizMemmapDataset(filepath=str(tmp_path / "X_train"))
+    dataset.save(pd.DataFrame(np.random.default_rng(0).random((500, 4))))
+    X = dataset.load()
+
+    ficheros = Parallel(n_jobs=2)(delayed(_fichero_respaldo)(X) for _ in range(2))
+    assert set(ficheros) == {str(tmp_path / "X_train" / "matriz.npy")}
+
+
+def test_csr_ida_y_vuelta(tmp_path):
+    X = sparse.random(20, 5, density=0.2, format="csr", dtype=np.float32, random_state=0)
+    dataset = MatrizMemmapDataset(filepath=str(tmp_path / "X_train"))
+    dataset.save(X)
+    cargado = dataset.load()
+
+    assert sparse.isspmatrix_csr(cargado)
+    assert (cargado != X).nnz == 0
+    assert Parallel(n_jobs=2)(delayed(_fichero_respaldo)(cargado) for _ in range(1)) == [
+        str(tmp_path / "X_train" / "data.npy")
+    ]
+
+
+def test_indice_de_strings_y_reescritura(tmp_path):
+    dataset = MatrizMemmapDataset(filepath=str(tmp_path / "X"))
+    dataset.save(pd.DataFrame({"a": [1.0, 2.0]}, index=["r1", "r2"]))
+    dataset.save(pd.DataFrame({"a": [3.0, 4.0, 5.0]}, index=["r3", "r4", "r5"]))
+    cargado = dataset.load()
+
+    assert list(cargado.index) == ["r3", "r4", "r5"]
+    assert sorted(ruta.name for ruta in tmp_path.iterdir()) == ["X"]
+    with pytest.raises(DatasetError, match="índices"):
+        dataset.save(pd.DataFrame({"a": [1.0]}, index=[("r", 1)]))
+    # Un guardado rechazado deja intacta la matriz anterior
+    assert len(dataset.load()) == 3
@@ -0,0 +1,77 @@
+"""Tests para `ModeloNativoDataset` y `utils.modelos_nativos`."""
+
+import pickle
+
+import numpy as np
+import pandas as pd
+from imblearn.over_sampling import SMOTE
+from imblearn.pipeline import Pipeline as ImbPipeline
+from lightgbm import LGBMClassifier
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import LogisticRegression
+from xgboost import XGBRegressor
+
+from ml_analisis_ecosistema_dev.datasets import ModeloNativoDataset
+from ml_analisis_ecosistema_dev.utils.parada_temprana import ParadaTemprana
+
+
+def _datos():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(400, 5)).astype(np.float32), columns=["a", "b", "c", "d", "e"])
+    X.iloc[::9, 1] = np.nan
+    y = 2 * X["a"].to_numpy() + rng.normal(0, 0.3, 400)
+    return X, y, (y > 0).astype(int)
+
+
+def test_pipeline_con_smote_se_guarda_como_coeficientes(tmp_path):
+    X, _, y = _datos()
+    X = X.fillna(0)
+    modelo = ImbPipeline([("smote", SMOTE(random_state=0)), ("model", LogisticRegression())]).fit(X, y)
+    dataset = ModeloNativoDataset(filepath=str(tmp_path / "clasificacion_model"))
+    dataset.save(modelo)
+    cargado = dataset.load()
+
+    assert sorted(p.name for p in (tmp_path / "clasificacion_model").iterdir()) == [
+        "coeficientes.npy", "intercepto.npy", "manifiesto.json"
+    ]
+    assert isinstance(cargado.coef_, np.memmap)
+    np.testing.assert_allclose(cargado.predict_proba(X), modelo.predict_proba(X), rtol=1e-12)
+    np.testing.assert_array_equal(cargado.predict(X[["e", "d", "c", "b", "a"]]), modelo.predict(X))
+
+
+def test_xgboost_con_parada_temprana_predice_hasta_la_mejor_ronda(tmp_path):
+    X, y, _ = _datos()
+    modelo = ParadaTemprana(XGBRegressor(n_estimators=300, max_depth=4), paciencia=5, random_state=0).fit(X, y)
+    dataset = ModeloNativoDataset(filepath=str(tmp_path / "regresion_model"))
+    dataset.save(modelo)
+    cargado = dataset.load()
+
+    assert sorted(p.name for p in (tmp_path / "regresion_model").iterdir()) == ["manifiesto.json", "modelo.ubj"]
+    assert cargado.manifiesto["rondas"] == modelo.n_rondas_ < 300
+    assert cargado._booster is None
+    np.testing.assert_allclose(cargado.predict(X), modelo.predict(X), rtol=1e-6)
+
+
+def test_booster_lightgbm_se_lee_en_la_primera_prediccion(tmp_path):
+    X, _, y = _datos()
+    modelo = LGBMClassifier(n_estimators=30, verbose=-1).fit(X, y)
+    dataset = ModeloNativoDataset(filepath=str(tmp_path / "clasificacion_model"))
+    dataset.save(modelo)
+    cargado = dataset.load()
+
+    assert cargado._booster is None
+    np.testing.assert_allclose(cargado.predict_proba(X), modelo.predict_proba(X))
+    assert cargado._booster is not None
+    # Al serializarse (p. ej. a otro proceso) el booster se vuelve a leer del fichero
+    copia = pickle.loads(pickle.dumps(cargado))
+    np.testing.assert_array_equal(copia.predict(X), modelo.predict(X))
+
+
+def test_otros_modelos_usan_joblib_mapeado(tmp_path):
+    X, y, _ = _datos()
+    X = X.fillna(0)
+    modelo = RandomForestRegressor(n_estimators=5, random_state=0).fit(X, y)
+    dataset = ModeloNativoDataset(filepath=str(tmp_path / "regresion_model"))
+    dataset.save(modelo)
+
+    np.testing.assert_array_equal(dataset.load().predict(X), modelo.predict(X))
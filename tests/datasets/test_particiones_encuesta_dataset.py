@@ -0,0 +1,37 @@
+"""Tests para `ParticionesEncuestaDataset` (encuestas particionadas por fuente y año)."""
+
+import pandas as pd
+import pytest
+from kedro.io import DatasetError
+
+from ml_analisis_ecosistema_dev.datasets import ParticionesEncuestaDataset
+
+
+def _escribir(raiz, nombre: str, salarios) -> None:
+    (raiz / nombre).mkdir(parents=True, exist_ok=True)
+    pd.DataFrame({"ConvertedCompYearly": salarios}).to_csv(raiz / nombre / "survey_results_public.csv", index=False)
+
+
+def _dataset(raiz) -> ParticionesEncuestaDataset:
+    return ParticionesEncuestaDataset(path=str(raiz), patron="stackoverflow_*/*.csv", dataset="pandas.CSVDataset")
+
+
+def test_particiones_por_directorio_con_huella(tmp_path):
+    _escribir(tmp_path, "stackoverflow_2023", [1.0, 2.0])
+    _escribir(tmp_path, "stackoverflow_2024", [3.0])
+    _escribir(tmp_path, "jetbrains_2025", [4.0])
+
+    particiones = _dataset(tmp_path).load()
+    assert list(particiones) == ["stackoverflow_2023", "stackoverflow_2024"]
+    assert particiones["stackoverflow_2024"]()["ConvertedCompYearly"].tolist() == [3.0]
+
+    huellas = {nombre: particion.huella for nombre, particion in particiones.items()}
+    _escribir(tmp_path, "stackoverflow_2024", [3.0, 5.0])
+    nuevas = {nombre: particion.huella for nombre, particion in _dataset(tmp_path).load().items()}
+    assert nuevas["stackoverflow_2023"] == huellas["stackoverflow_2023"]
+    assert nuevas["stackoverflow_2024"] != huellas["stackoverflow_2024"]
+
+
+def test_es_de_solo_lectura(tmp_path):
+    with pytest.raises(DatasetError, match="sólo lectura"):
+        _dataset(tmp_path).save({})
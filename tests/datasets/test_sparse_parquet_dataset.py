@@ -0,0 +1,28 @@
+"""Tests para `SparseParquetDataset`."""
+
+import pandas as pd
+
+from ml_analisis_ecosistema_dev.datasets import SparseParquetDataset
+
+
+def test_guardar_y_cargar_columnas_dispersas(tmp_path):
+    data = pd.DataFrame(
+        {
+            "LearnCode_Books": pd.arrays.SparseArray([0.0, 1.0, 0.0, 0.0, 1.0], fill_value=0.0, dtype="float32"),
+            "ConvertedCompYearly": [1.0, 2.0, 3.0, 4.0, 5.0],
+        },
+        index=[10, 11, 12, 13, 14],
+    )
+    dataset = SparseParquetDataset(filepath=str(tmp_path / "datos.parquet"), filas_por_grupo=2)
+    dataset.save(data)
+    recargado = dataset.load()
+
+    pd.testing.assert_frame_equal(recargado, data)
+
+
+def test_dataframe_denso_se_guarda_como_parquet_normal(tmp_path):
+    data = pd.DataFrame({"WorkExp": [1.0, 2.0], "ConvertedCompYearly": [3.0, 4.0]})
+    dataset = SparseParquetDataset(filepath=str(tmp_path / "datos.parquet"))
+    dataset.save(data)
+
+    pd.testing.assert_frame_equal(pd.read_parquet(tmp_path / "datos.parquet"), data)
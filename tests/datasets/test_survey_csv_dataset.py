@@ -0,0 +1,59 @@
+"""Tests para `SurveyCSVDataset` (ingesta podada y tipada)."""
+
+import pandas as pd
+
+from ml_analisis_ecosistema_dev.datasets import SurveyCSVDataset, columnas_requeridas
+
+COLUMNAS = {
+    "target_col": "ConvertedCompYearly",
+    "multi_answer_cols": ["LearnCode"],
+    "standard_categorical_cols": ["Country", "OrgSize"],
+    "numeric_cols": ["WorkExp"],
+}
+
+
+def _csv_crudo(tmp_path):
+    df = pd.DataFrame(
+        {
+            "ResponseId": [1, 2, 3],
+            "Country": ["Chile", "Peru", "Chile"],
+            "LearnCode": ["Books;School", None, "School"],
+            "WorkExp": [3, None, 10],
+            "ConvertedCompYearly": [50000, 80000, None],
+            "Comentario": ["a", "b", "c"],
+        }
+    )
+    filepath = tmp_path / "so.csv"
+    df.to_csv(filepath, index=False, encoding="utf-8-sig")
+    return filepath
+
+
+def test_columnas_requeridas_asigna_tipos():
+    requeridas = columnas_requeridas(COLUMNAS)
+    assert requeridas == {
+        "ConvertedCompYearly": "float32",
+        "WorkExp": "float32",
+        "LearnCode": "category",
+        "Country": "category",
+        "OrgSize": "category",
+    }
+
+
+def test_load_poda_y_tipa_columnas(tmp_path):
+    dataset = SurveyCSVDataset(
+        filepath=str(_csv_crudo(tmp_path)),
+        columnas=COLUMNAS,
+        load_args={"encoding": "utf-8-sig", "engine": "pyarrow"},
+    )
+    df = dataset.load()
+
+    # `OrgSize` no existe en el CSV y se ignora; `ResponseId` y `Comentario` no se leen
+    assert set(df.columns) == {"Country", "LearnCode", "WorkExp", "ConvertedCompYearly"}
+    assert df["Country"].dtype == "category"
+    assert df["WorkExp"].dtype == "float32"
+    assert len(df) == 3
+
+
+def test_load_sin_columnas_lee_todo(tmp_path):
+    dataset = SurveyCSVDataset(filepath=str(_csv_crudo(tmp_path)), load_args={"encoding": "utf-8-sig"})
+    assert "ResponseId" in dataset.load().columns
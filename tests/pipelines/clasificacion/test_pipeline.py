@@ -0,0 +1,118 @@
+"""Tests para el pipeline `clasificacion`."""
+
+import numpy as np
+import pandas as pd
+
+from ml_analisis_ecosistema_dev.pipelines.clasificacion.nodes import train_classifier_with_grid_search
+
+
+def _datos(n: int = 120):
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.random((n, 3)), columns=["WorkExp", "Country_Chile", "Country_Peru"])
+    y = pd.Series((X["WorkExp"] + 0.2 * rng.random(n) > 0.75).astype(int), name="salary_group")
+    return X, y
+
+
+def test_halving_con_n_estimators_dentro_del_pipeline_smote():
+    X, y = _datos()
+    params = {
+        "random_state": 42,
+        "cv_folds": 3,
+        "scoring": "f1",
+        "search": {"strategy": "halving_grid", "resource": "n_estimators", "max_resources": 27},
+        "models": {
+            "RandomForestClassifier": {
+                "model_name": "RandomForestClassifier",
+                "param_grid": {"model__n_estimators": [100], "model__max_depth": [2, 4, 8]},
+            }
+        },
+    }
+    modelo = train_classifier_with_grid_search(X, y, "RandomForestClassifier", params)
+
+    assert modelo.named_steps["model"].n_estimators == 27
+
+
+def test_busqueda_por_defecto_es_grid_exhaustiva():
+    X, y = _datos()
+    params = {
+        "random_state": 42,
+        "cv_folds": 3,
+        "models": {"LogisticRegression": {"model_name": "LogisticRegression", "param_grid": {"model__C": [0.1, 1.0]}}},
+    }
+    modelo = train_classifier_with_grid_search(X, y, "LogisticRegression", params)
+
+    assert modelo.named_steps["model"].C in (0.1, 1.0)
+
+
+def test_smote_cacheado_equivale_a_smote(tmp_path):
+    from imblearn.over_sampling import SMOTE
+
+    from ml_analisis_ecosistema_dev.pipelines.clasificacion.remuestreo import SMOTECacheado
+
+    X, y = _datos()
+    X = X.astype(np.float32)
+    esperado_X, esperado_y = SMOTE(random_state=0).fit_resample(X, y)
+    for _ in range(2):  # MISS y después HIT
+        X_res, y_res = SMOTECacheado(random_state=0, directorio_cache=str(tmp_path)).fit_resample(X, y)
+        pd.testing.assert_frame_equal(X_res, esperado_X)
+        pd.testing.assert_series_equal(y_res, esperado_y)
+
+
+def test_cada_fold_se_sobremuestrea_una_vez_entre_clasificadores(tmp_path):
+    X, y = _datos()
+    params = {
+        "random_state": 42,
+        "cv_folds": 3,
+        "cache_smote": str(tmp_path / "cache_smote"),
+        "models": {
+            "LogisticRegression": {"model_name": "LogisticRegression", "param_grid": {"model__C": [0.1, 1.0]}},
+            "RandomForestClassifier": {
+                "model_name": "RandomForestClassifier",
+                "param_grid": {"model__n_estimators": [10], "model__max_depth": [2, 4]},
+            },
+        },
+    }
+    for model_name in params["models"]:
+        train_classifier_with_grid_search(X, y, model_name, params)
+
+    # 3 folds + el reajuste final sobre todo el entrenamiento
+    entradas = [ruta for ruta in (tmp_path / "cache_smote").iterdir() if ruta.is_dir()]
+    assert len(entradas) == 4
+
+
+def test_cache_smote_poda_las_entradas_menos_usadas(tmp_path, monkeypatch):
+    from ml_analisis_ecosistema_dev.pipelines.clasificacion import remuestreo
+    from ml_analisis_ecosistema_dev.utils.cache import podar_cache
+
+    monkeypatch.setattr(remuestreo, "podar_cache", lambda directorio: podar_cache(directorio, max_entradas=2))
+    X, y = _datos()
+    smote = remuestreo.SMOTECacheado(random_state=0, directorio_cache=str(tmp_path))
+    for n in (60, 80, 100):
+        smote.fit_resample(X.head(n), y.head(n))
+
+    entradas = sorted(ruta.name for ruta in tmp_path.iterdir() if ruta.is_dir())
+    assert len(entradas) == 2
+    # Los `.lock` recientes se conservan aunque su entrada se haya podado
+    assert set(entradas) < {ruta.stem for ruta in tmp_path.glob("*.lock")}
+
+
+def test_parada_temprana_remuestrea_solo_la_parte_de_ajuste(tmp_path):
+    X, y = _datos()
+    params = {
+        "random_state": 42,
+        "cv_folds": 3,
+        "cache_smote": str(tmp_path / "cache_smote"),
+        "parada_temprana": {"activo": True, "paso_bosque": 5, "paciencia": 10},
+        "models": {
+            "RandomForestClassifier": {
+                "model_name": "RandomForestClassifier",
+                "param_grid": {"model__n_estimators": [20], "model__max_depth": [2, 4]},
+            },
+        },
+    }
+    modelo = train_classifier_with_grid_search(X, y, "RandomForestClassifier", params)
+
+    # SMOTE ya no es un paso del pipeline, sino de la parada temprana
+    assert [nombre for nombre, _ in modelo.steps] == ["model"]
+    assert modelo.named_steps["model"].remuestreo.directorio_cache == params["cache_smote"]
+    assert modelo.named_steps["model"].scoring == "f1"
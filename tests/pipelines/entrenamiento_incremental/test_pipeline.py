@@ -0,0 +1,97 @@
+"""Tests para el pipeline `entrenamiento_incremental`."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.metrics import roc_auc_score
+
+from ml_analisis_ecosistema_dev.datasets import ChunkedTableDataset
+from ml_analisis_ecosistema_dev.pipelines.entrenamiento_incremental.nodes import (
+    calcular_estadisticas_incrementales,
+    entrenar_clasificador_incremental,
+    entrenar_regresor_incremental,
+    evaluar_clasificador_incremental,
+    evaluar_regresor_incremental,
+)
+from ml_analisis_ecosistema_dev.pipelines.plan_cv.nodes import HOLDOUT, crear_plan_cv
+
+PARAMS = {
+    "target_col": "ConvertedCompYearly",
+    "salary_threshold": 100000,
+    "epocas": 5,
+    "random_state": 42,
+    "regresor": {"penalty": "l2", "alpha": 0.0001},
+    "clasificador": {"loss": "log_loss", "alpha": 0.0001, "class_weight": "balanced"},
+}
+
+PARAMS_PLAN = {
+    "target_col": "ConvertedCompYearly",
+    "umbral_estratificacion": 100000,
+    "test_size": 0.2,
+    "cv_folds": 3,
+    "random_state": 42,
+}
+
+
+def _lotes(tmp_path, n: int = 3000):
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(
+        {"WorkExp": rng.normal(10, 5, n), "YearsCode": rng.normal(12, 6, n), "Country_Chile": rng.random(n) < 0.3},
+        index=rng.permutation(10 * n)[:n],
+    )
+    data["ConvertedCompYearly"] = (
+        40000
+        + 5000 * data["WorkExp"]
+        + 1000 * data["YearsCode"]
+        - 20000 * data["Country_Chile"]
+        + rng.normal(0, 5000, n)
+    )
+    ruta = tmp_path / "datos_para_modelado.parquet"
+    data.to_parquet(ruta, row_group_size=500)
+    plan = crear_plan_cv(data, PARAMS_PLAN)
+    return ChunkedTableDataset(filepath=str(ruta), filas_por_lote=400).load(), data, plan
+
+
+def test_estadisticas_coinciden_con_las_de_memoria(tmp_path):
+    lotes, data, plan = _lotes(tmp_path)
+    estadisticas = calcular_estadisticas_incrementales(lotes, plan, PARAMS)
+
+    entrenamiento = data[plan["particion"] != HOLDOUT]
+    X = entrenamiento.drop(columns="ConvertedCompYearly").to_numpy(dtype=float)
+    np.testing.assert_allclose(estadisticas["escalador"].mean_, X.mean(axis=0))
+    np.testing.assert_allclose(estadisticas["escalador"].scale_, X.std(axis=0))
+    assert np.isclose(estadisticas["media_objetivo"], entrenamiento["ConvertedCompYearly"].mean())
+    assert estadisticas["conteo_clases"][1] == (entrenamiento["ConvertedCompYearly"] > 100000).sum()
+
+
+def test_modelos_incrementales_predicen_sobre_columnas_sin_escalar(tmp_path):
+    lotes, data, plan = _lotes(tmp_path)
+    estadisticas = calcular_estadisticas_incrementales(lotes, plan, PARAMS)
+    regresor = entrenar_regresor_incremental(lotes, plan, estadisticas, PARAMS)
+    clasificador = entrenar_clasificador_incremental(lotes, plan, estadisticas, PARAMS)
+
+    metricas = evaluar_regresor_incremental(lotes, plan, regresor, PARAMS)["SGDRegressor"]
+    assert metricas["r2"] > 0.9
+    np.testing.assert_allclose(regresor.coef_, [5000, 1000, -20000], rtol=0.1)
+
+    holdout = data[plan["particion"] == HOLDOUT]
+    X_holdout = holdout.drop(columns="ConvertedCompYearly")
+    y_holdout = (holdout["ConvertedCompYearly"] > 100000).astype(int)
+    metricas_clf = evaluar_clasificador_incremental(lotes, plan, clasificador, PARAMS)["SGDClassifier"]
+    assert metricas_clf["roc_auc"] > 0.9
+    exacto = roc_auc_score(y_holdout, clasificador.predict_proba(X_holdout)[:, 1])
+    assert abs(metricas_clf["roc_auc"] - exacto) < 1e-3
+    assert metricas_clf["accuracy"] == (clasificador.predict(X_holdout) == y_holdout).mean()
+
+
+def test_evaluacion_sin_holdout_falla(tmp_path):
+    lotes, _, plan = _lotes(tmp_path)
+    estadisticas = calcular_estadisticas_incrementales(lotes, plan, PARAMS)
+    regresor = entrenar_regresor_incremental(lotes, plan, estadisticas, PARAMS)
+    clasificador = entrenar_clasificador_incremental(lotes, plan, estadisticas, PARAMS)
+    sin_holdout = plan.assign(particion=plan["particion"].where(plan["particion"] != HOLDOUT, 0))
+
+    with pytest.raises(ValueError, match="holdout"):
+        evaluar_regresor_incremental(lotes, sin_holdout, regresor, PARAMS)
+    with pytest.raises(ValueError, match="holdout"):
+        evaluar_clasificador_incremental(lotes, sin_holdout, clasificador, PARAMS)
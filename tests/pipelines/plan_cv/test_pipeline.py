@@ -0,0 +1,58 @@
+"""Tests para el pipeline `plan_cv`."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ml_analisis_ecosistema_dev.pipelines.clasificacion.nodes import split_data as split_clasificacion
+from ml_analisis_ecosistema_dev.pipelines.plan_cv.nodes import HOLDOUT, crear_plan_cv, validador_del_plan
+from ml_analisis_ecosistema_dev.pipelines.regresion.nodes import split_data as split_regresion
+
+PARAMS = {
+    "target_col": "ConvertedCompYearly",
+    "umbral_estratificacion": 100000,
+    "test_size": 0.25,
+    "cv_folds": 3,
+    "random_state": 42,
+}
+
+
+def _datos_para_modelado(n: int = 80) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(rng.random((n, 2)), columns=["WorkExp", "Country_Chile"], index=rng.permutation(1000)[:n])
+    data["ConvertedCompYearly"] = 60000 + 80000 * data["WorkExp"]
+    return data
+
+
+def test_plan_estratificado_y_compacto():
+    data = _datos_para_modelado()
+    plan = crear_plan_cv(data, PARAMS)
+
+    assert plan["particion"].dtype == np.int8
+    assert plan.index.equals(data.index)
+    assert (plan["particion"] == HOLDOUT).sum() == 20
+    assert sorted(plan.loc[plan["particion"] >= 0, "particion"].unique()) == [0, 1, 2]
+    alto = data["ConvertedCompYearly"] > 100000
+    proporcion_holdout = alto[plan["particion"] == HOLDOUT].mean()
+    assert abs(proporcion_holdout - alto.mean()) < 0.1
+
+
+def test_regresion_y_clasificacion_comparten_holdout_y_folds():
+    data = _datos_para_modelado()
+    plan = crear_plan_cv(data, PARAMS)
+    reg = split_regresion(data, {"target_col": "ConvertedCompYearly"}, plan)
+    clf_data = data.assign(salary_group=(data.pop("ConvertedCompYearly") > 100000).astype(int))
+    clf = split_clasificacion(clf_data, {"target_col": "salary_group"}, plan)
+
+    assert reg["y_test"].index.equals(clf["y_test"].index)
+    cv_reg = validador_del_plan(plan, reg["y_train"].index, respaldo=None)
+    cv_clf = validador_del_plan(plan, clf["y_train"].index, respaldo=None)
+    for (_, val_reg), (_, val_clf) in zip(cv_reg.split(), cv_clf.split()):
+        np.testing.assert_array_equal(val_reg, val_clf)
+
+
+def test_plan_desactualizado_falla():
+    data = _datos_para_modelado()
+    plan = crear_plan_cv(data.iloc[:50], PARAMS)
+    with pytest.raises(ValueError, match="plan de CV"):
+        split_regresion(data, {"target_col": "ConvertedCompYearly"}, plan)
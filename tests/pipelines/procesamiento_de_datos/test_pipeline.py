@@ -1,9 +1,127 @@
-"""
-This is a boilerplate test file for pipeline 'procesamiento_de_datos'
-generated using Kedro 1.0.0.
-Please add your pipeline tests here.
-
-Kedro recommends using `pytest` framework, more info about it can be found
-in the official documentation:
-https://docs.pytest.org/en/latest/getting-started.html
-"""
+"""Tests para el pipeline `procesamiento_de_datos`."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ml_analisis_ecosistema_dev.pipelines.procesamiento_de_datos import create_pipeline
+from ml_analisis_ecosistema_dev.pipelines.procesamiento_de_datos.estadisticas import (
+    boceto_de_columna,
+    combinar_bocetos,
+    contar_nulos,
+)
+from ml_analisis_ecosistema_dev.pipelines.procesamiento_de_datos.nodes import (
+    limpiar_nulos_por_columna,
+    preprocesamiento_final_con_allowlist,
+)
+
+PARAMS = {
+    "target_col": "ConvertedCompYearly",
+    "multi_answer_cols": ["LearnCode"],
+    "standard_categorical_cols": ["Country"],
+    "numeric_cols": ["WorkExp"],
+}
+
+
+def _datos_encuesta() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "LearnCode": ["Books;School", None, "School", "Books"],
+            "Country": ["Chile", "Peru", "Chile", "Peru"],
+            "WorkExp": [3.0, 5.0, 10.0, 1.0],
+            "Comentario": ["a", "b", "c", "d"],
+            "ConvertedCompYearly": [50000.0, 80000.0, 60000.0, 40000.0],
+        }
+    )
+
+
+def test_pipeline_builds():
+    assert "datos_para_modelado" in create_pipeline().all_outputs()
+
+
+def test_preprocesamiento_con_columnas_category():
+    """La ingesta tipada entrega `category`/`float32`; el resultado debe coincidir con el de texto."""
+    df = _datos_encuesta()
+    tipado = df.astype({"LearnCode": "category", "Country": "category", "WorkExp": "float32"})
+    # Una categoría sin filas no debe generar una columna dummy
+    tipado["Country"] = tipado["Country"].cat.add_categories(["Argentina"])
+
+    esperado, _ = preprocesamiento_final_con_allowlist(df, PARAMS)
+    obtenido, _ = preprocesamiento_final_con_allowlist(tipado, PARAMS)
+
+    assert list(obtenido.columns) == list(esperado.columns)
+    assert "Comentario" not in obtenido.columns
+    assert {"LearnCode_Books", "LearnCode_School", "Country_Chile"} <= set(obtenido.columns)
+
+
+def test_pipeline_por_defecto_no_lee_jetbrains():
+    """Las ramas de JetBrains no alimentan `datos_para_modelado` y se podan."""
+    podado = create_pipeline().to_outputs("datos_para_modelado")
+    datos_crudos = {nombre for nombre in podado.inputs() if nombre.startswith("datos_crudos")}
+    assert datos_crudos == {"datos_crudos_so_2023"}
+
+
+def test_preprocesamiento_disperso_coincide_con_denso():
+    """El modo disperso genera las mismas columnas, todas `SparseDtype` salvo el objetivo."""
+    df = _datos_encuesta()
+    denso, _ = preprocesamiento_final_con_allowlist(df, PARAMS)
+    disperso, _ = preprocesamiento_final_con_allowlist(df, {**PARAMS, "sparse_output": True})
+
+    assert list(disperso.columns) == list(denso.columns)
+    features = disperso.drop(columns=[PARAMS["target_col"]])
+    assert all(isinstance(dtype, pd.SparseDtype) for dtype in features.dtypes)
+    # Las dummies de categóricas estándar quedan en 0/1 en ambos modos
+    assert (disperso["Country_Chile"].sparse.to_dense() == denso["Country_Chile"].astype(float)).all()
+
+
+def test_preprocesador_transforma_encuestados_nuevos():
+    """El transformador ajustado reproduce las filas de entrenamiento e ignora categorías nuevas."""
+    df = _datos_encuesta()
+    final_df, preprocesador = preprocesamiento_final_con_allowlist(df, PARAMS)
+
+    lote = preprocesador.transform(df.iloc[[1, 2]])
+    pd.testing.assert_frame_equal(lote, final_df.drop(columns=[PARAMS["target_col"]]).iloc[[1, 2]])
+
+    nuevo = pd.DataFrame({"LearnCode": ["Books;Podcasts"], "Country": ["Uruguay"], "WorkExp": [5.0]})
+    fila = preprocesador.transform(nuevo)
+    assert list(fila.columns) == list(lote.columns)
+    assert not fila.filter(like="Country_").any(axis=None)
+
+
+def test_boceto_exacto_coincide_con_pandas():
+    rng = np.random.default_rng(0)
+    serie = pd.Series(rng.integers(0, 50, 501).astype(float) * 1000)
+    boceto = combinar_bocetos([boceto_de_columna(serie[:200], None), boceto_de_columna(serie[200:], None)])
+    for q in (0.0, 0.25, 0.5, 0.75, 1.0):
+        assert boceto.cuantil(q) == pytest.approx(serie.quantile(q))
+
+
+def test_boceto_combinado_respeta_el_error_de_rango():
+    rng = np.random.default_rng(1)
+    valores = rng.lognormal(11, 0.7, 200_000)
+    partes = [boceto_de_columna(pd.Series(valores[i::4]), 0.01, filas_por_bloque=10_000) for i in range(4)]
+    boceto = combinar_bocetos(partes)
+
+    ordenados = np.sort(valores)
+    assert boceto.n == len(valores)
+    assert sum(len(nivel) for nivel in boceto.niveles) < 2000
+    for q in (0.25, 0.5, 0.75):
+        rango = np.searchsorted(ordenados, boceto.cuantil(q)) / len(valores)
+        assert abs(rango - q) < 0.01
+
+
+def test_filtro_de_nulos_por_bloques():
+    df = _datos_encuesta().assign(Vacia=[None, None, None, "x"])
+    limpio = limpiar_nulos_por_columna(df, "prueba", filas_por_bloque=3)
+    assert "Vacia" not in limpio.columns
+    assert "LearnCode" in limpio.columns
+
+
+def test_conteo_de_nulos_en_paralelo_coincide_con_serie():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.random((500, 23))).mask(rng.random((500, 23)) < 0.3)
+    df.columns = [f"c{i}" for i in range(df.shape[1])]
+    serie = contar_nulos(df, filas_por_bloque=64)
+    for hilos, columnas in ((2, None), (4, 5), (8, 1)):
+        paralelo = contar_nulos(df, filas_por_bloque=64, n_hilos=hilos, columnas_por_bloque=columnas)
+        pd.testing.assert_series_equal(paralelo, serie)
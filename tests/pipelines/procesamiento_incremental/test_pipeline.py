@@ -0,0 +1,114 @@
+"""Tests para el pipeline `procesamiento_incremental`."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ml_analisis_ecosistema_dev.datasets import ParticionesEncuestaDataset
+from ml_analisis_ecosistema_dev.pipelines.procesamiento_de_datos.nodes import (
+    eliminar_filas_sin_salario,
+    filtrar_outliers_salario,
+    limpiar_nulos_por_columna,
+    preprocesamiento_final_con_allowlist,
+)
+from ml_analisis_ecosistema_dev.pipelines.procesamiento_incremental.nodes import (
+    actualizar_particiones,
+    calcular_filtros_globales,
+    preprocesamiento_final_incremental,
+)
+
+PARAMS = {
+    "target_col": "ConvertedCompYearly",
+    "multi_answer_cols": ["LearnCode"],
+    "standard_categorical_cols": ["Country"],
+    "numeric_cols": ["WorkExp"],
+}
+COLUMNAS = {
+    "target_col": "ConvertedCompYearly",
+    "multi_answer_cols": ["LearnCode"],
+    "standard_categorical_cols": ["Country", "Casi_Vacia"],
+    "numeric_cols": ["WorkExp"],
+}
+
+
+def _encuesta(n: int, semilla: int) -> pd.DataFrame:
+    rng = np.random.default_rng(semilla)
+    salario = rng.lognormal(11, 0.6, n)
+    salario[rng.random(n) < 0.1] = np.nan
+    return pd.DataFrame(
+        {
+            "LearnCode": rng.choice(["Books;School", "School", "Books;Online", None, "Online;Online"], n),
+            "Country": rng.choice(["Chile", "Peru", "Mexico"] + (["Uruguay"] if semilla else []), n),
+            "Casi_Vacia": np.where(rng.random(n) < 0.8, None, "x"),
+            "WorkExp": np.where(rng.random(n) < 0.2, np.nan, rng.integers(0, 30, n)),
+            "ConvertedCompYearly": salario,
+        }
+    )
+
+
+def _escribir(raiz, nombre: str, df: pd.DataFrame) -> None:
+    (raiz / nombre).mkdir(parents=True, exist_ok=True)
+    df.to_csv(raiz / nombre / "survey_results_public.csv", index=False)
+
+
+def _ejecutar(raiz, directorio, params=PARAMS, n_jobs=1):
+    dataset = ParticionesEncuestaDataset(
+        path=str(raiz),
+        patron="stackoverflow_*/*.csv",
+        dataset={"type": "ml_analisis_ecosistema_dev.datasets.SurveyCSVDataset", "columnas": COLUMNAS},
+    )
+    configuracion = {"directorio_particiones": str(directorio), "n_jobs": n_jobs}
+    resumenes = actualizar_particiones(dataset.load(), params, configuracion)
+    filtros = calcular_filtros_globales(resumenes, configuracion)
+    return preprocesamiento_final_incremental(resumenes, filtros, params, configuracion)
+
+
+def _procesamiento_completo(particiones, params=PARAMS) -> pd.DataFrame:
+    """`procesamiento_de_datos` sobre la unión de las particiones leídas con los mismos tipos."""
+    partes, desplazamiento = [], 0
+    for df in particiones:
+        partes.append(df.set_axis(df.index + desplazamiento))
+        desplazamiento += len(df)
+    union = pd.concat(partes).astype({"LearnCode": "category", "Country": "category", "Casi_Vacia": "category"})
+    union = union.astype({"WorkExp": "float32", "ConvertedCompYearly": "float32"})
+    df = limpiar_nulos_por_columna(union, "union")
+    df = filtrar_outliers_salario(eliminar_filas_sin_salario(df, params["target_col"]), params["target_col"])
+    return preprocesamiento_final_con_allowlist(df, params)[0]
+
+
+def _matriz(df: pd.DataFrame) -> np.ndarray:
+    return np.column_stack([np.asarray(df[col], dtype=np.float64) for col in df.columns])
+
+
+@pytest.mark.parametrize("sparse_output", [False, True])
+def test_particiones_equivalen_al_procesamiento_completo(tmp_path, sparse_output):
+    params = {**PARAMS, "sparse_output": sparse_output}
+    particiones = [_encuesta(300, 0), _encuesta(200, 1)]
+    for nombre, df in zip(["stackoverflow_2023", "stackoverflow_2024"], particiones):
+        _escribir(tmp_path / "raw", nombre, df)
+
+    # Las dos particiones nuevas se procesan en paralelo
+    obtenido, _ = _ejecutar(tmp_path / "raw", tmp_path / "particiones", params, n_jobs=2)
+    esperado = _procesamiento_completo(particiones, params)
+
+    assert "Casi_Vacia_x" not in obtenido.columns
+    assert "Country_Uruguay" in obtenido.columns
+    assert list(obtenido.columns) == list(esperado.columns)
+    assert obtenido.index.equals(esperado.index)
+    np.testing.assert_allclose(_matriz(obtenido), _matriz(esperado), rtol=1e-6, atol=1e-9)
+
+
+def test_solo_se_reprocesan_particiones_nuevas(tmp_path, caplog):
+    _escribir(tmp_path / "raw", "stackoverflow_2023", _encuesta(300, 0))
+    _ejecutar(tmp_path / "raw", tmp_path / "particiones")
+    datos_2023 = tmp_path / "particiones" / "stackoverflow_2023" / "datos.parquet"
+    modificado = datos_2023.stat().st_mtime_ns
+
+    _escribir(tmp_path / "raw", "stackoverflow_2024", _encuesta(200, 1))
+    with caplog.at_level("INFO"):
+        obtenido, _ = _ejecutar(tmp_path / "raw", tmp_path / "particiones")
+
+    assert datos_2023.stat().st_mtime_ns == modificado
+    assert "Partición 'stackoverflow_2023': sin cambios" in caplog.text
+    assert "Partición 'stackoverflow_2024': nueva o modificada" in caplog.text
+    assert obtenido.index.is_unique
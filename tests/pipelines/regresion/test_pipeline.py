@@ -0,0 +1,111 @@
+"""Tests para el pipeline `regresion`."""
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import Ridge
+
+from ml_analisis_ecosistema_dev.pipelines.regresion.nodes import split_data, train_model_with_grid_search
+from ml_analisis_ecosistema_dev.utils.busqueda import configuracion_busqueda, crear_busqueda
+
+PARAMS = {"target_col": "ConvertedCompYearly", "test_size": 0.25, "random_state": 42}
+
+
+def _datos_para_modelado(n: int = 40) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.random((n, 3)), columns=["WorkExp", "Country_Chile", "Country_Peru"])
+    X["ConvertedCompYearly"] = 50000 + 20000 * X["WorkExp"]
+    return X
+
+
+def test_split_data_denso_devuelve_dataframes():
+    partes = split_data(_datos_para_modelado(), PARAMS)
+    assert isinstance(partes["X_train"], pd.DataFrame)
+    assert len(partes["X_train"]) == 30
+
+
+def test_split_data_disperso_devuelve_csr():
+    data = _datos_para_modelado()
+    features = data.drop(columns=["ConvertedCompYearly"]).astype(pd.SparseDtype("float32", 0))
+    partes = split_data(pd.concat([features, data["ConvertedCompYearly"]], axis=1), PARAMS)
+
+    assert sparse.isspmatrix_csr(partes["X_train"])
+    assert partes["X_train"].dtype == np.float32
+    assert partes["X_train"].shape == (30, 3)
+
+
+def _params_busqueda(modelo: str, param_grid, search) -> dict:
+    return {
+        **PARAMS,
+        "cv_folds": 3,
+        "search": search,
+        "models": {modelo: {"model_name": modelo, "param_grid": param_grid}},
+    }
+
+
+def test_busqueda_aleatoria_respeta_el_presupuesto():
+    data = _datos_para_modelado(60)
+    params = _params_busqueda(
+        "Ridge",
+        {"alpha": {"distribucion": "loguniform", "low": 0.01, "high": 10.0}},
+        {"strategy": "random", "n_iter": 4},
+    )
+    modelo = train_model_with_grid_search(
+        data.drop(columns=["ConvertedCompYearly"]), data["ConvertedCompYearly"], "Ridge", params
+    )
+    assert 0.01 <= modelo.alpha <= 10.0
+
+
+def test_busqueda_halving_usa_n_estimators_como_recurso():
+    params = _params_busqueda(
+        "RandomForestRegressor",
+        {"n_estimators": [100], "max_depth": [2, 4, 8]},
+        {"strategy": "halving_grid", "resource": "n_estimators", "max_resources": 27, "factor": 3},
+    )
+    busqueda = crear_busqueda(
+        RandomForestRegressor(random_state=0),
+        params["models"]["RandomForestRegressor"]["param_grid"],
+        cv=3,
+        scoring="r2",
+        configuracion=configuracion_busqueda(params, "RandomForestRegressor"),
+    )
+    data = _datos_para_modelado(60)
+    busqueda.fit(data.drop(columns=["ConvertedCompYearly"]), data["ConvertedCompYearly"])
+
+    assert busqueda.resource == "n_estimators"
+    assert busqueda.n_resources_[-1] == 27
+    assert busqueda.best_estimator_.n_estimators == 27
+
+
+def test_halving_sin_el_recurso_vuelve_a_los_limites_por_defecto():
+    params = _params_busqueda(
+        "Ridge",
+        {"alpha": [0.1, 1.0, 10.0]},
+        {"strategy": "halving_grid", "resource": "n_estimators", "max_resources": 27, "min_resources": 9},
+    )
+    busqueda = crear_busqueda(
+        Ridge(), {"alpha": [0.1, 1.0, 10.0]}, cv=3, scoring="r2", configuracion=configuracion_busqueda(params, "Ridge")
+    )
+
+    # 27 árboles no deben convertirse en un tope de 27 filas
+    assert (busqueda.resource, busqueda.min_resources, busqueda.max_resources) == ("n_samples", "exhaust", "auto")
+
+
+def test_halving_sobre_arboles_no_envuelve_con_parada_temprana():
+    params = {
+        **_params_busqueda(
+            "RandomForestRegressor",
+            {"n_estimators": [100], "max_depth": [2, 4]},
+            {"strategy": "halving_grid", "resource": "n_estimators", "max_resources": 18, "factor": 3},
+        ),
+        "parada_temprana": {"activo": True, "paso_bosque": 5},
+    }
+    data = _datos_para_modelado(60)
+    modelo = train_model_with_grid_search(
+        data.drop(columns=["ConvertedCompYearly"]), data["ConvertedCompYearly"], "RandomForestRegressor", params
+    )
+
+    # La búsqueda usa los árboles como recurso en lugar de volver a `n_samples`
+    assert isinstance(modelo, RandomForestRegressor)
+    assert modelo.n_estimators == 18
@@ -0,0 +1,73 @@
+"""Tests para el pipeline `scoring`."""
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression, LogisticRegression
+
+from ml_analisis_ecosistema_dev.datasets import ChunkedTableDataset
+from ml_analisis_ecosistema_dev.pipelines.procesamiento_de_datos.nodes import (
+    preprocesamiento_final_con_allowlist,
+)
+from ml_analisis_ecosistema_dev.pipelines.scoring import create_pipeline
+from ml_analisis_ecosistema_dev.pipelines.scoring.nodes import puntuar_lote, puntuar_por_lotes
+
+PARAMS = {
+    "target_col": "ConvertedCompYearly",
+    "multi_answer_cols": ["LearnCode"],
+    "standard_categorical_cols": ["Country"],
+}
+
+
+def _encuestados(n: int = 30) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "ResponseId": np.arange(n),
+            "LearnCode": rng.choice(["Books", "School", "Books;School", None], n),
+            "Country": rng.choice(["Chile", "Peru"], n),
+            "WorkExp": rng.integers(0, 20, n).astype(float),
+            "ConvertedCompYearly": rng.normal(80000, 20000, n),
+        }
+    )
+
+
+def _modelos(df: pd.DataFrame):
+    final_df, preprocesador = preprocesamiento_final_con_allowlist(df.drop(columns=["ResponseId"]), PARAMS)
+    X = final_df.drop(columns=[PARAMS["target_col"]])
+    y = final_df[PARAMS["target_col"]]
+    return preprocesador, LinearRegression().fit(X, y), LogisticRegression().fit(X, (y > 80000).astype(int))
+
+
+def test_pipeline_builds():
+    assert create_pipeline().outputs() == {"predicciones_scoring"}
+
+
+def test_puntuar_por_lotes_coincide_con_un_solo_lote(tmp_path):
+    df = _encuestados()
+    preprocesador, regresor, clasificador = _modelos(df)
+    nuevos = df.drop(columns=[PARAMS["target_col"]])
+    nuevos.to_csv(tmp_path / "nuevos.csv", index=False)
+
+    lotes = ChunkedTableDataset(filepath=str(tmp_path / "nuevos.csv"), filas_por_lote=7).load()
+    particiones = list(puntuar_por_lotes(lotes, preprocesador, regresor, clasificador, {"id_col": "ResponseId"}))
+
+    assert len(particiones) == 5
+    por_lotes = pd.concat([pred for particion in particiones for pred in particion.values()])
+    completo = puntuar_lote(nuevos, preprocesador, regresor, clasificador, {"id_col": "ResponseId"})
+    pd.testing.assert_frame_equal(por_lotes, completo)
+    assert (completo["salario_alto"] == clasificador.predict(preprocesador.transform(nuevos))).all()
+
+
+def test_puntuar_por_lotes_vacia_las_particiones_anteriores(tmp_path):
+    df = _encuestados(10)
+    preprocesador, regresor, clasificador = _modelos(df)
+    salida = tmp_path / "predicciones_scoring"
+    salida.mkdir()
+    for numero in range(3):
+        (salida / f"lote_{numero:05d}.parquet").write_bytes(b"")
+    (salida / "notas.txt").write_text("no es una partición")
+
+    params = {"id_col": "ResponseId", "directorio_salida": str(salida)}
+    lotes = iter([df.drop(columns=[PARAMS["target_col"]])])
+    assert len(list(puntuar_por_lotes(lotes, preprocesador, regresor, clasificador, params))) == 1
+    assert sorted(p.name for p in salida.iterdir()) == ["notas.txt"]
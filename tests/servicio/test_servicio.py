@@ -0,0 +1,129 @@
+"""Tests para el servicio de predicción con micro-lotes."""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+
+from ml_analisis_ecosistema_dev.benchmarks.tiempo_importacion import DIRECTORIO_PAQUETE
+from ml_analisis_ecosistema_dev.servicio import AgrupadorMicrolotes, ServicioPrediccion
+
+
+def test_agrupador_combina_peticiones_concurrentes():
+    tamanos = []
+
+    def duplicar(filas):
+        tamanos.append(len(filas))
+        return [{"doble": fila["x"] * 2} for fila in filas]
+
+    async def escenario():
+        agrupador = AgrupadorMicrolotes(duplicar, max_lote=8, max_espera_ms=50)
+        await agrupador.iniciar()
+        resultados = await asyncio.gather(*(agrupador.enviar({"x": i}) for i in range(20)))
+        await agrupador.detener()
+        return resultados
+
+    resultados = asyncio.run(escenario())
+
+    assert [r["doble"] for r in resultados] == [2 * i for i in range(20)]
+    assert max(tamanos) == 8
+    assert len(tamanos) < 20
+
+
+def test_agrupador_propaga_errores():
+    def fallar(filas):
+        raise ValueError("modelo no disponible")
+
+    async def escenario():
+        agrupador = AgrupadorMicrolotes(fallar, max_espera_ms=1)
+        await agrupador.iniciar()
+        try:
+            await agrupador.enviar({"x": 1})
+        finally:
+            await agrupador.detener()
+
+    try:
+        asyncio.run(escenario())
+    except ValueError as exc:
+        assert "modelo no disponible" in str(exc)
+    else:
+        raise AssertionError("Se esperaba ValueError")
+
+
+def test_agrupador_aisla_la_fila_que_falla():
+    tamanos = []
+
+    def invertir(filas):
+        tamanos.append(len(filas))
+        return [{"inverso": 1 / fila["x"]} for fila in filas]
+
+    async def escenario():
+        agrupador = AgrupadorMicrolotes(invertir, max_lote=8, max_espera_ms=50)
+        await agrupador.iniciar()
+        resultados = await asyncio.gather(*(agrupador.enviar({"x": x}) for x in (1, 0, 4)), return_exceptions=True)
+        await agrupador.detener()
+        return resultados
+
+    resultados = asyncio.run(escenario())
+
+    assert resultados[0] == {"inverso": 1.0} and resultados[2] == {"inverso": 0.25}
+    assert isinstance(resultados[1], ZeroDivisionError)
+    # Un lote de tres que falla y tres reintentos de una fila
+    assert tamanos == [3, 1, 1, 1]
+
+
+class _ServicioFalso(ServicioPrediccion):
+    def predecir_lote(self, filas):
+        return [{"salario_predicho": float(fila["WorkExp"]) * 1000} for fila in filas]
+
+
+def _peticion(app, metodo, ruta, cuerpo=b""):
+    mensajes = []
+
+    async def receive():
+        return {"type": "http.request", "body": cuerpo, "more_body": False}
+
+    async def send(mensaje):
+        mensajes.append(mensaje)
+
+    async def escenario():
+        await app.agrupador.iniciar()
+        await app({"type": "http", "method": metodo, "path": ruta}, receive, send)
+        await app.agrupador.detener()
+
+    asyncio.run(escenario())
+    return mensajes[0]["status"], json.loads(mensajes[1]["body"])
+
+
+def test_app_predict_una_fila_y_lista():
+    app = _ServicioFalso(artefactos={}, max_espera_ms=1)
+
+    assert _peticion(app, "POST", "/predict", b'{"WorkExp": 3}') == (200, {"salario_predicho": 3000.0})
+    estado, cuerpo = _peticion(app, "POST", "/predict", b'[{"WorkExp": 1}, {"WorkExp": 2}]')
+    assert estado == 200 and len(cuerpo) == 2
+    assert _peticion(app, "GET", "/otra")[0] == 404
+    assert _peticion(app, "POST", "/predict", b"{no es json")[0] == 400
+
+
+def test_app_rechaza_cuerpos_que_no_son_encuestados():
+    app = _ServicioFalso(artefactos={}, max_espera_ms=1)
+
+    for cuerpo in (b"7", b'"texto"', b"[]", b'[{"WorkExp": 1}, 7]'):
+        assert _peticion(app, "POST", "/predict", cuerpo)[0] == 400
+
+
+def test_app_no_expone_el_detalle_de_los_errores():
+    app = _ServicioFalso(artefactos={}, max_espera_ms=1)
+
+    estado, cuerpo = _peticion(app, "POST", "/predict", b'{"Otra": 1}')
+    assert estado == 500 and "WorkExp" not in cuerpo["error"]
+
+
+def test_importar_el_servicio_no_arrastra_kedro():
+    # Intérprete nuevo: el proceso de pytest ya tiene Kedro importado
+    codigo = "import sys, ml_analisis_ecosistema_dev.servicio.app; print(sorted({'kedro', 'sklearn'} & set(sys.modules)))"
+    entorno = {**os.environ, "PYTHONPATH": os.pathsep.join([str(DIRECTORIO_PAQUETE), os.environ.get("PYTHONPATH", "")])}
+    salida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, env=entorno, check=True)
+
+    assert salida.stdout.strip().splitlines()[-1] == "[]"
@@ -0,0 +1,84 @@
+"""Tests para los hooks de perfil de rendimiento."""
+
+import json
+import time
+
+import numpy as np
+import pandas as pd
+from kedro.framework.hooks.manager import _create_hook_manager
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline import node, pipeline
+from kedro.runner import SequentialRunner
+
+from ml_analisis_ecosistema_dev.hooks import PerfilRendimientoHooks, tamano_datos
+
+
+def _duplicar(df: pd.DataFrame) -> pd.DataFrame:
+    return pd.concat([df, df])
+
+
+def _sumar(df: pd.DataFrame) -> np.ndarray:
+    return df.sum().to_numpy()
+
+
+def test_informe_de_rendimiento_por_nodo(tmp_path):
+    hooks = PerfilRendimientoHooks(directorio=tmp_path)
+    hooks._perfilar = {"sumar"}
+    hook_manager = _create_hook_manager()
+    hook_manager.register(hooks)
+
+    catalog = DataCatalog(
+        {
+            "entrada": MemoryDataset(pd.DataFrame({"a": range(10), "b": np.ones(10)})),
+            "duplicado": MemoryDataset(),
+            "suma": MemoryDataset(),
+        }
+    )
+    proyecto = pipeline(
+        [
+            node(_duplicar, "entrada", "duplicado", name="duplicar"),
+            node(_sumar, "duplicado", "suma", name="sumar"),
+        ]
+    )
+    hooks.before_pipeline_run(run_params={})
+    SequentialRunner().run(proyecto, catalog, hook_manager)
+    hooks.after_pipeline_run(run_params={"session_id": "prueba", "pipeline_name": "prueba"})
+
+    informe = json.loads((tmp_path / "rendimiento_nodos.json").read_text())
+    nodos = {registro["nodo"]: registro for registro in informe["nodos"]}
+    assert set(nodos) == {"duplicar", "sumar"}
+    assert nodos["duplicar"]["filas_entrada"] == 10 and nodos["duplicar"]["filas_salida"] == 20
+    assert nodos["sumar"]["salidas"]["suma"]["columnas"] == 1
+    assert all(registro["tiempo_pared_s"] >= 0 for registro in informe["nodos"])
+    assert {(d["dataset"], d["operacion"]) for d in informe["datasets"]} >= {
+        ("entrada", "carga"),
+        ("duplicado", "guardado"),
+    }
+    assert (tmp_path / "perfiles" / "sumar.prof").exists()
+    assert len(pd.read_parquet(tmp_path / "rendimiento_nodos.parquet")) == 2
+
+
+def _trocear(df: pd.DataFrame):
+    for inicio in range(0, len(df), 4):
+        time.sleep(0.01)
+        yield df.iloc[inicio : inicio + 4]
+
+
+def test_nodo_generador_se_mide_hasta_agotar_sus_fragmentos(tmp_path):
+    hooks = PerfilRendimientoHooks(directorio=tmp_path)
+    hook_manager = _create_hook_manager()
+    hook_manager.register(hooks)
+    catalog = DataCatalog({"entrada": MemoryDataset(pd.DataFrame({"a": range(10)})), "trozos": MemoryDataset()})
+
+    hooks.before_pipeline_run(run_params={})
+    SequentialRunner().run(pipeline([node(_trocear, "entrada", "trozos", name="trocear")]), catalog, hook_manager)
+    [registro] = hooks.informe()["nodos"]
+
+    # Tres fragmentos con 10 ms de espera cada uno, que Kedro consume tras `after_node_run`
+    assert registro["generador"] and registro["tiempo_pared_s"] >= 0.03
+    assert registro["filas_salida"] == 10 and registro["salidas"]["trozos"]["columnas"] == 1
+
+
+def test_tamano_de_objetos_sin_filas():
+    assert tamano_datos({"alpha": 1.0}) is None
+    assert tamano_datos(np.zeros((3, 4)))["bytes"] == 96
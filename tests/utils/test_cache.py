@@ -0,0 +1,53 @@
+"""Tests para el bloqueo y la poda de las cachés en disco de `utils.cache`."""
+
+import fcntl
+import os
+import threading
+import time
+
+from ml_analisis_ecosistema_dev.utils.cache import PLAZO_BLOQUEOS_S, bloqueo, podar_cache
+
+
+def _bloqueado(ruta) -> bool:
+    with open(ruta, "a") as fichero:
+        try:
+            fcntl.flock(fichero, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            return True
+        return False
+
+
+def test_bloqueo_sobre_un_fichero_borrado_se_vuelve_a_pedir(tmp_path):
+    ruta = tmp_path / "clave.lock"
+    dentro, salir, observado = threading.Event(), threading.Event(), []
+
+    def esperar_y_entrar():
+        with bloqueo(ruta):
+            observado.append(_bloqueado(ruta))
+            dentro.set()
+            salir.wait(5)
+
+    with bloqueo(ruta):
+        hilo = threading.Thread(target=esperar_y_entrar)
+        hilo.start()
+        time.sleep(0.1)  # El hilo ya tiene abierto el fichero y espera el bloqueo
+        ruta.unlink()  # Como `podar_cache` mientras otro proceso espera
+    assert dentro.wait(5)
+    # El hilo tiene el bloqueo del fichero vigente, no el del huérfano
+    assert observado == [True]
+    salir.set()
+    hilo.join()
+
+
+def test_poda_conserva_los_bloqueos_recientes(tmp_path):
+    for clave in ("a", "b", "c"):
+        (tmp_path / f"{clave}.bin").touch()
+        (tmp_path / f"{clave}.lock").touch()
+        time.sleep(0.02)
+    antiguo = time.time() - PLAZO_BLOQUEOS_S - 1
+    os.utime(tmp_path / "a.lock", (antiguo, antiguo))
+    (tmp_path / "huerfana.lock").touch()
+    os.utime(tmp_path / "huerfana.lock", (antiguo, antiguo))
+
+    assert sorted(podar_cache(tmp_path, max_entradas=1)) == ["a", "b"]
+    assert sorted(ruta.name for ruta in tmp_path.iterdir()) == ["b.lock", "c.bin", "c.lock"]
@@ -0,0 +1,78 @@
+"""Tests para `utils.camino_regularizacion`."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from imblearn.over_sampling import SMOTE
+from imblearn.pipeline import Pipeline as ImbPipeline
+from scipy import sparse
+from sklearn.linear_model import Lasso, LogisticRegression, Ridge
+from sklearn.model_selection import GridSearchCV, KFold, StratifiedKFold
+
+from ml_analisis_ecosistema_dev.utils.busqueda import crear_busqueda
+from ml_analisis_ecosistema_dev.utils.camino_regularizacion import BusquedaCaminoRegularizacion
+
+ALPHAS = list(np.logspace(-3, 2, 12))
+
+
+def _datos(n: int = 200, p: int = 8):
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(n, p)), columns=[f"x{i}" for i in range(p)])
+    y = pd.Series(X.to_numpy() @ rng.normal(size=p) + rng.normal(0, 0.5, n))
+    return X, y
+
+
+@pytest.mark.parametrize("disperso", [False, True])
+def test_ridge_cerrado_coincide_con_grid_search(disperso):
+    X, y = _datos()
+    if disperso:
+        X = sparse.csr_matrix(X.to_numpy())
+    cv = KFold(4, shuffle=True, random_state=0)
+    camino = BusquedaCaminoRegularizacion(Ridge(), "alpha", ALPHAS, cv, "neg_root_mean_squared_error").fit(X, y)
+    grid = GridSearchCV(Ridge(), {"alpha": ALPHAS}, cv=cv, scoring="neg_root_mean_squared_error").fit(X, y)
+
+    # El Ridge disperso de sklearn usa un solver iterativo (tol=1e-4); el camino es exacto
+    np.testing.assert_allclose(camino.cv_results_["mean_test_score"], grid.cv_results_["mean_test_score"], rtol=1e-4)
+    assert camino.best_params_ == grid.best_params_
+
+
+@pytest.mark.parametrize("disperso", [False, True])
+def test_lasso_path_coincide_con_grid_search(disperso):
+    X, y = _datos()
+    if disperso:
+        X = sparse.csr_matrix(X.to_numpy())
+    cv = KFold(4, shuffle=True, random_state=0)
+    camino = BusquedaCaminoRegularizacion(Lasso(), "alpha", ALPHAS, cv, "r2").fit(X, y)
+    grid = GridSearchCV(Lasso(), {"alpha": ALPHAS}, cv=cv, scoring="r2").fit(X, y)
+
+    np.testing.assert_allclose(camino.cv_results_["mean_test_score"], grid.cv_results_["mean_test_score"], atol=1e-4)
+    assert not camino.best_estimator_.warm_start
+
+
+def test_crear_busqueda_usa_el_camino_con_smote():
+    X, y = _datos()
+    y = (y > y.median()).astype(int)
+    pipeline = ImbPipeline([("smote", SMOTE(random_state=0)), ("model", LogisticRegression(max_iter=1000))])
+    busqueda = crear_busqueda(
+        pipeline,
+        {"model__C": [0.01, 0.1, 1.0, 10.0]},
+        cv=StratifiedKFold(3, shuffle=True, random_state=0),
+        scoring="f1",
+        configuracion={"strategy": "grid"},
+        prefijo="model__",
+    )
+    assert isinstance(busqueda, BusquedaCaminoRegularizacion)
+    busqueda.fit(X, y)
+    assert busqueda.best_params_["model__C"] in (0.01, 0.1, 1.0, 10.0)
+    assert busqueda.best_estimator_.predict(X).shape == (len(X),)
+
+    # Con otros hiperparámetros en la grilla se mantiene la búsqueda exhaustiva
+    grid = crear_busqueda(
+        pipeline,
+        {"model__C": [1.0], "model__fit_intercept": [True, False]},
+        cv=3,
+        scoring="f1",
+        configuracion={"strategy": "grid"},
+        prefijo="model__",
+    )
+    assert isinstance(grid, GridSearchCV)
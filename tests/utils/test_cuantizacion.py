@@ -0,0 +1,62 @@
+"""Tests para los conjuntos cuantizados de `utils.cuantizacion`."""
+
+import time
+
+import numpy as np
+import pandas as pd
+from lightgbm import LGBMClassifier
+from sklearn.base import clone
+from xgboost import XGBRegressor
+
+from ml_analisis_ecosistema_dev.utils import cuantizacion
+from ml_analisis_ecosistema_dev.utils.cuantizacion import LGBMClassifierCuantizado, XGBRegressorCuantizado
+from ml_analisis_ecosistema_dev.utils.parada_temprana import ParadaTemprana
+
+
+def _datos():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.random((600, 6)), columns=[f"f{i}" for i in range(6)])
+    y = 3 * X["f0"] + rng.normal(0, 0.2, len(X))
+    return X, y
+
+
+def test_xgboost_reutiliza_el_quantile_dmatrix_del_fold():
+    X, y = _datos()
+    cuantizacion._conjuntos_xgboost.clear()
+    for profundidad in (2, 4):
+        original = XGBRegressor(n_estimators=20, max_depth=profundidad).fit(X, y).predict(X)
+        cuantizado = XGBRegressorCuantizado(n_estimators=20, max_depth=profundidad).fit(X, y).predict(X)
+        np.testing.assert_array_equal(cuantizado, original)
+    assert len(cuantizacion._conjuntos_xgboost) == 1
+
+
+def test_lightgbm_guarda_y_reutiliza_el_dataset_discretizado(tmp_path):
+    X, y = _datos()
+    y = (y > y.median()).astype(int)
+    modelo = LGBMClassifierCuantizado(directorio_cache=str(tmp_path), n_estimators=20, verbose=-1)
+    assert clone(modelo).directorio_cache == str(tmp_path)
+
+    for hojas in (7, 15):
+        original = LGBMClassifier(n_estimators=20, num_leaves=hojas, verbose=-1).fit(X, y).predict_proba(X)
+        cuantizado = clone(modelo).set_params(num_leaves=hojas).fit(X, y).predict_proba(X)
+        np.testing.assert_allclose(cuantizado, original)
+    assert len(list(tmp_path.glob("*.bin"))) == 1
+
+    # Con parada temprana, el conjunto de validación usa los bins del de entrenamiento
+    envuelto = ParadaTemprana(clone(modelo).set_params(n_estimators=300), paciencia=5, random_state=0).fit(X, y)
+    referencia = ParadaTemprana(LGBMClassifier(n_estimators=300, verbose=-1), paciencia=5, random_state=0).fit(X, y)
+    assert envuelto.n_rondas_ == referencia.n_rondas_
+
+
+def test_cache_lightgbm_conserva_las_entradas_usadas_recientemente(tmp_path, monkeypatch):
+    from ml_analisis_ecosistema_dev.utils.cache import podar_cache
+
+    monkeypatch.setattr(cuantizacion, "podar_cache", lambda directorio: podar_cache(directorio, max_entradas=2))
+    X, y = _datos()
+    claves = {}
+    for n in (200, 300, 200, 400):  # El fold de 200 filas se vuelve a usar antes del de 400
+        time.sleep(0.02)  # Fechas de modificación distintas aunque el reloj del disco sea grueso
+        cuantizacion.conjunto_lightgbm(X.head(n), y.to_numpy()[:n], {"verbose": -1}, str(tmp_path))
+        claves.setdefault(n, max(tmp_path.glob("*.bin"), key=lambda ruta: ruta.stat().st_mtime).stem)
+
+    assert sorted(ruta.stem for ruta in tmp_path.glob("*.bin")) == sorted([claves[200], claves[400]])
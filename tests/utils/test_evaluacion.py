@@ -0,0 +1,141 @@
+"""Tests para la evaluación en el holdout de `utils.evaluacion`."""
+
+import numpy as np
+import pandas as pd
+from imblearn.pipeline import Pipeline as ImbPipeline
+from scipy import sparse
+from sklearn.linear_model import LinearRegression, LogisticRegression
+from sklearn.metrics import (
+    accuracy_score, confusion_matrix, f1_score, mean_absolute_error, mean_squared_error,
+    precision_score, r2_score, recall_score, roc_auc_score,
+)
+from sklearn.svm import SVC
+
+from ml_analisis_ecosistema_dev.pipelines.clasificacion.nodes import report_and_select_best_classifier
+from ml_analisis_ecosistema_dev.utils.evaluacion import (
+    intervalos_bootstrap, metricas_clasificacion, metricas_clasificacion_ponderadas, metricas_regresion,
+    metricas_regresion_ponderadas, pesos_bootstrap, predecir_modelos, predecir_por_bloques, umbral_en_probabilidad,
+)
+
+
+def test_metricas_de_clasificacion_coinciden_con_sklearn():
+    rng = np.random.default_rng(0)
+    y = rng.integers(0, 2, 1000)
+    # Probabilidades redondeadas para que haya empates en el ROC-AUC
+    proba = np.round(np.clip(0.3 * y + rng.random(1000) * 0.7, 0, 1), 2)
+    y_pred = (proba > 0.5).astype(int)
+
+    metricas = metricas_clasificacion(y, proba)
+
+    assert metricas["accuracy"] == accuracy_score(y, y_pred)
+    np.testing.assert_allclose(metricas["f1_score"], f1_score(y, y_pred))
+    np.testing.assert_allclose(metricas["precision"], precision_score(y, y_pred))
+    np.testing.assert_allclose(metricas["recall"], recall_score(y, y_pred))
+    np.testing.assert_allclose(metricas["roc_auc"], roc_auc_score(y, proba))
+    assert metricas["confusion_matrix"] == confusion_matrix(y, y_pred).tolist()
+
+
+def test_metricas_de_regresion_coinciden_con_sklearn():
+    rng = np.random.default_rng(1)
+    y = rng.normal(50_000, 10_000, 500).astype(np.float32)
+    y_pred = y + rng.normal(0, 5_000, 500)
+
+    metricas = metricas_regresion(y, y_pred)
+
+    np.testing.assert_allclose(metricas["rmse"], np.sqrt(mean_squared_error(y, y_pred)), rtol=1e-6)
+    np.testing.assert_allclose(metricas["mae"], mean_absolute_error(y, y_pred), rtol=1e-6)
+    np.testing.assert_allclose(metricas["r2"], r2_score(y, y_pred), rtol=1e-6)
+
+
+def test_prediccion_por_bloques_equivale_a_una_sola_pasada():
+    rng = np.random.default_rng(2)
+    X = pd.DataFrame(rng.random((1050, 4)))
+    y = X[0] * 3 + X[1]
+    modelos = {"lineal": LinearRegression().fit(X, y), "logistica": LogisticRegression().fit(X, y > y.median())}
+
+    np.testing.assert_allclose(
+        predecir_por_bloques(modelos["lineal"].predict, X, filas_por_bloque=100), modelos["lineal"].predict(X)
+    )
+    probabilidades = predecir_modelos(
+        {"logistica": modelos["logistica"]}, sparse.csr_matrix(X.values), metodo="predict_proba", filas_por_bloque=256
+    )
+    np.testing.assert_allclose(probabilidades["logistica"], modelos["logistica"].predict_proba(X.values)[:, 1])
+
+
+def test_report_clasificacion_deriva_las_etiquetas_de_predict_proba():
+    rng = np.random.default_rng(3)
+    X = pd.DataFrame(rng.random((400, 3)), columns=["a", "b", "c"])
+    y = pd.Series((X["a"] + rng.normal(0, 0.3, 400) > 0.5).astype(int))
+    modelos = {
+        f"C{c}_classifier": ImbPipeline([("model", LogisticRegression(C=c))]).fit(X, y) for c in (0.01, 1.0)
+    }
+
+    evaluacion = {"n_jobs": 2, "filas_por_bloque": 128, "bootstrap": {"remuestreos": 200, "semilla": 0}}
+    resultado = report_and_select_best_classifier(X, y, evaluacion=evaluacion, **modelos)
+
+    for nombre, modelo in modelos.items():
+        y_pred = modelo.predict(X)
+        assert resultado["classification_metrics_report"][nombre]["f1_score"] == f1_score(y, y_pred)
+        assert resultado["classification_confusion_matrices"][nombre] == confusion_matrix(y, y_pred).tolist()
+        intervalo = resultado["classification_metrics_report"][nombre]["intervalo_confianza"]
+        assert intervalo["remuestreos"] == 200
+        assert intervalo["f1_score"][0] <= f1_score(y, y_pred) <= intervalo["f1_score"][1]
+
+
+def test_metricas_ponderadas_equivalen_a_materializar_el_remuestreo():
+    rng = np.random.default_rng(4)
+    y = rng.integers(0, 2, 300)
+    proba = np.round(np.clip(0.4 * y + rng.random(300) * 0.6, 0, 1), 2)
+    y_reg = rng.normal(80_000, 30_000, 300)
+    pred_reg = y_reg + rng.normal(0, 20_000, 300)
+    # Lotes de 2 remuestreos: el último lote queda incompleto
+    lotes = list(pesos_bootstrap(300, remuestreos=5, semilla=0, elementos_por_lote=600))
+    assert [len(lote) for lote in lotes] == [2, 2, 1]
+
+    pesos = np.vstack(lotes)
+    clasificacion = metricas_clasificacion_ponderadas(pesos, y, proba)
+    regresion = metricas_regresion_ponderadas(pesos, y_reg, pred_reg)
+    for i, fila in enumerate(pesos):
+        indices = np.repeat(np.arange(300), fila.astype(int))
+        np.testing.assert_allclose(clasificacion["roc_auc"][i], roc_auc_score(y[indices], proba[indices]))
+        np.testing.assert_allclose(clasificacion["f1_score"][i], f1_score(y[indices], proba[indices] > 0.5))
+        np.testing.assert_allclose(regresion["r2"][i], r2_score(y_reg[indices], pred_reg[indices]))
+        np.testing.assert_allclose(
+            regresion["rmse"][i], np.sqrt(mean_squared_error(y_reg[indices], pred_reg[indices]))
+        )
+
+
+def test_intervalos_bootstrap_contienen_la_estimacion_puntual():
+    rng = np.random.default_rng(5)
+    y = rng.normal(0, 1, 500)
+    pred = y + rng.normal(0, 0.5, 500)
+
+    intervalo = intervalos_bootstrap(metricas_regresion_ponderadas, y, pred, remuestreos=1000, semilla=0)
+
+    puntual = metricas_regresion(y, pred)
+    for metrica in ("rmse", "mae", "r2"):
+        assert intervalo[metrica][0] < puntual[metrica] < intervalo[metrica][1]
+    assert intervalo == intervalos_bootstrap(metricas_regresion_ponderadas, y, pred, remuestreos=1000, semilla=0)
+
+
+def test_svc_toma_las_etiquetas_de_predict():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(300, 3)), columns=["a", "b", "c"])
+    # Clases desbalanceadas: la calibración de Platt discrepa de `predict` en varias filas
+    y = pd.Series((X["a"] + rng.normal(0, 0.5, 300) > 0.8).astype(int))
+    modelos = {
+        "SVC_classifier": ImbPipeline([("model", SVC(probability=True, random_state=0))]).fit(X, y),
+        "LogisticRegression_classifier": ImbPipeline([("model", LogisticRegression())]).fit(X, y),
+    }
+    assert not umbral_en_probabilidad(modelos["SVC_classifier"])
+    assert umbral_en_probabilidad(modelos["LogisticRegression_classifier"])
+    svc = modelos["SVC_classifier"]
+    assert (svc.predict(X) != (svc.predict_proba(X)[:, 1] > 0.5)).any()
+
+    evaluacion = {"bootstrap": {"remuestreos": 0}}
+    resultado = report_and_select_best_classifier(X, y, evaluacion=evaluacion, **modelos)
+
+    for nombre, modelo in modelos.items():
+        y_pred = modelo.predict(X)
+        assert resultado["classification_metrics_report"][nombre]["f1_score"] == f1_score(y, y_pred)
+        assert resultado["classification_confusion_matrices"][nombre] == confusion_matrix(y, y_pred).tolist()
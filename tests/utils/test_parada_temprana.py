@@ -0,0 +1,82 @@
+"""Tests para `utils.parada_temprana`."""
+
+import numpy as np
+import pandas as pd
+from imblearn.over_sampling import SMOTE
+from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+from sklearn.model_selection import GridSearchCV
+from xgboost import XGBRegressor
+
+from ml_analisis_ecosistema_dev.utils.parada_temprana import (
+    ParadaTemprana,
+    envolver_con_parada_temprana,
+    rondas_usadas,
+)
+
+
+def _datos(n: int = 300):
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.random((n, 4)), columns=["a", "b", "c", "d"])
+    y = 3 * X["a"] + rng.normal(0, 0.1, n)
+    return X, y
+
+
+def test_boosting_se_detiene_antes_del_maximo():
+    X, y = _datos()
+    modelo = ParadaTemprana(XGBRegressor(n_estimators=2000, learning_rate=0.3), paciencia=10, random_state=0).fit(X, y)
+
+    assert 0 < modelo.n_rondas_ < 2000
+    assert modelo.predict(X).shape == (len(X),)
+
+
+def test_bosque_recorta_a_los_arboles_de_la_mejor_validacion():
+    X, y = _datos()
+    modelo = ParadaTemprana(RandomForestRegressor(n_estimators=200, random_state=0), paciencia=25, paso_bosque=25)
+    modelo.fit(X, y)
+
+    assert modelo.n_rondas_ % 25 == 0
+    assert len(modelo.estimator_.estimators_) == modelo.n_rondas_ == modelo.estimator_.n_estimators
+
+
+class _SMOTEEspia(SMOTE):
+    filas = []
+
+    def fit_resample(self, X, y, **params):
+        _SMOTEEspia.filas.append(len(X))
+        return super().fit_resample(X, y, **params)
+
+
+def test_remuestreo_sin_filas_sinteticas_en_la_validacion():
+    X, y = _datos(400)
+    y = (y > y.quantile(0.85)).astype(int)
+    _SMOTEEspia.filas = []
+    modelo = ParadaTemprana(
+        RandomForestClassifier(n_estimators=100, random_state=0),
+        fraccion_validacion=0.25,
+        paso_bosque=25,
+        random_state=0,
+        scoring="f1",
+        remuestreo=_SMOTEEspia(random_state=0),
+    ).fit(X, y)
+
+    # Sólo se remuestrean las 300 filas de ajuste; las 100 de validación quedan fuera
+    assert _SMOTEEspia.filas == [300]
+    assert modelo.estimator_.bootstrap and not modelo.estimator_.oob_score
+    assert len(modelo.estimator_.estimators_) == modelo.n_rondas_
+
+
+def test_grilla_sin_n_estimators_y_redirigida():
+    envuelto, grilla = envolver_con_parada_temprana(
+        XGBRegressor(),
+        {"model__n_estimators": [100, 1000], "model__max_depth": [3, 5]},
+        {"paciencia": 5},
+        prefijo="model__",
+    )
+    assert grilla == {"model__estimator__max_depth": [3, 5]}
+    assert envuelto.estimator.n_estimators == 1000
+
+    X, y = _datos()
+    envuelto, grilla = envolver_con_parada_temprana(XGBRegressor(), {"n_estimators": [50, 500], "max_depth": [2, 3]}, {})
+    busqueda = GridSearchCV(envuelto, grilla, cv=3, scoring="r2").fit(X, y)
+    assert len(busqueda.cv_results_["params"]) == 2
+    assert rondas_usadas(busqueda.best_estimator_) <= 500
@@ -0,0 +1,35 @@
+"""Tests para el presupuesto de CPU de `utils.recursos`."""
+
+from sklearn.ensemble import RandomForestClassifier
+from imblearn.over_sampling import SMOTE
+from imblearn.pipeline import Pipeline as ImbPipeline
+
+from ml_analisis_ecosistema_dev.utils.recursos import asignar_nucleos, fijar_hilos_estimador
+
+
+def test_reparte_los_nucleos_entre_entrenamientos_y_cv(monkeypatch):
+    monkeypatch.delenv("ML_NUCLEOS", raising=False)
+    monkeypatch.delenv("ML_ENTRENAMIENTOS_CONCURRENTES", raising=False)
+    monkeypatch.delenv("ML_PRESUPUESTO_CPU", raising=False)
+
+    asignacion = asignar_nucleos({"nucleos": 16, "entrenamientos_concurrentes": 2}, tareas_cv=30)
+    assert (asignacion.nucleos_nodo, asignacion.n_jobs_cv, asignacion.hilos_estimador) == (8, 8, 1)
+
+    # Con pocos ajustes, los núcleos sobrantes pasan a los hilos del estimador
+    asignacion = asignar_nucleos({"nucleos": 16, "entrenamientos_concurrentes": 2}, tareas_cv=2)
+    assert (asignacion.n_jobs_cv, asignacion.hilos_estimador) == (2, 4)
+
+
+def test_variables_de_entorno_tienen_prioridad(monkeypatch):
+    monkeypatch.setenv("ML_NUCLEOS", "4")
+    monkeypatch.setenv("ML_ENTRENAMIENTOS_CONCURRENTES", "4")
+    assert asignar_nucleos({"nucleos": 64}, tareas_cv=10).nucleos_nodo == 1
+
+    monkeypatch.setenv("ML_PRESUPUESTO_CPU", "0")
+    assert asignar_nucleos({"nucleos": 64}, tareas_cv=10) is None
+
+
+def test_fija_hilos_del_modelo_dentro_del_pipeline():
+    pipeline = ImbPipeline([("smote", SMOTE()), ("model", RandomForestClassifier())])
+    fijar_hilos_estimador(pipeline, 3, prefijo="model__")
+    assert pipeline.named_steps["model"].n_jobs == 3